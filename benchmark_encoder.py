@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Encoder Benchmark Scripti
+Referans bir hikayeyi bu makinede farklı preset/crf/tune/thread kombinasyonlarıyla
+kodlar, hız (frame/s), bitrate ve kaliteyi (SSIM) ölçer; hedefi karşılayan en hızlı
+ayarı makine adına kaydeder (VIDEO_ENCODER_PROFILE = "auto" bu sonucu kullanır)
+"""
+
+import os
+import glob
+import shutil
+import argparse
+import tempfile
+
+from src.encoder_profiles import run_encoder_benchmark, save_host_profile
+from benchmark_zoom import make_scene_image
+
+
+def build_reference_scenes(work_dir: str, scene_count: int, seconds: float, images_dir: str = None):
+    """Referans hikaye sahnelerini hazırlar (görsel klasörü yoksa sentetik görseller)"""
+    if images_dir:
+        image_paths = sorted(glob.glob(os.path.join(images_dir, "*.png")))[:scene_count]
+    else:
+        image_paths = []
+        for i in range(scene_count):
+            path = os.path.join(work_dir, f"scene_{i + 1:03d}.png")
+            make_scene_image(i).save(path)
+            image_paths.append(path)
+
+    # Gerçek hikayelerdeki gibi zoom-in / zoom-out sahneleri dönüşümlü
+    return [
+        {
+            "image_path": path,
+            "audio_path": None,
+            "duration": seconds,
+            "start_scale": 1.0 if i % 2 == 0 else 1.3,
+            "end_scale": 1.3 if i % 2 == 0 else 1.0,
+        }
+        for i, path in enumerate(image_paths)
+    ]
+
+
+if __name__ == "__main__":
+    try:
+        from config.config import Config
+        default_ssim = Config.ENCODER_TARGET_SSIM
+        default_kbps = Config.ENCODER_MAX_KBPS
+    except:
+        default_ssim = 0.97
+        default_kbps = None
+
+    parser = argparse.ArgumentParser(description="Encoder ayarı benchmark ve otomatik seçim")
+    parser.add_argument("--scenes", type=int, default=4, help="Referans hikayedeki sahne sayısı")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Sahne süresi")
+    parser.add_argument("--images", default=None, help="Gerçek sahne görsellerinin klasörü (opsiyonel)")
+    parser.add_argument("--target-ssim", type=float, default=default_ssim, help="En düşük SSIM")
+    parser.add_argument("--max-kbps", type=float, default=default_kbps, help="En yüksek bitrate (kbps)")
+    parser.add_argument("--dry-run", action="store_true", help="Sonucu kaydetme")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        scenes = build_reference_scenes(work_dir, args.scenes, args.seconds, args.images)
+        if not scenes:
+            raise SystemExit("✗ Referans görsel bulunamadı")
+
+        benchmark = run_encoder_benchmark(scenes, work_dir, args.target_ssim, args.max_kbps)
+        profile = benchmark["profile"]
+        print(f"🏆 Seçilen ayar: preset={profile['preset']}, crf={profile['crf']}, "
+              f"tune={profile['tune'] or '-'}, threads={profile['threads'] or 'auto'}")
+
+        if not args.dry_run:
+            path = save_host_profile(profile, benchmark["results"])
+            print(f"💾 Makine profili kaydedildi: {path}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Durağan Sahne Benchmark Scripti
+Hareketsiz bir sahnenin her frame'ini kodlayan yol (görsel bir kez ölçeklenir, loop
+filtresi sabit frame hızında tekrarlar) ile durağan segment yolunu (iki frame'lik
+değişken frame hızlı segment) kodlama süresi ve dosya boyutu açısından karşılaştırır.
+İki yol da aynı ölçekleme ve x264 ayarlarını (tune stillimage) kullanır; fark sadece
+kodlanan frame sayısıdır.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+
+from src.ffmpeg_renderer import FFmpegRenderer, run_ffmpeg
+from benchmark_zoom import make_scene_image
+
+
+def encode_per_frame(renderer: FFmpegRenderer, image_path: str, frames: int, output_path: str):
+    """Frame başına yol: sabit frame hızında her frame kodlanır (tek filtergraph yolunun durağan sahnesi)"""
+    run_ffmpeg([
+        "-i", image_path,
+        "-filter_complex", f"[0:v]{renderer._still_filter(frames)}[v]",
+        "-map", "[v]", "-an",
+    ] + renderer.video_encoder_args() + ["-frames:v", str(frames), output_path])
+
+
+def measure(label: str, func, output_path: str):
+    """Süre ve dosya boyutunu ölçüp yazdırır"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    size_kb = os.path.getsize(output_path) / 1024
+    print(f"   {label:<34} {elapsed:7.2f} s   {size_kb:9.1f} KB")
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Durağan sahne kodlama benchmark")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Sahne süresi")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    image_path = os.path.join(work_dir, "scene.png")
+    make_scene_image(0).save(image_path)
+
+    renderer = FFmpegRenderer(temp_dir=work_dir, tune="stillimage")
+    frames = int(round(args.seconds * renderer.fps))
+    still_scene = {"image_path": image_path, "start_scale": 1.0, "end_scale": 1.0}
+
+    print(f"🧪 Durağan sahne benchmark: {args.seconds:.0f}s ({frames} frame, 1920x1080)")
+
+    per_frame_path = os.path.join(work_dir, "per_frame.mp4")
+    still_path = os.path.join(work_dir, "still.mp4")
+    old_time = measure("Frame başına (loop, sabit fps)",
+                       lambda: encode_per_frame(renderer, image_path, frames, per_frame_path),
+                       per_frame_path)
+    new_time = measure("Durağan (iki frame VFR)",
+                       lambda: renderer.render_scene_segment(still_scene, frames, still_path),
+                       still_path)
+
+    print(f"   ⚡ Hızlanma: {old_time / new_time:.1f}x")
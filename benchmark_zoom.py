@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zoom Benchmark Scripti
+Eski (frame başına PIL LANCZOS) ve yeni (ZoomEngine) Ken Burns çekirdeklerinin
+frame/saniye hızlarını 15 sahneli sentetik bir hikaye üzerinde karşılaştırır
+"""
+
+import time
+import argparse
+
+import numpy as np
+from PIL import Image
+
+from src.zoom_engine import ZoomEngine, CV2_AVAILABLE
+
+WIDTH, HEIGHT = 1920, 1080
+
+
+def make_scene_image(seed: int) -> Image.Image:
+    """Sahne görseli yerine geçen rastgele dokulu bir görsel üretir"""
+    rng = np.random.default_rng(seed)
+    small = rng.integers(0, 256, size=(HEIGHT // 8, WIDTH // 8, 3), dtype=np.uint8)
+    return Image.fromarray(small).resize((WIDTH, HEIGHT), Image.Resampling.BICUBIC)
+
+
+def legacy_zoom_frame(frame: np.ndarray, scale: float) -> np.ndarray:
+    """Eski _apply_zoom_effect içindeki frame başına dönüşüm (referans)"""
+    h, w = frame.shape[:2]
+    new_h, new_w = int(h * scale), int(w * scale)
+    img = Image.fromarray(frame)
+    img_resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    left = (new_w - w) // 2
+    top = (new_h - h) // 2
+    img_cropped = img_resized.crop((left, top, left + w, top + h))
+    return np.array(img_cropped)
+
+
+def bench_legacy(images, frames_per_scene: int, duration: float) -> float:
+    """Eski çekirdek: toplam frame / süre"""
+    total = 0
+    start = time.perf_counter()
+    for img in images:
+        frame = np.array(img)
+        for i in range(frames_per_scene):
+            t = duration * i / frames_per_scene
+            legacy_zoom_frame(frame, 1.0 + 0.3 * t / duration)
+            total += 1
+    return total / (time.perf_counter() - start)
+
+
+def bench_engine(images, frames_per_scene: int, duration: float) -> float:
+    """Yeni çekirdek: ön ölçekleme dahil toplam frame / süre"""
+    total = 0
+    start = time.perf_counter()
+    for img in images:
+        engine = ZoomEngine(img, size=(WIDTH, HEIGHT), start_scale=1.0,
+                            end_scale=1.3, duration=duration)
+        for i in range(frames_per_scene):
+            engine.get_frame(duration * i / frames_per_scene)
+            total += 1
+    return total / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ken Burns zoom benchmark")
+    parser.add_argument("--scenes", type=int, default=15, help="Sahne sayısı")
+    parser.add_argument("--frames", type=int, default=48,
+                        help="Sahne başına ölçülecek frame sayısı (24fps x 2s)")
+    args = parser.parse_args()
+
+    duration = args.frames / 24.0
+    images = [make_scene_image(i) for i in range(args.scenes)]
+
+    print(f"🧪 Zoom benchmark: {args.scenes} sahne x {args.frames} frame ({WIDTH}x{HEIGHT})")
+    print(f"   Yeni çekirdek arka ucu: {'OpenCV warpAffine' if CV2_AVAILABLE else 'PIL resize(box=...)'}")
+
+    legacy_fps = bench_legacy(images, args.frames, duration)
+    print(f"   Eski (PIL LANCZOS her frame): {legacy_fps:8.1f} frame/s")
+
+    engine_fps = bench_engine(images, args.frames, duration)
+    print(f"   Yeni (ZoomEngine):            {engine_fps:8.1f} frame/s")
+
+    print(f"   ⚡ Hızlanma: {engine_fps / legacy_fps:.1f}x")
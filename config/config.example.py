@@ -54,6 +54,13 @@ class Config:
     # OpenAI TTS-1 HD
     OPENAI_TTS_VOICE = "nova"  # alloy, echo, fable, onyx, nova, shimmer
     OPENAI_TTS_SPEED = 1.0     # 0.25 - 4.0
+    OPENAI_TTS_WORKERS = 4
+    OPENAI_TTS_RPM = 50
+    OPENAI_TTS_MAX_RETRIES = 3
+    OPENAI_TTS_MAX_CHARS = 4096
+    OPENAI_TTS_SENTENCE_GAP = 0.2     # Bölünmüş uzun sahnede parçalar arası sessizlik (saniye)
+    TTS_CACHE = True
+    TTS_CACHE_MAX_MB = 500
     
     # ====================================================================
     # KLASÖR YAPISI
@@ -65,10 +72,40 @@ class Config:
     IMAGES_DIR = os.path.join(BASE_DIR, "images")
     VIDEOS_DIR = os.path.join(BASE_DIR, "videos")
     MUSIC_DIR = os.path.join(BASE_DIR, "musics")
+    SEGMENT_CACHE_DIR = os.path.join(BASE_DIR, "cache", "segments")
+    CARD_CACHE_DIR = os.path.join(BASE_DIR, "cache", "cards")
+    MUSIC_CACHE_DIR = os.path.join(BASE_DIR, "cache", "music")
+    TTS_CACHE_DIR = os.path.join(BASE_DIR, "cache", "tts")
     
     # Video ayarları
     FPS = 24
     VIDEO_RESOLUTION = (1920, 1080)
+    VIDEO_RENDER_BACKEND = "moviepy"  # "moviepy", "ffmpeg", "parallel", "pipe"
+    VIDEO_RENDER_WORKERS = 0          # 0 = CPU sayısı
+    VIDEO_SEGMENT_CACHE = True
+    VIDEO_KEN_BURNS = True            # False = durağan sahneler
+    VIDEO_PIPE_PIX_FMT = "rgb24"      # "rgb24", "yuv420p"
+    VIDEO_PIPE_RING_SIZE = 4
+    VIDEO_MAX_OPEN_SCENES = 2         # 0 = sahne başına klip (tüm sahneler açık)
+    VIDEO_RENDITIONS = []             # ör. [{"name": "720p", "width": 1280, "height": 720}, {"name": "shorts", "width": 1080, "height": 1920}]
+    VIDEO_TRANSITION = None           # None, "crossfade", "dip"
+    VIDEO_TRANSITION_DURATION = 0.5
+    VIDEO_AUDIO_REBUILD_TOLERANCE = 0.25  # Yeni anlatım bu sapmaya sığarsa video yeniden kodlanmaz
+    VIDEO_TITLE_CARDS = True
+    TITLE_CARD_STYLE = "default"
+    TITLE_CARD_DURATION = 3
+    CREDITS_CARD_DURATION = 3
+    VIDEO_ENCODER_PROFILE = "standard"  # "draft", "standard", "archive", "auto"
+    ENCODER_TARGET_SSIM = 0.97
+    VIDEO_CRF_SEARCH = False          # True = hikaye başına CRF araması
+    ENCODER_MAX_KBPS = None
+    VIDEO_PROGRESSIVE_PREVIEW = False # True = sahne sahne büyüyen HLS önizlemesi
+    PREVIEW_WIDTH = 640
+    PREVIEW_HEIGHT = 360
+    DRAFT_MODE = False                # True = 480p, ultrafast, hareketsiz, placeholder görsel, hızlı TTS
+    DRAFT_WIDTH = 854
+    DRAFT_HEIGHT = 480
+    DRAFT_TTS_ENGINE = "pyttsx3"
     
     # Sahne süresi ayarları
     MIN_SCENE_DURATION = 3
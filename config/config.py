@@ -47,18 +47,61 @@ class Config:
     # OpenAI TTS-1 HD Ayarları
     OPENAI_TTS_VOICE = "nova"  # alloy, echo, fable, onyx, nova, shimmer
     OPENAI_TTS_SPEED = 1.0     # 0.25 - 4.0 arası (1.0 = normal)
+    OPENAI_TTS_WORKERS = 4     # Aynı anda seslendirilen sahne sayısı
+    OPENAI_TTS_RPM = 50        # Dakikadaki en fazla TTS isteği (hesap limitine göre ayarlayın)
+    OPENAI_TTS_MAX_RETRIES = 3  # Hata veren sahne kaç kez yeniden denenir (sadece o sahne)
+    OPENAI_TTS_MAX_CHARS = 4096  # İstek başına en uzun metin; uzun sahneler cümlelerden bölünüp paralel seslendirilir
+    OPENAI_TTS_SENTENCE_GAP = 0.2  # Bölünmüş sahnede parçalar arasına eklenen sessizlik (saniye)
+    TTS_CACHE = True           # Metni/sesi/hızı değişmeyen sahneler yeniden sentezlenmez (tüm TTS motorları)
+    TTS_CACHE_MAX_MB = 500     # Önbellek sınırı; aşılınca en uzun süredir kullanılmayan sesler silinir
     
     # Video Ayarları
     VIDEO_WIDTH = 1920
     VIDEO_HEIGHT = 1080
     VIDEO_FPS = 24
     VIDEO_DURATION_PER_SCENE = 5  # Her sahne için saniye
+    VIDEO_RENDER_BACKEND = "moviepy"  # "moviepy" (Python frame işleme), "ffmpeg" (tek filtergraph, daha hızlı), "parallel" (sahne başına paralel segment), "pipe" (Python frame'leri ham pipe ile)
+    VIDEO_RENDER_WORKERS = 0          # "parallel" modunda eşzamanlı ffmpeg süreci (0 = CPU sayısı)
+    VIDEO_SEGMENT_CACHE = True        # "parallel" modunda sadece değişen sahneleri yeniden kodla
+    VIDEO_KEN_BURNS = True            # False: zoom yok, sahneler durağan görüntü olarak kodlanır (çok daha hızlı)
+    VIDEO_PIPE_PIX_FMT = "rgb24"      # "pipe" modunda ffmpeg'e giden format ("yuv420p" = yarı bant genişliği, OpenCV gerekir)
+    VIDEO_PIPE_RING_SIZE = 4          # "pipe" modunda yeniden kullanılan frame tamponu sayısı (bellek sabit kalır)
+    VIDEO_MAX_OPEN_SCENES = 2         # Aynı anda açık sahne kaynağı (bellek sahne sayısından bağımsız; 0 = MoviePy'de eski sahne başına klip yolu)
+    # Ana videoya ek sürümler (tek kompozisyon geçişinden; ffmpeg/parallel backend'i ile)
+    # ör. [{"name": "720p", "width": 1280, "height": 720}, {"name": "shorts", "width": 1080, "height": 1920}]
+    VIDEO_RENDITIONS = []
+    VIDEO_TRANSITION = None           # Sahne geçişi: None (kesme), "crossfade", "dip" (siyaha geçiş) veya bir ffmpeg xfade adı
+    VIDEO_TRANSITION_DURATION = 0.5   # Geçiş süresi (saniye; sahne sınırına ortalanır)
+    VIDEO_AUDIO_REBUILD_TOLERANCE = 0.25  # Sadece ses değişince (yeni ses/dil): sahne süresi bu kadar (saniye) sapabilir, video yeniden kodlanmaz
+    VIDEO_TITLE_CARDS = True          # Başlık/bitiş kartları (Pillow ile çizilir, bir kez kodlanıp önbellekten eklenir)
+    TITLE_CARD_STYLE = "default"      # src/title_cards.py içindeki TITLE_CARD_STYLES
+    TITLE_CARD_DURATION = 3           # Başlık kartı süresi (saniye)
+    CREDITS_CARD_DURATION = 3         # Bitiş kartı süresi (saniye)
+    VIDEO_ENCODER_PROFILE = "standard"  # "draft" (hızlı önizleme), "standard", "archive" (yüksek kalite), "auto" (benchmark_encoder.py sonucu)
+    ENCODER_TARGET_SSIM = 0.97        # Benchmark ve CRF araması: kabul edilen en düşük kalite
+    VIDEO_CRF_SEARCH = False          # True: hikaye başına örnek sahnelerle hedef kaliteyi tutan en yüksek CRF aranır (daha küçük dosya)
+    ENCODER_MAX_KBPS = None           # Benchmark: kabul edilen en yüksek video bitrate'i (None = sınırsız)
+    VIDEO_PROGRESSIVE_PREVIEW = False # True: üretim sürerken sahne sahne büyüyen düşük çözünürlüklü HLS önizlemesi (videos/preview/)
+    PREVIEW_WIDTH = 640               # Aşamalı önizleme çözünürlüğü
+    PREVIEW_HEIGHT = 360
+    
+    # Taslak mod (hikaye/prompt ayarı için hızlı iterasyon): 480p, ultrafast, hareketsiz,
+    # önbellekteki veya placeholder görseller, en hızlı TTS. Kaydedilen taslak zaman çizelgesi
+    # menüdeki "Taslaktan final video" ile final ayarlarında render edilebilir.
+    DRAFT_MODE = False
+    DRAFT_WIDTH = 854
+    DRAFT_HEIGHT = 480
+    DRAFT_TTS_ENGINE = "pyttsx3"      # Offline ve en hızlısı (başlatılamazsa gTTS'ye geçilir)
     
     # Dosya yolları
     STORIES_DIR = "stories"
     AUDIO_DIR = "audio"
     IMAGES_DIR = "images"
     VIDEOS_DIR = "videos"
+    SEGMENT_CACHE_DIR = os.path.join("cache", "segments")  # cleanup_folders bu klasörü silmez
+    CARD_CACHE_DIR = os.path.join("cache", "cards")        # Kodlanmış başlık/bitiş kartları
+    MUSIC_CACHE_DIR = os.path.join("cache", "music")       # Çözülmüş, normalize edilmiş fon müzikleri (mmap)
+    TTS_CACHE_DIR = os.path.join("cache", "tts")           # Sentezlenmiş sahne sesleri (içerik adresli)
     
     # Görsel üretimi ayarları
     IMAGE_STYLE = "cinematic, storytelling, fairy tale illustration"
@@ -7,6 +7,7 @@ Hikayeleri otomatik olarak videoya dönüştürür ve YouTube'a yükler
 
 import os
 import sys
+import glob
 import shutil
 from colorama import init, Fore, Style
 from config.config import Config
@@ -14,6 +15,7 @@ from src.story_processor import StoryProcessor
 from src.tts_generator import TTSGenerator
 from src.openai_tts_generator import OpenAITTSGenerator
 from src.image_generator import ImageGenerator
+from src.progressive_preview import ProgressivePreview
 
 # Video creator - conditional import
 try:
@@ -50,9 +52,14 @@ def print_step(step_num, total_steps, description):
     """Adım numarasını yazdırır"""
     print(f"\n{Fore.YELLOW}[{step_num}/{total_steps}] {description}{Style.RESET_ALL}")
 
-def cleanup_folders():
-    """Video oluşturma öncesi klasörleri temizler"""
-    folders = ['audio', 'images', 'videos']
+def cleanup_folders(folders=None):
+    """
+    Video oluşturma öncesi klasörleri temizler
+    
+    Not: cache/ klasörü (segment önbelleği) silinmez; değişmeyen sahneler
+    sonraki çalıştırmada yeniden kodlanmaz.
+    """
+    folders = folders or ['audio', 'images', 'videos']
     print(f"\n{Fore.CYAN}🗑️  Klasörler temizleniyor...{Style.RESET_ALL}")
     
     for folder in folders:
@@ -78,13 +85,62 @@ def cleanup_folders():
 
     print("─" * 60)
 
-def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=False):
-    """Ana video oluşturma fonksiyonu"""
+def create_tts_generator(draft=False):
+    """
+    Config'e göre TTS motorunu oluşturur
+    
+    draft: Taslak modda API'ye gitmeden en hızlı motor (Config.DRAFT_TTS_ENGINE) kullanılır
+    """
+    if draft:
+        return TTSGenerator(
+            engine=getattr(Config, 'DRAFT_TTS_ENGINE', "pyttsx3"),
+            language=Config.TTS_LANGUAGE,
+            speed=Config.TTS_SPEED
+        )
+    
+    if Config.TTS_ENGINE == "openai":
+        # OpenAI TTS-1 HD kullan
+        if not Config.OPENAI_API_KEY:
+            print(f"{Fore.RED}✗ OPENAI_API_KEY bulunamadı! .env dosyasını kontrol edin.{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}🔄 Yedek TTS (gtts) kullanılıyor...{Style.RESET_ALL}")
+            return TTSGenerator(
+                engine="gtts",
+                language=Config.TTS_LANGUAGE,
+                speed=Config.TTS_SPEED
+            )
+        else:
+            return OpenAITTSGenerator(
+                api_key=Config.OPENAI_API_KEY,
+                voice=Config.OPENAI_TTS_VOICE,
+                language=Config.TTS_LANGUAGE,
+                speed=Config.OPENAI_TTS_SPEED
+            )
+    else:
+        # Klasik TTS (gtts veya pyttsx3) kullan
+        return TTSGenerator(
+            engine=Config.TTS_ENGINE,
+            language=Config.TTS_LANGUAGE,
+            speed=Config.TTS_SPEED
+        )
+
+def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=False, draft=None):
+    """
+    Ana video oluşturma fonksiyonu
+    
+    draft: Taslak mod (480p, ultrafast, hareketsiz, önbellekteki/placeholder görseller,
+           en hızlı TTS; verilmezse Config.DRAFT_MODE). Kaydedilen taslak zaman çizelgesi
+           render_final_from_draft ile final ayarlarında render edilir.
+    """
+    if draft is None:
+        draft = getattr(Config, 'DRAFT_MODE', False)
     
     print_banner()
     
-    # Klasörleri temizle (her çalıştırmada yeni başla)
-    cleanup_folders()
+    # Klasörleri temizle (her çalıştırmada yeni başla); taslakta images/ korunur,
+    # önceki çalıştırmanın görselleri yeniden kullanılır
+    cleanup_folders(['audio', 'videos'] if draft else None)
+    if draft:
+        print(f"{Fore.CYAN}⚡ Taslak mod: 480p, ultrafast, hareketsiz, placeholder görseller, hızlı TTS{Style.RESET_ALL}")
     
     try:
         # 1. Hikaye işleme
@@ -101,36 +157,31 @@ def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=Fals
         print(f"✓ Hikaye: {Fore.GREEN}{story_title}{Style.RESET_ALL}")
         print(f"✓ {len(scenes)} sahne oluşturuldu")
         
+        # Aşamalı önizleme: sesi ve görseli hazır olan sahneler hemen izlenebilir
+        preview = None
+        if not draft and getattr(Config, 'VIDEO_PROGRESSIVE_PREVIEW', False):
+            try:
+                preview = ProgressivePreview(
+                    os.path.join(Config.VIDEOS_DIR, "preview"),
+                    "preview",
+                    len(scenes),
+                    width=getattr(Config, 'PREVIEW_WIDTH', 640),
+                    height=getattr(Config, 'PREVIEW_HEIGHT', 360),
+                    fps=Config.VIDEO_FPS
+                )
+                print(f"👀 Aşamalı önizleme: {Fore.GREEN}{preview.playlist_path}{Style.RESET_ALL}")
+            except Exception as e:
+                print(f"⚠ Aşamalı önizleme başlatılamadı: {e}")
+        
         # 2. Ses dosyaları oluşturma
         print_step(2, 6, "🎤 Ses dosyaları oluşturuluyor (TTS)")
         
-        # TTS Engine seçimi
-        if Config.TTS_ENGINE == "openai":
-            # OpenAI TTS-1 HD kullan
-            if not Config.OPENAI_API_KEY:
-                print(f"{Fore.RED}✗ OPENAI_API_KEY bulunamadı! .env dosyasını kontrol edin.{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}🔄 Yedek TTS (gtts) kullanılıyor...{Style.RESET_ALL}")
-                tts_generator = TTSGenerator(
-                    engine="gtts",
-                    language=Config.TTS_LANGUAGE,
-                    speed=Config.TTS_SPEED
-                )
-            else:
-                tts_generator = OpenAITTSGenerator(
-                    api_key=Config.OPENAI_API_KEY,
-                    voice=Config.OPENAI_TTS_VOICE,
-                    language=Config.TTS_LANGUAGE,
-                    speed=Config.OPENAI_TTS_SPEED
-                )
-        else:
-            # Klasik TTS (gtts veya pyttsx3) kullan
-            tts_generator = TTSGenerator(
-                engine=Config.TTS_ENGINE,
-                language=Config.TTS_LANGUAGE,
-                speed=Config.TTS_SPEED
-            )
+        tts_generator = create_tts_generator(draft)
         
-        audio_files = tts_generator.generate_story_audio(scenes, story_title)
+        audio_files = tts_generator.generate_story_audio(
+            scenes, story_title,
+            on_scene_ready=preview.add_audio if preview else None
+        )
         print(f"✓ {len(audio_files)} ses dosyası oluşturuldu")
         
         # 3. Görsel oluşturma
@@ -158,24 +209,35 @@ def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=Fals
         # Karakter yöneticisini image generator'a bağla
         image_generator.character_manager = char_manager
         
-        # API'leri test et
-        print("🔍 Resim API'leri test ediliyor...")
-        api_results = image_generator.test_all_apis()
-        
-        working_apis = [api for api, status in api_results.items() if status]
-        if working_apis:
-            print(f"✓ Çalışan API'ler: {', '.join(working_apis)}")
+        if draft:
+            # Taslak: API çağrısı yok (mevcut görsel veya placeholder)
+            image_generator.use_draft_images()
         else:
-            print("⚠ Hiçbir ücretli API çalışmıyor, ücretsiz seçenekler kullanılacak")
+            # API'leri test et
+            print("🔍 Resim API'leri test ediliyor...")
+            api_results = image_generator.test_all_apis()
+            
+            working_apis = [api for api, status in api_results.items() if status]
+            if working_apis:
+                print(f"✓ Çalışan API'ler: {', '.join(working_apis)}")
+            else:
+                print("⚠ Hiçbir ücretli API çalışmıyor, ücretsiz seçenekler kullanılacak")
         
-        image_files = image_generator.generate_story_images(scenes, story_title)
+        image_files = image_generator.generate_story_images(
+            scenes, story_title,
+            on_scene_ready=preview.add_image if preview else None
+        )
         print(f"✓ {len(image_files)} görsel oluşturuldu")
         
+        if preview:
+            # Kalan önizleme segmentleri render başlamadan tamamlanır (CPU'yu paylaşmasınlar)
+            print(f"👀 Önizleme hazır: {preview.close()}")
+        
         # 4. Video oluşturma (MoviePy gerekli)
         if VIDEO_CREATOR_AVAILABLE:
             print_step(4, 6, "🎬 Video birleştiriliyor")
             
-            video_creator = VideoCreator(Config.VIDEOS_DIR)
+            video_creator = VideoCreator(Config.VIDEOS_DIR, draft=draft)
             video_path = video_creator.create_story_video(
                 scenes=scenes,
                 image_files=image_files,
@@ -193,11 +255,14 @@ def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=Fals
             # 5. Önizleme oluşturma
             print_step(5, 6, "👀 Önizleme oluşturuluyor")
             
-            try:
-                preview_path = video_creator.create_preview_video(video_path, duration=30)
-                print(f"✓ Önizleme: {preview_path}")
-            except Exception as e:
-                print(f"⚠ Önizleme oluşturulamadı: {e}")
+            if draft:
+                print("⏭ Taslak modda atlandı")
+            else:
+                try:
+                    preview_path = video_creator.create_preview_video(video_path, duration=30)
+                    print(f"✓ Önizleme: {preview_path}")
+                except Exception as e:
+                    print(f"⚠ Önizleme oluşturulamadı: {e}")
             
             final_step = 6
             
@@ -225,6 +290,8 @@ def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=Fals
         if video_path:
             print(f"📁 Video dosyası: {video_path}")
             print(f"🔗 Yerel önizleme için video player ile açabilirsiniz")
+            if draft:
+                print(f"⬆️  Final video için menüden 'Taslaktan final video' seçin (sahneler ve zaman çizelgesi korunur)")
         else:
             print(f"📁 Ses dosyaları: audio/ klasöründe")
             print(f"� Görsel dosyaları: images/ klasöründe")
@@ -239,6 +306,78 @@ def create_story_video(story_filename="kibritci_kiz.txt", upload_to_youtube=Fals
         print(f"\n{Fore.RED}❌ Hata oluştu: {e}{Style.RESET_ALL}")
         return None
 
+def render_final_from_draft(timeline_path=None):
+    """
+    Kaydedilmiş taslak zaman çizelgesinden final video üretir
+    
+    Hikaye yeniden işlenmez: sahne metinleri, görsel promptları, zoom tohumları ve fon
+    müziği taslaktan alınır; sesler Config TTS'i ile, görseller API'lerle yeniden üretilir
+    ve zaman çizelgesi final ayarlarına taşınıp render edilir.
+    
+    Args:
+        timeline_path: Taslak .timeline.json yolu (verilmezse videos/ içindeki en yeni taslak)
+    """
+    print_banner()
+    
+    if not VIDEO_CREATOR_AVAILABLE:
+        print(f"{Fore.RED}✗ VideoCreator kullanılamıyor (MoviePy kurulu değil){Style.RESET_ALL}")
+        return None
+    
+    try:
+        from src.timeline import Timeline
+        from src.multi_image_generator import MultiImageGenerator
+        
+        if timeline_path is None:
+            drafts = glob.glob(os.path.join(Config.VIDEOS_DIR, '*_draft.timeline.json'))
+            if not drafts:
+                print(f"{Fore.RED}✗ Taslak zaman çizelgesi bulunamadı (önce taslak video oluşturun){Style.RESET_ALL}")
+                return None
+            timeline_path = max(drafts, key=os.path.getmtime)
+        
+        draft_timeline = Timeline.load(timeline_path)
+        story_title = draft_timeline.title
+        scenes = []
+        for i, scene in enumerate(draft_timeline.scenes, 1):
+            if not scene.get('text') or not scene.get('image_prompt'):
+                raise ValueError(f"Taslakta sahne {i} metni/görsel promptu yok, final üretilemez")
+            scenes.append(dict(
+                {key: scene[key] for key in ('text', 'image_prompt', 'characters') if key in scene},
+                scene_number=i
+            ))
+        print(f"✓ Taslak: {Fore.GREEN}{story_title}{Style.RESET_ALL} ({len(scenes)} sahne) ← {timeline_path}")
+        
+        print_step(1, 3, "🎤 Final ses dosyaları oluşturuluyor (TTS)")
+        tts_generator = create_tts_generator()
+        audio_files = tts_generator.generate_story_audio(scenes, story_title)
+        
+        print_step(2, 3, "🎨 Final görseller oluşturuluyor")
+        image_generator = MultiImageGenerator(
+            hf_token=Config.HUGGINGFACE_API_KEY,
+            replicate_token=Config.REPLICATE_API_KEY,
+            use_free_alternative=Config.USE_FREE_IMAGES_ONLY
+        )
+        image_files = image_generator.generate_story_images(scenes, story_title)
+        
+        print_step(3, 3, "🎬 Final video render ediliyor")
+        video_creator = VideoCreator(Config.VIDEOS_DIR)
+        timeline = video_creator.promote_timeline(draft_timeline, image_files, audio_files)
+        video_path = video_creator.render_timeline(timeline)
+        
+        try:
+            video_creator.cleanup_temp_files()
+        except:
+            pass
+        
+        print(f"\n{Fore.GREEN}🎉 Final video hazır: {video_path}{Style.RESET_ALL}")
+        return video_path
+        
+    except KeyboardInterrupt:
+        print(f"\n{Fore.RED}❌ İşlem kullanıcı tarafından iptal edildi{Style.RESET_ALL}")
+        return None
+    except Exception as e:
+        print(f"\n{Fore.RED}❌ Hata oluştu: {e}{Style.RESET_ALL}")
+        return None
+
 def setup_environment():
     """Çevre değişkenlerini ve API anahtarlarını kontrol eder"""
     print(f"{Fore.CYAN}🔧 Sistem kontrolleri{Style.RESET_ALL}")
@@ -273,9 +412,11 @@ def show_menu():
 ─────────────
 
 1. 🎬 Kibritçi Kız videosunu oluştur
-2.  Sistem kontrolü
-3. 🧪 API testleri  
-4. ❌ Çıkış
+2. ⚡ Taslak video (hızlı iterasyon)
+3. ⬆️  Taslaktan final video
+4.  Sistem kontrolü
+5. 🧪 API testleri  
+6. ❌ Çıkış
 
 """
     print(menu)
@@ -399,7 +540,7 @@ def main():
         show_menu()
         
         try:
-            choice = input(f"{Fore.YELLOW}Seçiminizi yapın (1-4): {Style.RESET_ALL}").strip()
+            choice = input(f"{Fore.YELLOW}Seçiminizi yapın (1-6): {Style.RESET_ALL}").strip()
             
             if choice == "1":
                 print("\n🎬 Video oluşturuluyor...")
@@ -408,19 +549,30 @@ def main():
                     input(f"\n{Fore.GREEN}✅ Devam etmek için Enter'a basın...{Style.RESET_ALL}")
             
             elif choice == "2":
+                print("\n⚡ Taslak video oluşturuluyor...")
+                result = create_story_video(upload_to_youtube=False, draft=True)
+                if result:
+                    input(f"\n{Fore.GREEN}✅ Devam etmek için Enter'a basın...{Style.RESET_ALL}")
+            
+            elif choice == "3":
+                result = render_final_from_draft()
+                if result:
+                    input(f"\n{Fore.GREEN}✅ Devam etmek için Enter'a basın...{Style.RESET_ALL}")
+            
+            elif choice == "4":
                 setup_environment()
                 input(f"\n{Fore.GREEN}✅ Devam etmek için Enter'a basın...{Style.RESET_ALL}")
             
-            elif choice == "3":
+            elif choice == "5":
                 run_api_tests()
                 input(f"\n{Fore.GREEN}✅ Devam etmek için Enter'a basın...{Style.RESET_ALL}")
             
-            elif choice == "4":
+            elif choice == "6":
                 print(f"\n{Fore.GREEN}👋 Görüşmek üzere!{Style.RESET_ALL}")
                 break
             
             else:
-                print(f"{Fore.RED}❌ Geçersiz seçim! Lütfen 1-4 arası bir sayı girin.{Style.RESET_ALL}")
+                print(f"{Fore.RED}❌ Geçersiz seçim! Lütfen 1-6 arası bir sayı girin.{Style.RESET_ALL}")
                 
         except KeyboardInterrupt:
             print(f"\n\n{Fore.GREEN}👋 Program sonlandırıldı.{Style.RESET_ALL}")
@@ -0,0 +1,209 @@
+"""
+Ses karıştırma modülü
+Anlatım zaman çizelgesi ve fon müziğini NumPy ile tek bir PCM tamponunda karıştırır;
+sonuç WAV dosyası encoder tarafından doğrudan mux edilir
+"""
+import os
+import wave
+import subprocess
+from typing import List, Optional
+
+import numpy as np
+
+from src.ffmpeg_renderer import get_ffmpeg_exe
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+
+def decode_audio(path: str, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> np.ndarray:
+    """
+    Ses dosyasını int16 PCM dizisine (örnek, kanal) çözer
+
+    16-bit ve aynı örnekleme hızındaki WAV'lar doğrudan okunur;
+    diğer formatlar tek bir ffmpeg çağrısıyla çözülür.
+    """
+    try:
+        with wave.open(path, 'rb') as wav:
+            if wav.getsampwidth() == 2 and wav.getframerate() == sample_rate:
+                source_channels = wav.getnchannels()
+                data = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+                data = data.reshape(-1, source_channels)
+                if source_channels == channels:
+                    return data
+                if source_channels == 1:
+                    return np.repeat(data, channels, axis=1)
+    except (wave.Error, EOFError):
+        pass
+
+    result = subprocess.run(
+        [get_ffmpeg_exe(), '-v', 'error', '-i', path,
+         '-f', 's16le', '-acodec', 'pcm_s16le', '-ac', str(channels), '-ar', str(sample_rate), '-'],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+    )
+    return np.frombuffer(result.stdout, dtype='<i2').reshape(-1, channels)
+
+
+def write_wav(path: str, samples: np.ndarray, sample_rate: int = SAMPLE_RATE):
+    """int16 PCM dizisini WAV olarak yazar"""
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.ascontiguousarray(samples, dtype='<i2').tobytes())
+
+
+class PCMWavWriter:
+    """
+    Ham 16-bit PCM parçalarını geldikçe WAV dosyasına yazar (ör. OpenAI TTS 'pcm' akışı)
+
+    Bellekte en fazla bir parça ve yarım kalmış bir örnek tutulur; başlık kapanışta
+    gerçek uzunlukla güncellenir, süre de yazılan örneklerden kesin olarak bilinir.
+    """
+
+    def __init__(self, path: str, sample_rate: int, channels: int = 1):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frames = 0
+        self._frame_size = 2 * channels
+        self._pending = b""
+        self._wav = wave.open(path, 'wb')
+        self._wav.setnchannels(channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+
+    def write(self, chunk: bytes):
+        """Parçayı yazar (örnek sınırında bölünmüş baytlar bir sonraki parçaya taşınır)"""
+        data = self._pending + chunk if self._pending else chunk
+        usable = len(data) - len(data) % self._frame_size
+        if usable:
+            self._wav.writeframesraw(data[:usable])
+            self.frames += usable // self._frame_size
+        self._pending = data[usable:]
+
+    @property
+    def duration(self) -> float:
+        return self.frames / float(self.sample_rate)
+
+    def info(self) -> dict:
+        """media_probe.probe ile aynı biçimde dosya bilgisi"""
+        return {
+            'duration': self.duration,
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+            'bits_per_sample': 16,
+            'frames': self.frames,
+            'has_audio': True,
+        }
+
+    def close(self):
+        self._wav.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def decode_to_wav(encoded: bytes, output_path: str) -> str:
+    """
+    Bellekteki sıkıştırılmış sesi (ör. gTTS MP3'ü) tek ffmpeg çağrısıyla doğrudan WAV'a çözer
+
+    Girdi pipe ile verilir (geçici dosya yok); örnekleme hızı ve kanal sayısı korunur.
+    """
+    subprocess.run(
+        [get_ffmpeg_exe(), '-v', 'error', '-y', '-i', 'pipe:0', '-acodec', 'pcm_s16le', output_path],
+        input=encoded, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+    )
+    return output_path
+
+
+class AudioMixer:
+    # Karıştırma blok blok yapılır; geçici float tampon bu boyutla sınırlı kalır
+    BLOCK_SECONDS = 10
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS):
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    def build_narration(self, audio_paths: List[str]) -> np.ndarray:
+        """Sahne seslerini arka arkaya dizerek anlatım zaman çizelgesini oluşturur"""
+        parts = [decode_audio(path, self.sample_rate, self.channels) for path in audio_paths]
+        if not parts:
+            return np.zeros((0, self.channels), dtype=np.int16)
+        return np.concatenate(parts)
+
+    def write_narration(self, audio_paths: List[str], boundaries: List[tuple], output_path: str) -> str:
+        """
+        Sahne seslerini frame'e oturtulmuş sahne sınırlarına yerleştirip tek ana anlatım WAV'ı yazar
+
+        Her ses kendi sahnesinin başladığı örnekte başlar ve sahne bitişinde kesilir;
+        böylece anlatım kesmelere tam hizalıdır ve render tek bir ses dosyası okur.
+
+        Args:
+            audio_paths: Sahne sesleri (sırayla)
+            boundaries: Sahne başına (başlangıç, bitiş) saniye
+            output_path: Çıktı WAV yolu
+        """
+        total = int(round(boundaries[-1][1] * self.sample_rate)) if boundaries else 0
+        output = np.zeros((total, self.channels), dtype=np.int16)
+        for path, (start, end) in zip(audio_paths, boundaries):
+            start_sample = int(round(start * self.sample_rate))
+            end_sample = min(int(round(end * self.sample_rate)), total)
+            samples = decode_audio(path, self.sample_rate, self.channels)[:max(end_sample - start_sample, 0)]
+            output[start_sample:start_sample + len(samples)] = samples
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        write_wav(output_path, output, self.sample_rate)
+        return output_path
+
+    def mix(self, audio_paths: List[str], output_path: str,
+            music_path: Optional[str] = None, volume: float = 0.05,
+            duration: Optional[float] = None, offset: float = 0.0,
+            music_samples: Optional[np.ndarray] = None) -> str:
+        """
+        Anlatım ve fon müziğini tek tampona karıştırıp WAV olarak yazar
+
+        Args:
+            audio_paths: Sahne sesleri (sırayla)
+            output_path: Çıktı WAV yolu
+            music_path: Fon müziği (opsiyonel, indeks aritmetiğiyle döngüye alınır)
+            volume: Fon müziği kazancı
+            duration: Çıktı süresi (verilmezse anlatım süresi; video süresine eşitlemek için)
+            offset: Anlatımın başlayacağı an (saniye; ör. başlık kartı süresi)
+            music_samples: Önceden çözülmüş müzik PCM'i (ör. MusicLibrary mmap'i; music_path yerine)
+
+        Returns:
+            Çıktı WAV yolu
+        """
+        narration = self.build_narration(audio_paths)
+        narration_start = int(round(offset * self.sample_rate))
+        total = int(round(duration * self.sample_rate)) if duration else narration_start + len(narration)
+
+        output = np.zeros((total, self.channels), dtype=np.int16)
+        narration_end = min(narration_start + len(narration), total)
+        if narration_end > narration_start:
+            output[narration_start:narration_end] = narration[:narration_end - narration_start]
+
+        music = music_samples
+        if music is None and music_path:
+            music = decode_audio(music_path, self.sample_rate, self.channels)
+        if music is not None and len(music) == 0:
+            music = None
+
+        if music is not None:
+            block = self.BLOCK_SECONDS * self.sample_rate
+            for start in range(0, total, block):
+                end = min(start + block, total)
+                # Döngü: müzik indeksi = zaman çizelgesi indeksi mod müzik uzunluğu
+                indices = np.arange(start, end) % len(music)
+                mixed = output[start:end].astype(np.float32)
+                mixed += music[indices].astype(np.float32) * volume
+                np.clip(mixed, -32768, 32767, out=mixed)
+                output[start:end] = mixed
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        write_wav(output_path, output, self.sample_rate)
+        return output_path
@@ -0,0 +1,287 @@
+"""
+Encoder profil modülü
+İsimli encoder profilleri (draft, standard, archive) ve her render makinesi için
+benchmark ile seçilmiş en iyi ayarların saklanması
+"""
+import os
+import re
+import json
+import copy
+import time
+import socket
+import itertools
+import subprocess
+from typing import List, Dict, Optional
+
+from src.ffmpeg_renderer import FFmpegRenderer, get_ffmpeg_exe
+
+# İsimli profiller (threads=0: x264 kendisi seçer)
+ENCODER_PROFILES = {
+    "draft": {"preset": "ultrafast", "crf": 30, "tune": None, "threads": 0, "fps": 24},
+    "standard": {"preset": "medium", "crf": 23, "tune": None, "threads": 0, "fps": 24},
+    "archive": {"preset": "slow", "crf": 18, "tune": None, "threads": 0, "fps": 24},
+}
+
+HOST_PROFILE_DIR = os.path.join("config", "host_profiles")
+
+# Benchmark arama uzayı
+BENCHMARK_PRESETS = ["ultrafast", "veryfast", "faster", "medium"]
+BENCHMARK_CRFS = [20, 23, 26]
+BENCHMARK_TUNES = [None, "animation"]
+
+# Hikaye başına CRF araması: denenen değerler
+CRF_SEARCH_CRFS = [18, 20, 23, 26, 28, 30]
+REFERENCE_CRF = 8
+
+
+def host_profile_path(hostname: str = None) -> str:
+    """Bu makineye ait benchmark sonuç dosyasının yolu"""
+    return os.path.join(HOST_PROFILE_DIR, f"{hostname or socket.gethostname()}.json")
+
+
+def load_host_profile(hostname: str = None) -> Optional[Dict]:
+    """Bu makine için kaydedilmiş en iyi profili döndürür (yoksa None)"""
+    path = host_profile_path(hostname)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("profile")
+    except Exception as e:
+        print(f"⚠ Makine profili okunamadı ({path}): {e}")
+        return None
+
+
+def save_host_profile(profile: Dict, results: List[Dict], hostname: str = None) -> str:
+    """Seçilen profili ve tüm benchmark sonuçlarını bu makine adına kaydeder"""
+    path = host_profile_path(hostname)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "hostname": hostname or socket.gethostname(),
+            "cpu_count": os.cpu_count(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "profile": profile,
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def get_encoder_profile(name: str = "standard") -> Dict:
+    """
+    Profil ayarlarını döndürür
+
+    Args:
+        name: "draft", "standard", "archive" veya "auto" (bu makine için benchmark sonucu,
+              yoksa "standard")
+    """
+    if name == "auto":
+        host_profile = load_host_profile()
+        if host_profile:
+            return dict(ENCODER_PROFILES["standard"], **host_profile)
+        print("⚠ Bu makine için benchmark sonucu yok, 'standard' profil kullanılıyor")
+        name = "standard"
+    if name not in ENCODER_PROFILES:
+        raise ValueError(f"Bilinmeyen encoder profili: {name}")
+    return dict(ENCODER_PROFILES[name])
+
+
+def renderer_from_profile(profile: Dict, **kwargs) -> FFmpegRenderer:
+    """Profil ayarlarıyla FFmpegRenderer oluşturur (kwargs profili ezer)"""
+    settings = {
+        "preset": profile["preset"],
+        "crf": profile["crf"],
+        "fps": profile["fps"],
+        "tune": profile.get("tune"),
+        "threads": profile.get("threads", 0),
+    }
+    settings.update(kwargs)
+    return FFmpegRenderer(**settings)
+
+
+def measure_ssim(distorted_path: str, reference_path: str, width: Optional[int] = None) -> float:
+    """
+    İki videonun ortalama SSIM değerini ffmpeg ssim filtresiyle ölçer
+
+    Args:
+        width: Verilirse iki video da bu genişliğe küçültülerek ölçülür (çok daha hızlı)
+    """
+    graph = "[0:v][1:v]ssim"
+    if width:
+        scale = f"scale={width}:-2:flags=bilinear"
+        graph = f"[0:v]{scale}[d];[1:v]{scale}[r];[d][r]ssim"
+    result = subprocess.run(
+        [get_ffmpeg_exe(), "-hide_banner", "-i", distorted_path, "-i", reference_path,
+         "-lavfi", graph, "-f", "null", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    match = re.search(r"All:([0-9.]+)", result.stderr.decode("utf-8", errors="replace"))
+    if not match:
+        raise RuntimeError("SSIM ölçülemedi")
+    return float(match.group(1))
+
+
+def run_encoder_benchmark(scenes: List[Dict], work_dir: str,
+                          target_ssim: float = 0.97,
+                          max_kbps: Optional[float] = None) -> Dict:
+    """
+    Referans hikayeyi farklı preset/crf/tune/thread kombinasyonlarıyla kodlar
+
+    Args:
+        scenes: FFmpegRenderer sahne listesi (image_path, duration, start/end_scale)
+        work_dir: Geçici çıktı klasörü
+        target_ssim: Kabul edilen en düşük kalite (referansa göre SSIM)
+        max_kbps: Kabul edilen en yüksek video bitrate'i (None = sınırsız)
+
+    Returns:
+        {"profile": seçilen ayarlar, "results": tüm ölçümler}
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    base = ENCODER_PROFILES["standard"]
+
+    # Kalite referansı: neredeyse kayıpsız kodlama
+    reference_path = os.path.join(work_dir, "reference.mp4")
+    reference = FFmpegRenderer(preset="ultrafast", crf=8, fps=base["fps"], temp_dir=work_dir)
+    reference.render(scenes, reference_path)
+    duration = reference.total_duration(scenes)
+    frames = int(round(duration * base["fps"]))
+
+    def encode(preset, crf, tune, threads):
+        label = f"{preset}/crf{crf}/{tune or '-'}/t{threads or 'auto'}"
+        output_path = os.path.join(work_dir, f"{preset}_{crf}_{tune or 'none'}_{threads}.mp4")
+        renderer = FFmpegRenderer(preset=preset, crf=crf, fps=base["fps"], tune=tune,
+                                  threads=threads, temp_dir=work_dir)
+        start = time.perf_counter()
+        renderer.render(scenes, output_path)
+        elapsed = time.perf_counter() - start
+        result = {
+            "preset": preset, "crf": crf, "tune": tune, "threads": threads,
+            "seconds": round(elapsed, 3),
+            "fps_throughput": round(frames / elapsed, 2),
+            "kbps": round(os.path.getsize(output_path) * 8 / 1000.0 / duration, 1),
+            "ssim": round(measure_ssim(output_path, reference_path), 5),
+        }
+        print(f"   {label:<32} {result['fps_throughput']:7.1f} frame/s  "
+              f"{result['kbps']:8.1f} kbps  SSIM {result['ssim']:.4f}")
+        return result
+
+    print(f"🧪 Encoder benchmark: {len(scenes)} sahne, {frames} frame")
+    results = [
+        encode(preset, crf, tune, 0)
+        for preset, crf, tune in itertools.product(BENCHMARK_PRESETS, BENCHMARK_CRFS, BENCHMARK_TUNES)
+    ]
+
+    def meets_target(result):
+        return result["ssim"] >= target_ssim and (max_kbps is None or result["kbps"] <= max_kbps)
+
+    accepted = [r for r in results if meets_target(r)]
+    if accepted:
+        best = max(accepted, key=lambda r: r["fps_throughput"])
+    else:
+        print("⚠ Hiçbir kombinasyon hedefi karşılamadı, en yüksek kaliteli seçiliyor")
+        best = max(results, key=lambda r: r["ssim"])
+
+    # Kazanan ayar için thread sayısını ayrıca dene
+    cpu_count = os.cpu_count() or 1
+    for threads in sorted({cpu_count, max(cpu_count // 2, 1)}):
+        result = encode(best["preset"], best["crf"], best["tune"], threads)
+        results.append(result)
+        if result["fps_throughput"] > best["fps_throughput"] and meets_target(result):
+            best = result
+
+    profile = {
+        "preset": best["preset"],
+        "crf": best["crf"],
+        "tune": best["tune"],
+        "threads": best["threads"],
+        "fps": base["fps"],
+    }
+    return {"profile": profile, "results": results}
+
+
+def search_title_crf(renderer: FFmpegRenderer, scenes: List[Dict], work_dir: str,
+                     target_ssim: float = 0.97, crfs: Optional[List[int]] = None,
+                     sample_count: int = 3, sample_seconds: float = 1.0) -> Dict:
+    """
+    Hikayeye özel CRF seçer: hedef kaliteyi karşılayan en yüksek CRF
+
+    Hikayeye yayılmış birkaç sahneden kısa örnekler, renderer'ın diğer ayarlarıyla
+    kodlanır ve neredeyse kayıpsız referansa göre çıktı çözünürlüğünde SSIM ile puanlanır
+    (benchmark ile aynı ölçü; küçültülünce 1080p kayıpları görünmez, her CRF hedefi geçer).
+    Bir CRF'nin puanı en kötü örneğidir (tek bir yoğun sahne de korunur). Kalite
+    CRF ile monoton düştüğünden değerler ikili arama ile denenir.
+
+    Args:
+        renderer: Hikayeyi kodlayacak renderer (preset/tune/boyut buradan)
+        scenes: FFmpegRenderer sahne listesi
+        work_dir: Geçici çıktı klasörü
+        target_ssim: Kabul edilen en düşük kalite
+        crfs: Denenecek CRF değerleri (verilmezse CRF_SEARCH_CRFS)
+        sample_count: Örneklenecek sahne sayısı
+        sample_seconds: Sahne başına örnek süresi
+
+    Returns:
+        {"crf", "ssim", "results", "cost_seconds", "encoded_frames"}
+    """
+    start = time.perf_counter()
+    os.makedirs(work_dir, exist_ok=True)
+    crfs = sorted(crfs or CRF_SEARCH_CRFS)
+
+    # Hikayenin başından sonuna eşit aralıklı sahneler
+    count = min(sample_count, len(scenes))
+    indices = sorted({int(round(k * (len(scenes) - 1) / max(count - 1, 1))) for k in range(count)})
+    counts = renderer.frame_counts([scene["duration"] for scene in scenes])
+    sample_frames = max(int(round(sample_seconds * renderer.fps)), 1)
+
+    # Referansın hızı önemsiz, sadece kalitesi: en hızlı preset
+    reference = copy.copy(renderer)
+    reference.crf = REFERENCE_CRF
+    reference.preset = "ultrafast"
+    samples = []
+    for i in indices:
+        frames = min(counts[i], sample_frames)
+        reference_path = os.path.join(work_dir, f"crf_reference_{i}.mp4")
+        reference.render_scene_segment(scenes[i], frames, reference_path)
+        samples.append((scenes[i], frames, reference_path))
+    sample_total = sum(frames for _, frames, _ in samples)
+    encoded_frames = sample_total
+
+    def evaluate(crf):
+        candidate = copy.copy(renderer)
+        candidate.crf = crf
+        scores = []
+        size = 0
+        for scene, frames, reference_path in samples:
+            output_path = os.path.join(work_dir, f"crf_{crf}_{len(scores)}.mp4")
+            candidate.render_scene_segment(scene, frames, output_path)
+            scores.append(measure_ssim(output_path, reference_path))
+            size += os.path.getsize(output_path)
+        return {"crf": crf, "ssim": round(min(scores), 5), "bytes": size}
+
+    # İkili arama: hedefi karşılayan en yüksek CRF
+    results = []
+    best = None
+    low, high = 0, len(crfs) - 1
+    while low <= high:
+        middle = (low + high) // 2
+        result = evaluate(crfs[middle])
+        results.append(result)
+        encoded_frames += sample_total
+        if result["ssim"] >= target_ssim:
+            best = result
+            low = middle + 1
+        else:
+            high = middle - 1
+
+    if best is None:
+        print(f"⚠ Hiçbir CRF SSIM {target_ssim} hedefini karşılamadı, en düşük CRF seçiliyor")
+        best = min(results, key=lambda r: r["crf"])
+    results.sort(key=lambda r: r["crf"])
+
+    return {
+        "crf": best["crf"],
+        "ssim": best["ssim"],
+        "results": results,
+        "cost_seconds": round(time.perf_counter() - start, 2),
+        "encoded_frames": encoded_frames,
+    }
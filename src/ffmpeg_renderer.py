@@ -0,0 +1,524 @@
+"""
+FFmpeg filtergraph render modülü
+Sahneleri tek bir ffmpeg komutuna (zoompan/scale/concat) dönüştürür,
+böylece hiçbir frame Python'dan geçmeden doğrudan libx264'e gider
+"""
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+
+def get_ffmpeg_exe() -> str:
+    """Kullanılacak ffmpeg binary yolunu döndürür (MoviePy ile aynı binary)"""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def run_ffmpeg(args: List[str]) -> None:
+    """ffmpeg komutunu çalıştırır, hata durumunda stderr'in sonunu gösterir"""
+    cmd = [get_ffmpeg_exe(), "-hide_banner", "-loglevel", "error", "-y"] + args
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")[-2000:]
+        raise RuntimeError(f"ffmpeg hatası (kod {result.returncode}): {stderr}")
+
+
+class FFmpegRenderer:
+    # zoompan tam sayı piksel adımlarıyla çalışır; önce büyütmek titremeyi azaltır
+    ZOOMPAN_UPSCALE = 2
+
+    # Kısa geçiş adları -> xfade geçişleri (diğer xfade adları olduğu gibi kullanılır)
+    TRANSITIONS = {"crossfade": "fade", "dip": "fadeblack"}
+
+    def __init__(self, width: int = 1920, height: int = 1080, fps: int = 24,
+                 preset: str = "medium", crf: int = 23, temp_dir: str = None,
+                 tune: str = None, threads: int = 0,
+                 transition: str = None, transition_duration: float = 0.5):
+        """
+        FFmpeg render motoru
+
+        Args:
+            width: Video genişliği
+            height: Video yüksekliği
+            fps: Frame hızı
+            preset: libx264 preset
+            crf: libx264 kalite değeri
+            temp_dir: Filtergraph script dosyası için geçici klasör
+            tune: libx264 tune (ör. tüm sahneler hareketsizse "stillimage")
+            threads: x264 thread sayısı (0 = varsayılan)
+            transition: Sahne geçişi ("crossfade", "dip" veya bir xfade geçiş adı; None = kesme)
+            transition_duration: Geçiş süresi (saniye)
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.preset = preset
+        self.crf = crf
+        self.tune = tune
+        self.threads = threads
+        self.transition = transition
+        self.transition_duration = transition_duration
+        self.temp_dir = temp_dir or tempfile.mkdtemp()
+
+    def frame_counts(self, durations: List[float]) -> List[int]:
+        """
+        Sahne sürelerini frame sayılarına çevirir
+
+        Kümülatif sınırlar frame'e yuvarlanır; böylece toplam kayma 1 frame'i geçmez
+        ve her sahnenin görüntüsü kendi anlatımıyla hizalı kalır.
+        """
+        counts = []
+        elapsed = 0.0
+        previous_boundary = 0
+        for duration in durations:
+            elapsed += duration
+            boundary = int(round(elapsed * self.fps))
+            counts.append(max(boundary - previous_boundary, 1))
+            previous_boundary += counts[-1]
+        return counts
+
+    def transition_frames(self, counts: List[int]) -> int:
+        """
+        Geçiş süresini frame'e çevirir
+
+        Her sahnenin kendi süresi boyunca en az bir geçişi sığdırabilmesi için
+        en kısa sahneyle sınırlanır (0 = geçiş yok, düz kesme).
+        """
+        if not self.transition or len(counts) < 2:
+            return 0
+        frames = int(round(self.transition_duration * self.fps))
+        return max(min(frames, min(counts)), 0) if frames >= 2 else 0
+
+    def video_encoder_args(self, threads: int = 0, variable_frame_rate: bool = False) -> List[str]:
+        """
+        Video encoder parametreleri (MoviePy yolu ile aynı ayarlar)
+
+        Paralel modda tüm segmentler bu parametrelerle kodlanır; concat demuxer
+        ile yeniden kodlamadan birleştirilebilmeleri için aynı olmaları şarttır.
+
+        Args:
+            threads: x264 thread sayısı (0 = renderer ayarı)
+            variable_frame_rate: True ise frame zaman damgaları korunur (durağan segmentler)
+        """
+        args = [
+            "-c:v", "libx264",
+            "-preset", self.preset,
+            "-crf", str(self.crf),
+            "-pix_fmt", "yuv420p",
+        ]
+        if variable_frame_rate:
+            args += ["-fps_mode", "passthrough"]
+        else:
+            args += ["-r", str(self.fps)]
+        if self.tune:
+            args += ["-tune", self.tune]
+        threads = threads or self.threads
+        if threads:
+            args += ["-threads", str(threads)]
+        return args
+
+    def still_segment_args(self, frames: int) -> List[str]:
+        """
+        Durağan (iki frame'lik değişken frame hızlı) segmentin çıktı parametreleri
+
+        MP4'te son örneğin süresi paketin süresinden gelir; passthrough'da bu süre 0
+        yazılır ve video izi son frame'in başında biter. setts ile her pakete bir
+        frame'lik süre verilir (aradaki frame'lerin süresi zaman damgası farkından gelir).
+        """
+        return [
+            "-frames:v", str(min(frames, 2)),
+            "-bsf:v", f"setts=duration=1/({self.fps}*TB)",
+        ]
+
+    def audio_encoder_args(self) -> List[str]:
+        """Ses encoder parametreleri"""
+        return ["-c:a", "aac", "-ar", "44100"]
+
+    def encoder_args(self) -> List[str]:
+        """Video/ses encoder parametreleri"""
+        return self.video_encoder_args() + self.audio_encoder_args()
+
+    @staticmethod
+    def is_still(scene: Dict) -> bool:
+        """Sahnede hareket (zoom) yoksa True döndürür"""
+        return scene.get("start_scale", 1.0) == scene.get("end_scale", 1.0) == 1.0
+
+    def _scene_filter(self, scene: Dict, frames: int) -> str:
+        """Sahneye göre hareketli (zoompan) veya durağan filtre zincirini seçer"""
+        if self.is_still(scene):
+            return self._still_filter(frames)
+        return self._zoompan_filter(scene, frames)
+
+    def _still_filter(self, frames: int, variable_frame_rate: bool = False) -> str:
+        """
+        Hareketsiz sahne için filtre zinciri
+
+        Görsel bir kez ölçeklenip renk dönüşümünden geçer, ardından loop filtresi
+        aynı frame'i tekrarlar; frame başına çözme/ölçekleme yapılmaz.
+        variable_frame_rate=True ise sadece iki frame üretilir: biri sahne başında, biri
+        son frame'in (frames - 1) anında. Son frame'in süresi still_segment_args ile bir
+        frame'e ayarlanır; böylece segment (hikayenin son segmenti olsa bile) tam
+        sahne süresini kaplar.
+        """
+        prefix = f"scale={self.width}:{self.height},setsar=1,format=yuv420p,settb=1/{self.fps},"
+        if variable_frame_rate:
+            if frames <= 1:
+                return prefix + "setpts=0"
+            return prefix + f"loop=loop=1:size=1:start=0,setpts=N*{frames - 1}"
+        # fps: zaman damgaları zaten frame'e oturmuş; sadece sabit frame hızı bilgisini ekler (xfade için)
+        return prefix + f"loop=loop={max(frames - 1, 0)}:size=1:start=0,setpts=N,fps={self.fps}"
+
+    def _zoompan_filter(self, scene: Dict, frames: int) -> str:
+        """Bir sahne için scale + zoompan filtre zincirini oluşturur"""
+        start_scale = scene.get("start_scale", 1.0)
+        end_scale = scene.get("end_scale", 1.0)
+        up_w = self.width * self.ZOOMPAN_UPSCALE
+        up_h = self.height * self.ZOOMPAN_UPSCALE
+        steps = max(frames - 1, 1)
+        zoom = f"{start_scale}+({end_scale - start_scale})*on/{steps}"
+        return (
+            f"scale={up_w}:{up_h},setsar=1,"
+            f"zoompan=z='{zoom}':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d={frames}:s={self.width}x{self.height}:fps={self.fps},"
+            f"format=yuv420p"
+        )
+
+    def rendition_filter(self, rendition: Dict, scene: Optional[Dict] = None) -> str:
+        """
+        Ana kompozisyondan bir çıktı sürümü (rendition) üreten filtre zinciri
+
+        En-boy oranı aynıysa sadece ölçeklenir; farklıysa (ör. 1080x1920 Shorts)
+        sahnenin odak noktasına (scene["crop_x"], 0-1 arası, varsayılan orta) göre
+        kırpılıp ölçeklenir.
+        """
+        width, height = rendition["width"], rendition["height"]
+        if (width, height) == (self.width, self.height):
+            return "null"
+        if width * self.height == height * self.width:
+            return f"scale={width}:{height}:flags=lanczos,setsar=1"
+
+        if width * self.height < height * self.width:
+            crop_w = int(round(self.height * width / height / 2.0)) * 2
+            crop_h = self.height
+        else:
+            crop_w = self.width
+            crop_h = int(round(self.width * height / width / 2.0)) * 2
+        focus_x = (scene or {}).get("crop_x", 0.5)
+        focus_y = (scene or {}).get("crop_y", 0.5)
+        x = int(round((self.width - crop_w) * min(max(focus_x, 0.0), 1.0)))
+        y = int(round((self.height - crop_h) * min(max(focus_y, 0.0), 1.0)))
+        return f"crop={crop_w}:{crop_h}:{x}:{y},scale={width}:{height}:flags=lanczos,setsar=1"
+
+    def _split_filter(self, label: str, scene_filter: str, scene: Dict,
+                      renditions: List[Dict], prefix: str) -> List[str]:
+        """
+        Sahne filtresini bir kez çalıştırıp çıktısını sürümlere dağıtır
+
+        Çıktı etiketleri: [{prefix}_0] (ana boyut), [{prefix}_1], ...
+        """
+        if not renditions:
+            return [f"{label}{scene_filter}[{prefix}_0]"]
+        count = len(renditions) + 1
+        split_labels = "".join(f"[{prefix}_s{k}]" for k in range(1, count))
+        filters = [f"{label}{scene_filter},split={count}[{prefix}_0]{split_labels}"]
+        for k, rendition in enumerate(renditions, start=1):
+            filters.append(f"[{prefix}_s{k}]{self.rendition_filter(rendition, scene)}[{prefix}_{k}]")
+        return filters
+
+    def _write_filter_script(self, filters: List[str], name: str = "filtergraph.txt") -> str:
+        """Filtergraph'ı dosyaya yazar (uzun hikayelerde komut satırı limiti için)"""
+        script_path = os.path.join(self.temp_dir, name)
+        with open(script_path, "w", encoding="utf-8") as f:
+            f.write(";\n".join(filters))
+        return script_path
+
+    def total_duration(self, scenes: List[Dict]) -> float:
+        """Frame sınırlarına oturtulmuş toplam video süresi"""
+        return sum(self.frame_counts([scene["duration"] for scene in scenes])) / float(self.fps)
+
+    def build_command(self, scenes: List[Dict], output_path: str,
+                      audio_path: Optional[str] = None,
+                      renditions: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Tüm hikaye için ffmpeg argümanlarını oluşturur
+
+        Args:
+            scenes: Her biri image_path, audio_path, duration, start_scale, end_scale içeren sahneler
+            output_path: Çıktı video yolu
+            audio_path: Önceden karıştırılmış ses (anlatım + müzik) WAV'ı
+            renditions: Ek çıktı sürümleri (width, height, output_path); sahneler bir kez
+                        oluşturulur, concat her sürüm için ayrı bir video akışı verir
+
+        Returns:
+            ffmpeg argüman listesi (binary hariç)
+        """
+        renditions = renditions or []
+        counts = self.frame_counts([scene["duration"] for scene in scenes])
+        total_duration = sum(counts) / float(self.fps)
+        n = len(scenes)
+        streams = len(renditions) + 1
+
+        # Geçiş sahne sınırını ortalar: önceki sahne h_after frame uzar, sonraki
+        # h_before frame erken başlar; toplam süre ve anlatım hizası değişmez
+        transition_frames = self.transition_frames(counts)
+        h_before = transition_frames // 2
+        h_after = transition_frames - h_before
+        render_counts = [
+            frames + (h_before if i > 0 else 0) + (h_after if i < n - 1 else 0)
+            for i, frames in enumerate(counts)
+        ] if transition_frames else counts
+
+        inputs = []
+        filters = []
+        for i, (scene, frames) in enumerate(zip(scenes, render_counts)):
+            inputs += ["-i", scene["image_path"]]
+            filters += self._split_filter(f"[{i}:v]", self._scene_filter(scene, frames),
+                                          scene, renditions, f"v{i}")
+
+        if transition_frames:
+            xfade = self.TRANSITIONS.get(self.transition, self.transition)
+            duration = transition_frames / float(self.fps)
+            for k in range(streams):
+                previous = f"v0_{k}"
+                boundary = 0
+                for i in range(1, n):
+                    boundary += counts[i - 1]
+                    offset = (boundary - h_before) / float(self.fps)
+                    label = f"vout{k}" if i == n - 1 else f"x{i}_{k}"
+                    filters.append(
+                        f"[{previous}][v{i}_{k}]xfade=transition={xfade}"
+                        f":duration={duration:.6f}:offset={offset:.6f}[{label}]"
+                    )
+                    previous = label
+        else:
+            video_labels = "".join(f"[v{i}_{k}]" for i in range(n) for k in range(streams))
+            output_labels = "".join(f"[vout{k}]" for k in range(streams))
+            filters.append(f"{video_labels}concat=n={n}:v={streams}:a=0{output_labels}")
+        script_path = self._write_filter_script(filters)
+
+        audio_args = []
+        if audio_path:
+            inputs += ["-i", audio_path]
+            audio_args = ["-map", f"{n}:a"] + self.audio_encoder_args()
+
+        outputs = []
+        for k, path in enumerate([output_path] + [r["output_path"] for r in renditions]):
+            outputs += ["-map", f"[vout{k}]"] + audio_args + self.video_encoder_args() + [
+                "-t", f"{total_duration:.6f}",
+                "-movflags", "+faststart",
+                path,
+            ]
+        return inputs + ["-filter_complex_script", script_path] + outputs
+
+    def render(self, scenes: List[Dict], output_path: str,
+               audio_path: Optional[str] = None,
+               renditions: Optional[List[Dict]] = None) -> str:
+        """Hikayeyi (ve varsa ek sürümlerini) tek ffmpeg çağrısıyla render eder"""
+        args = self.build_command(scenes, output_path, audio_path, renditions)
+        print(f"⚙️  FFmpeg filtergraph ile render ediliyor ({len(scenes)} sahne)...")
+        run_ffmpeg(args)
+        return output_path
+
+    def render_scene_segment(self, scene: Dict, frames: int, output_path: str,
+                             threads: int = 0, renditions: Optional[List[Dict]] = None,
+                             variable_frame_rate: Optional[bool] = None) -> str:
+        """
+        Tek bir sahneyi sessiz video segmentine kodlar
+
+        Durağan sahneler değişken frame hızlı, iki frame'lik segment olarak kodlanır
+        (başta ve son frame anında birer frame); video izi tam olarak frames kadar sürer.
+
+        Args:
+            renditions: Ek sürümler (width, height, output_path); sahne bir kez oluşturulur
+            variable_frame_rate: Durağan sahne değişken frame hızlı mı kodlansın
+                                 (verilmezse sahne durağansa evet; False = her frame kodlanır)
+        """
+        renditions = renditions or []
+        still = self.is_still(scene) and variable_frame_rate is not False
+        scene_filter = self._still_filter(frames, True) if still else self._scene_filter(scene, frames)
+        filters = self._split_filter("[0:v]", scene_filter, scene, renditions, "v")
+
+        outputs = []
+        for k, path in enumerate([output_path] + [r["output_path"] for r in renditions]):
+            outputs += ["-map", f"[v_{k}]", "-an"] + \
+                self.video_encoder_args(threads, variable_frame_rate=still) + \
+                (self.still_segment_args(frames) if still else ["-frames:v", str(frames)]) + [
+                    # Tüm segmentlerde aynı zaman ölçeği (concat demuxer için)
+                    "-video_track_timescale", str(self.fps * 512),
+                    path,
+                ]
+        run_ffmpeg(["-i", scene["image_path"], "-filter_complex", ";".join(filters)] + outputs)
+        return output_path
+
+    def concat_segments(self, segment_paths: List[str], output_path: str,
+                        total_duration: float, audio_path: Optional[str] = None,
+                        frame_counts: Optional[List[int]] = None) -> str:
+        """
+        Segmentleri concat demuxer ile yeniden kodlamadan birleştirir
+
+        Ses bu son geçişte eklenir: önceden karıştırılmış WAV sadece AAC'ye
+        kodlanır, video stream copy ile geçer.
+
+        Args:
+            frame_counts: Segment frame sayıları; verilirse her segmentin süresi
+                          concat listesine yazılır (değişken frame hızlı segmentler için)
+        """
+        list_path = os.path.join(self.temp_dir, "segments.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for i, segment_path in enumerate(segment_paths):
+                escaped = os.path.abspath(segment_path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+                if frame_counts:
+                    f.write(f"duration {frame_counts[i] / float(self.fps):.6f}\n")
+
+        inputs = ["-f", "concat", "-safe", "0", "-i", list_path]
+        audio_args = []
+        if audio_path:
+            inputs += ["-i", audio_path]
+            audio_args = ["-map", "1:a"] + self.audio_encoder_args()
+
+        run_ffmpeg(inputs + ["-map", "0:v", "-c:v", "copy"] + audio_args + [
+            "-t", f"{total_duration:.6f}",
+            "-movflags", "+faststart",
+            output_path,
+        ])
+        return output_path
+
+    def replace_audio(self, video_path: str, audio_path: str, output_path: str,
+                      total_duration: float) -> str:
+        """
+        Kodlanmış videonun ses izini değiştirir (video stream copy, sadece ses kodlanır)
+
+        Anlatım/müzik değişip görüntü aynı kaldığında tam render yerine kullanılır.
+        """
+        run_ffmpeg([
+            "-i", video_path, "-i", audio_path,
+            "-map", "0:v", "-c:v", "copy",
+            "-map", "1:a",
+        ] + self.audio_encoder_args() + [
+            "-t", f"{total_duration:.6f}",
+            "-movflags", "+faststart",
+            output_path,
+        ])
+        return output_path
+
+    def segment_parameters(self, scene: Dict, frames: int,
+                           rendition: Optional[Dict] = None,
+                           variable_frame_rate: Optional[bool] = None) -> List[str]:
+        """Bir segmentin kodlanmış çıktısını belirleyen parametreler (önbellek anahtarı için)"""
+        still = self.is_still(scene) and variable_frame_rate is not False
+        if still:
+            parameters = [self._still_filter(frames, True)] + \
+                self.video_encoder_args(variable_frame_rate=True) + self.still_segment_args(frames)
+        else:
+            parameters = [self._scene_filter(scene, frames)] + self.video_encoder_args()
+        if rendition is not None:
+            parameters.append(self.rendition_filter(rendition, scene))
+        return parameters
+
+    def render_parallel(self, scenes: List[Dict], output_path: str,
+                        audio_path: Optional[str] = None,
+                        workers: int = 0, segment_cache=None,
+                        intro: Optional[List] = None, outro: Optional[List] = None,
+                        renditions: Optional[List[Dict]] = None) -> str:
+        """
+        Her sahneyi ayrı segment olarak paralel kodlar, sonra stream copy ile birleştirir
+
+        Args:
+            audio_path: Önceden karıştırılmış ses (anlatım + müzik) WAV'ı
+            workers: Aynı anda çalışacak ffmpeg süreci sayısı (0 = CPU sayısı)
+            segment_cache: SegmentCache (verilirse sadece girdisi değişen sahneler kodlanır)
+            intro: Başa eklenecek hazır segmentler [(yol, frame sayısı)] (ör. başlık kartı)
+            outro: Sona eklenecek hazır segmentler [(yol, frame sayısı)] (ör. bitiş kartı)
+            renditions: Ek sürümler (width, height, output_path, opsiyonel intro/outro);
+                        her sahne bir kez oluşturulup tüm sürümlerin segmentlerine kodlanır
+        """
+        counts = self.frame_counts([scene["duration"] for scene in scenes])
+
+        # Akış 0 ana çıktı, diğerleri ek sürümler
+        streams = [{"output_path": output_path, "intro": intro, "outro": outro, "rendition": None}]
+        for rendition in renditions or []:
+            streams.append({
+                "output_path": rendition["output_path"],
+                "intro": rendition.get("intro"),
+                "outro": rendition.get("outro"),
+                "rendition": rendition,
+            })
+
+        segment_dir = os.path.join(self.temp_dir, "segments")
+        os.makedirs(segment_dir, exist_ok=True)
+        segment_paths = [
+            [os.path.join(segment_dir, f"scene_{i:03d}_{k}.mp4") for i in range(1, len(scenes) + 1)]
+            for k in range(len(streams))
+        ]
+
+        # Önbellekte olan sahneleri atla, sadece değişenleri kodla
+        # (bir sahnenin herhangi bir sürümü eksikse sahne tüm sürümleriyle yeniden kodlanır)
+        pending = []
+        cache_keys = {}
+        for i, (scene, frames) in enumerate(zip(scenes, counts)):
+            if segment_cache is not None:
+                keys = [
+                    segment_cache.make_key(
+                        scene["image_path"],
+                        self.segment_parameters(scene, frames, stream["rendition"])
+                    )
+                    for stream in streams
+                ]
+                cached_paths = [segment_cache.get(key) for key in keys]
+                if all(cached_paths):
+                    for k, cached_path in enumerate(cached_paths):
+                        segment_paths[k][i] = cached_path
+                    continue
+                cache_keys[i] = keys
+            pending.append(i)
+
+        if segment_cache is not None:
+            print(f"💾 Segment önbelleği: {len(scenes) - len(pending)} hazır, "
+                  f"{len(pending)} sahne yeniden kodlanacak")
+
+        if pending:
+            cpu_count = os.cpu_count() or 1
+            workers = min(workers or cpu_count, len(pending))
+            # Çekirdekleri süreçler arasında paylaştır (aşırı thread açmamak için)
+            threads = max(cpu_count // workers, 1)
+
+            def encode(i):
+                extra = [
+                    dict(stream["rendition"], output_path=segment_paths[k][i])
+                    for k, stream in enumerate(streams) if k > 0
+                ]
+                return self.render_scene_segment(scenes[i], counts[i], segment_paths[0][i],
+                                                 threads, renditions=extra)
+
+            print(f"⚙️  {len(pending)} sahne {workers} paralel ffmpeg süreciyle kodlanıyor...")
+            # Her iş kendi ffmpeg sürecini başlatır; thread havuzu sadece süreçleri yönetir
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {i: executor.submit(encode, i) for i in pending}
+                for i, future in futures.items():
+                    future.result()
+                    if i in cache_keys:
+                        for k, key in enumerate(cache_keys[i]):
+                            segment_paths[k][i] = segment_cache.put(key, segment_paths[k][i])
+
+        print("🔗 Segmentler birleştiriliyor (stream copy) ve ses ekleniyor...")
+        for k, stream in enumerate(streams):
+            stream_intro = stream["intro"] or []
+            stream_outro = stream["outro"] or []
+            all_paths = [path for path, _ in stream_intro] + segment_paths[k] + \
+                [path for path, _ in stream_outro]
+            all_counts = [frames for _, frames in stream_intro] + counts + \
+                [frames for _, frames in stream_outro]
+            self.concat_segments(
+                all_paths,
+                stream["output_path"],
+                sum(all_counts) / float(self.fps),
+                audio_path,
+                frame_counts=all_counts
+            )
+        return output_path
@@ -0,0 +1,168 @@
+"""
+Ham frame pipe modülü
+Python'da üretilen frame'leri önceden ayrılmış, yeniden kullanılan tamponlardan
+memoryview ile doğrudan ffmpeg'in stdin'ine yazar. Sabit boyutlu bir tampon halkası
+sayesinde frame üretimi ile kodlama örtüşür ve bellek video uzunluğundan bağımsızdır.
+"""
+import queue
+import threading
+import subprocess
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.ffmpeg_renderer import get_ffmpeg_exe
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+
+class FramePipeWriter:
+    def __init__(self, output_path: str, width: int, height: int, fps: int,
+                 video_args: List[str], audio_path: Optional[str] = None,
+                 audio_args: Optional[List[str]] = None, duration: Optional[float] = None,
+                 pix_fmt: str = "rgb24", ring_size: int = 4):
+        """
+        ffmpeg frame pipe'ı
+
+        Args:
+            output_path: Çıktı video yolu
+            width: Frame genişliği
+            height: Frame yüksekliği
+            fps: Frame hızı
+            video_args: Video encoder parametreleri (FFmpegRenderer.video_encoder_args)
+            audio_path: Mux edilecek önceden karıştırılmış ses (opsiyonel)
+            audio_args: Ses encoder parametreleri
+            duration: Çıktı süresi (verilirse ses bu süreye kırpılır)
+            pix_fmt: Pipe piksel formatı: "rgb24" veya "yuv420p" (yarı bant genişliği, OpenCV gerekir)
+            ring_size: Halkadaki tampon sayısı (bellek = ring_size x frame boyutu)
+        """
+        if pix_fmt == "yuv420p" and not CV2_AVAILABLE:
+            print("⚠ yuv420p pipe için OpenCV gerekli, rgb24 kullanılıyor")
+            pix_fmt = "rgb24"
+        if pix_fmt not in ("rgb24", "yuv420p"):
+            raise ValueError(f"Desteklenmeyen pipe piksel formatı: {pix_fmt}")
+
+        self.width = width
+        self.height = height
+        self.pix_fmt = pix_fmt
+        self.frames_written = 0
+
+        if pix_fmt == "rgb24":
+            shape = (height, width, 3)
+        else:
+            # I420 düzlemleri art arda: Y (h satır) + U + V (h/2 satır)
+            shape = (height * 3 // 2, width)
+            self._rgb_scratch = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Boş tamponlar üreticiye, dolu tamponlar yazıcı thread'e gider
+        self._free = queue.Queue()
+        for _ in range(max(ring_size, 2)):
+            self._free.put(np.empty(shape, dtype=np.uint8))
+        self._filled = queue.Queue()
+        self._error = None
+
+        cmd = [
+            get_ffmpeg_exe(), "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", pix_fmt,
+            "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "pipe:0",
+        ]
+        if audio_path:
+            cmd += ["-i", audio_path, "-map", "0:v", "-map", "1:a"] + (audio_args or [])
+        cmd += video_args
+        if duration:
+            cmd += ["-t", f"{duration:.6f}"]
+        cmd += ["-movflags", "+faststart", output_path]
+
+        self._process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _write_loop(self):
+        """Dolu tamponları kopyalamadan pipe'a yazar ve halkaya geri verir"""
+        while True:
+            buffer = self._filled.get()
+            if buffer is None:
+                break
+            try:
+                if self._error is None:
+                    self._process.stdin.write(memoryview(buffer).cast("B"))
+            except (BrokenPipeError, OSError) as e:
+                self._error = e
+            finally:
+                self._free.put(buffer)
+
+    def acquire(self) -> np.ndarray:
+        """
+        Halkadan boş bir tampon alır (hepsi kullanımdaysa yazıcıyı bekler)
+
+        Not: rgb24 modunda tampon (yükseklik, genişlik, 3) boyutundadır
+        ve doğrudan frame üreticisine hedef olarak verilebilir.
+        """
+        buffer = self._free.get()
+        if self._error is not None:
+            self._free.put(buffer)
+            raise RuntimeError(f"ffmpeg pipe kapandı: {self._read_stderr()}")
+        return buffer
+
+    def submit(self, buffer: np.ndarray):
+        """Doldurulmuş tamponu yazma kuyruğuna ekler"""
+        self._filled.put(buffer)
+        self.frames_written += 1
+
+    def render_frame(self, fill: Callable[[np.ndarray], object]):
+        """
+        Bir frame'i halkadaki tampona üretip kuyruğa ekler
+
+        Args:
+            fill: RGB (yükseklik, genişlik, 3) uint8 hedef tamponu dolduran fonksiyon
+        """
+        buffer = self.acquire()
+        if self.pix_fmt == "rgb24":
+            fill(buffer)
+        else:
+            fill(self._rgb_scratch)
+            cv2.cvtColor(self._rgb_scratch, cv2.COLOR_RGB2YUV_I420, dst=buffer)
+        self.submit(buffer)
+
+    def write_frame(self, frame: np.ndarray):
+        """Hazır bir RGB frame'i halkadaki tampona kopyalayıp kuyruğa ekler"""
+        self.render_frame(lambda buffer: np.copyto(buffer, frame))
+
+    def _read_stderr(self) -> str:
+        try:
+            return self._process.stderr.read().decode("utf-8", errors="replace")[-2000:]
+        except Exception:
+            return ""
+
+    def close(self):
+        """Kuyruğu boşaltır, pipe'ı kapatır ve ffmpeg'in bitmesini bekler"""
+        self._filled.put(None)
+        self._writer.join()
+        try:
+            self._process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        stderr = self._read_stderr()
+        returncode = self._process.wait()
+        if returncode != 0 or self._error is not None:
+            raise RuntimeError(f"ffmpeg hatası (kod {returncode}): {stderr}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Hata durumunda yarım çıktıyı bekleme, süreci sonlandır (önce süreç: pipe'ta
+            # bekleyen yazıcı thread kırık pipe hatasıyla çıkar, join takılmaz)
+            self._process.kill()
+            self._filled.put(None)
+            self._writer.join()
+            self._process.wait()
+        return False
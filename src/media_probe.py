@@ -0,0 +1,320 @@
+"""
+Medya bilgisi okuma modülü
+Süre/fps/boyut bilgisini dosyayı çözmeden okur: WAV ve MP4 başlıkları doğrudan
+ayrıştırılır, diğer formatlar için tek bir ffprobe (yoksa ffmpeg -i) çağrısı yapılır.
+Sonuçlar yol + mtime + boyut anahtarıyla önbelleğe alınır.
+"""
+import os
+import re
+import glob
+import json
+import shutil
+import struct
+import threading
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.ffmpeg_renderer import get_ffmpeg_exe
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+MP4_EXTENSIONS = ('.mp4', '.m4a', '.m4v', '.mov')
+
+
+def probe_wav(path: str) -> Dict[str, float]:
+    """WAV (RIFF) başlığından süre ve format bilgisini okur"""
+    file_size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            raise ValueError(f"Geçerli bir WAV dosyası değil: {path}")
+
+        fmt = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                body = f.read(chunk_size + (chunk_size & 1))
+                fmt = struct.unpack('<HHIIHH', body[:16])
+            elif chunk_id == b'data':
+                if fmt is None:
+                    break
+                # Akış halinde yazılmış dosyalarda boyut alanı eksik/yanlış olabilir
+                data_size = min(chunk_size, file_size - f.tell())
+                _, channels, sample_rate, byte_rate, block_align, bits = fmt
+                frames = data_size // block_align if block_align else 0
+                return {
+                    'duration': frames / float(sample_rate),
+                    'sample_rate': sample_rate,
+                    'channels': channels,
+                    'bits_per_sample': bits,
+                    'frames': frames,
+                    'has_audio': True,
+                }
+            else:
+                f.seek(chunk_size + (chunk_size & 1), 1)
+
+    raise ValueError(f"WAV dosyasında fmt/data bölümü bulunamadı: {path}")
+
+
+def _iter_boxes(f, start: int, end: int):
+    """MP4 box'larını (tip, içerik başı, box sonu) olarak dolaşır"""
+    position = start
+    while position + 8 <= end:
+        f.seek(position)
+        size, kind = struct.unpack('>I4s', f.read(8))
+        header_size = 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - position
+        if size < header_size:
+            break
+        yield kind, position + header_size, position + size
+        position += size
+
+
+def _find_box(f, start: int, end: int, kind: bytes):
+    """Verilen aralıkta ilk eşleşen box'ı döndürür"""
+    for box_kind, box_start, box_end in _iter_boxes(f, start, end):
+        if box_kind == kind:
+            return box_start, box_end
+    return None
+
+
+def _read_timing(f, start: int):
+    """mvhd/mdhd box'ından (timescale, duration) okur"""
+    f.seek(start)
+    version = f.read(1)[0]
+    if version == 1:
+        f.seek(start + 4 + 16)
+        timescale, duration = struct.unpack('>IQ', f.read(12))
+    else:
+        f.seek(start + 4 + 8)
+        timescale, duration = struct.unpack('>II', f.read(8))
+    return timescale, duration
+
+
+def probe_mp4(path: str) -> Dict[str, float]:
+    """MP4/MOV başlığından (moov) süre, fps ve boyut bilgisini okur"""
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        moov = _find_box(f, 0, file_size, b'moov')
+        if moov is None:
+            raise ValueError(f"MP4 moov bölümü bulunamadı: {path}")
+
+        mvhd = _find_box(f, moov[0], moov[1], b'mvhd')
+        if mvhd is None:
+            raise ValueError(f"MP4 mvhd bölümü bulunamadı: {path}")
+        timescale, duration = _read_timing(f, mvhd[0])
+        info = {
+            'duration': duration / float(timescale) if timescale else 0.0,
+            'fps': None,
+            'size': None,
+            'has_audio': False,
+            'audio_duration': None,
+            'video_duration': None,
+        }
+
+        for kind, trak_start, trak_end in _iter_boxes(f, moov[0], moov[1]):
+            if kind != b'trak':
+                continue
+            mdia = _find_box(f, trak_start, trak_end, b'mdia')
+            if mdia is None:
+                continue
+            hdlr = _find_box(f, mdia[0], mdia[1], b'hdlr')
+            mdhd = _find_box(f, mdia[0], mdia[1], b'mdhd')
+            if hdlr is None or mdhd is None:
+                continue
+            f.seek(hdlr[0] + 8)
+            handler = f.read(4)
+            track_timescale, track_duration = _read_timing(f, mdhd[0])
+            track_seconds = track_duration / float(track_timescale) if track_timescale else 0.0
+
+            if handler == b'vide' and info['size'] is None:
+                info['video_duration'] = track_seconds
+                tkhd = _find_box(f, trak_start, trak_end, b'tkhd')
+                if tkhd is not None:
+                    # tkhd'nin son 8 byte'ı: genişlik/yükseklik (16.16 sabit nokta)
+                    f.seek(tkhd[1] - 8)
+                    width, height = struct.unpack('>II', f.read(8))
+                    info['size'] = [width >> 16, height >> 16]
+                # stts: (örnek sayısı, örnek süresi) çiftleri. Durağan segmentli videolarda
+                # frame süreleri değişkendir, birleşim noktalarında 1 birimlik DTS aralıkları da
+                # olur; fps en çok frame'in taşıdığı süreden okunur (eşitlikte kısa olan)
+                minf = _find_box(f, mdia[0], mdia[1], b'minf')
+                stbl = _find_box(f, minf[0], minf[1], b'stbl') if minf else None
+                stts = _find_box(f, stbl[0], stbl[1], b'stts') if stbl else None
+                if stts is not None:
+                    f.seek(stts[0] + 4)
+                    entry_count = struct.unpack('>I', f.read(4))[0]
+                    entries = struct.unpack(f'>{entry_count * 2}I', f.read(entry_count * 8))
+                    info['frame_count'] = sum(entries[0::2])
+                    weights = Counter()
+                    for count, delta in zip(entries[0::2], entries[1::2]):
+                        if delta:
+                            weights[delta] += count
+                    if weights and track_timescale:
+                        delta = min(weights, key=lambda value: (-weights[value], value))
+                        info['fps'] = round(track_timescale / float(delta), 3)
+            elif handler == b'soun':
+                info['has_audio'] = True
+                info['audio_duration'] = track_seconds
+
+    return info
+
+
+def probe_ffprobe(path: str) -> Dict[str, float]:
+    """Tek bir ffprobe çağrısıyla bilgi okur (başlığı ayrıştırılamayan formatlar için)"""
+    ffprobe = shutil.which('ffprobe')
+    if not ffprobe:
+        return probe_ffmpeg(path)
+    result = subprocess.run(
+        [ffprobe, '-v', 'error', '-of', 'json', '-show_entries',
+         'format=duration:stream=codec_type,width,height,avg_frame_rate,duration', path],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+    )
+    data = json.loads(result.stdout.decode('utf-8'))
+    info = {
+        'duration': float(data.get('format', {}).get('duration', 0.0)),
+        'fps': None,
+        'size': None,
+        'has_audio': False,
+        'audio_duration': None,
+        'video_duration': None,
+    }
+    for stream in data.get('streams', []):
+        if stream.get('codec_type') == 'video' and info['size'] is None:
+            info['size'] = [stream.get('width'), stream.get('height')]
+            info['video_duration'] = float(stream.get('duration', info['duration']))
+            numerator, _, denominator = stream.get('avg_frame_rate', '0/1').partition('/')
+            if float(denominator or 1):
+                info['fps'] = round(float(numerator) / float(denominator or 1), 3)
+        elif stream.get('codec_type') == 'audio':
+            info['has_audio'] = True
+            info['audio_duration'] = float(stream.get('duration', info['duration']))
+    return info
+
+
+def _parse_timestamp(value: str) -> float:
+    """'SS:DD:SS.ss' biçimindeki süreyi saniyeye çevirir"""
+    hours, minutes, seconds = value.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def probe_ffmpeg(path: str) -> Dict[str, float]:
+    """
+    ffprobe yoksa 'ffmpeg -i' çıktısından bilgi okur
+
+    imageio-ffmpeg sadece ffmpeg binary'sini getirir; dosya çözülmez, sadece başlık
+    özeti ayrıştırılır (frame sayısı bu yolda bilinmez).
+    """
+    result = subprocess.run([get_ffmpeg_exe(), '-hide_banner', '-i', path],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output = result.stderr.decode('utf-8', errors='replace')
+    match = re.search(r'Duration: (\d+:\d+:\d+(?:\.\d+)?)', output)
+    if match is None:
+        raise RuntimeError(f"Medya bilgisi okunamadı: {path}")
+    info = {
+        'duration': _parse_timestamp(match.group(1)),
+        'fps': None,
+        'size': None,
+        'has_audio': False,
+        'audio_duration': None,
+        'video_duration': None,
+    }
+    # Akış satırı ve altındaki metadata (ör. Matroska'nın akış başına DURATION'ı)
+    for block in re.split(r'\n(?=\s*Stream #)', output)[1:]:
+        header = block.splitlines()[0]
+        stream_duration = re.search(r'DURATION\s*:\s*(\d+:\d+:\d+(?:\.\d+)?)', block)
+        seconds = _parse_timestamp(stream_duration.group(1)) if stream_duration else info['duration']
+        if ': Video:' in header and info['size'] is None:
+            size = re.search(r', (\d{2,5})x(\d{2,5})', header)
+            if size:
+                info['size'] = [int(size.group(1)), int(size.group(2))]
+            fps = re.search(r', ([\d.]+) fps', header)
+            if fps:
+                info['fps'] = round(float(fps.group(1)), 3)
+            info['video_duration'] = seconds
+        elif ': Audio:' in header:
+            info['has_audio'] = True
+            info['audio_duration'] = seconds
+    return info
+
+
+def probe(path: str) -> Dict[str, float]:
+    """
+    Medya dosyası bilgisini döndürür (yol + mtime + boyut ile önbellekli)
+
+    Returns:
+        En az 'duration' içeren sözlük (video için 'fps', 'size', 'video_duration';
+        MP4 başlığından okunduysa 'frame_count' de)
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension == '.wav':
+            info = probe_wav(path)
+        elif extension in MP4_EXTENSIONS:
+            info = probe_mp4(path)
+        else:
+            info = probe_ffprobe(path)
+    except (ValueError, struct.error, IndexError):
+        # Başlık beklenmedik yapıdaysa ffprobe'a düş
+        info = probe_ffprobe(path)
+
+    with _cache_lock:
+        _cache[key] = info
+    return dict(info)
+
+
+def remember(path: str, info: Dict[str, float]):
+    """
+    Yazan tarafın zaten bildiği bilgiyi önbelleğe koyar (ör. akışla yazılan TTS sesi);
+    sonraki probe/get_duration çağrıları dosyayı açmaz
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        _cache[key] = dict(info)
+
+
+def get_duration(path: str) -> float:
+    """Medya dosyasının süresini (saniye) döndürür"""
+    return probe(path)['duration']
+
+
+def probe_directory(directory: str, pattern: str = "*",
+                    workers: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Klasördeki dosyaları paralel olarak okur
+
+    Returns:
+        {dosya_yolu: bilgi} sözlüğü (okunamayan dosyalar atlanır)
+    """
+    paths = sorted(p for p in glob.glob(os.path.join(directory, pattern)) if os.path.isfile(p))
+    if not paths:
+        return {}
+
+    def safe_probe(path):
+        try:
+            return probe(path)
+        except Exception as e:
+            print(f"⚠ Medya bilgisi okunamadı: {os.path.basename(path)} ({e})")
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = list(executor.map(safe_probe, paths))
+    return {path: info for path, info in zip(paths, results) if info is not None}
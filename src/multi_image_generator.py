@@ -8,7 +8,7 @@ import json
 import time
 import base64
 from PIL import Image, ImageDraw, ImageFont
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable
 import tempfile
 import io
 
@@ -41,6 +41,10 @@ class MultiImageGenerator:
         # Rate limit kontrolü için son istek zamanı
         self.last_replicate_request_time = 0
         
+        # Sahneler arası bekleme (saniye) ve mevcut görselleri yeniden kullanma (taslak mod)
+        self.request_delay = 1
+        self.reuse_existing = False
+        
         # Karakter yöneticisi (dışarıdan atanacak)
         self.character_manager = None
         
@@ -72,12 +76,25 @@ class MultiImageGenerator:
         
         return available_apis
     
+    def use_draft_images(self):
+        """
+        Taslak mod: images/ klasöründe bu sahne için görsel varsa (önceki çalıştırmadan)
+        yeniden kullanılır, yoksa hiçbir API çağrılmadan placeholder üretilir
+        """
+        self.api_priority = ["placeholder"]
+        self.reuse_existing = True
+        self.request_delay = 0
+    
     def generate_scene_image(self, scene: Dict[str, str], output_filename: str) -> str:
         """Bir sahne için görsel oluşturur - çoklu API desteği + HIBRIT IP-Adapter"""
         prompt = scene['image_prompt']
         output_path = os.path.join(self.images_dir, output_filename)
         scene_number = scene.get('scene_number', 1)
         
+        if self.reuse_existing and os.path.exists(output_path):
+            print(f"♻️  Mevcut görsel kullanılıyor: {output_path}")
+            return output_path
+        
         # Karakter tutarlılığı ekle (Seviye 1: Prompt-based)
         if self.character_manager and 'characters' in scene:
             scene_characters = scene.get('characters', [])
@@ -446,8 +463,14 @@ class MultiImageGenerator:
         
         return lines
     
-    def generate_story_images(self, scenes: List[Dict[str, str]], story_title: str) -> List[str]:
-        """Tüm hikaye için görselleri oluşturur"""
+    def generate_story_images(self, scenes: List[Dict[str, str]], story_title: str,
+                              on_scene_ready: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """
+        Tüm hikaye için görselleri oluşturur
+        
+        on_scene_ready: Her sahnenin görseli hazır olunca (0 tabanlı sıra, yol) ile çağrılır
+        (ör. aşamalı önizleme)
+        """
         image_files = []
         
         print(f"🎨 {story_title} için görseller oluşturuluyor...")
@@ -466,7 +489,8 @@ class MultiImageGenerator:
                 image_files.append(image_path)
                 
                 # API rate limiting için kısa bekleme
-                time.sleep(1)
+                if self.request_delay:
+                    time.sleep(self.request_delay)
                 
             except Exception as e:
                 print(f"✗ Sahne {i} görseli oluşturulamadı: {e}")
@@ -474,6 +498,9 @@ class MultiImageGenerator:
                 fallback_path = os.path.join(self.images_dir, filename)
                 self._generate_placeholder_image(scene['image_prompt'], fallback_path, i)
                 image_files.append(fallback_path)
+            
+            if on_scene_ready:
+                on_scene_ready(i - 1, image_files[-1])
         
         print(f"✅ {len(image_files)} görsel oluşturuldu")
         return image_files
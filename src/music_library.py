@@ -0,0 +1,173 @@
+"""
+Fon müziği kütüphanesi
+Her parçayı bir kez proje örnekleme hızında PCM'e çözer, ses seviyesini normalize eder
+ve bellek eşlemeli (.npy) olarak saklar. İndeks süre ve ses seviyesini tutar; dosya
+eklendikçe veya değiştikçe sadece o parçalar yeniden çözülür. Render'lar MP3 çözmeden
+doğrudan mmap'ten karıştırır.
+"""
+import os
+import json
+import glob
+import random
+import hashlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.audio_mixer import decode_audio, SAMPLE_RATE, CHANNELS
+
+# Normalize edilen hedef ortalama (RMS) ses seviyesi (masterlanmış müziğin tipik seviyesi;
+# VideoCreator'ın müzik kazancı bu seviyeye göre uygulanır)
+TARGET_LOUDNESS_DBFS = -16.0
+
+
+def loudness_dbfs(samples: np.ndarray, block: int = SAMPLE_RATE * 10) -> float:
+    """int16 PCM'in RMS ses seviyesini dBFS olarak döndürür (blok blok, float kopyası sınırlı)"""
+    if len(samples) == 0:
+        return float("-inf")
+    total = 0.0
+    for start in range(0, len(samples), block):
+        chunk = samples[start:start + block].astype(np.float64)
+        total += float(np.square(chunk).sum())
+    rms = np.sqrt(total / samples.size)
+    return float(20.0 * np.log10(max(rms, 1e-9) / 32768.0))
+
+
+class MusicLibrary:
+    def __init__(self, music_dir: str = "musics", cache_dir: str = os.path.join("cache", "music"),
+                 sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS,
+                 target_dbfs: float = TARGET_LOUDNESS_DBFS):
+        """
+        Müzik kütüphanesi
+
+        Args:
+            music_dir: Fon müziklerinin (.mp3) bulunduğu klasör
+            cache_dir: Çözülmüş PCM ve indeksin saklanacağı klasör (cleanup_folders dokunmaz;
+                       ilk parça çözülürken oluşturulur)
+            sample_rate: Proje örnekleme hızı
+            channels: Kanal sayısı
+            target_dbfs: Normalize edilen ortalama ses seviyesi
+        """
+        self.music_dir = music_dir
+        self.cache_dir = cache_dir
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.target_dbfs = target_dbfs
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def _is_fresh(self, path: str, entry: Optional[Dict]) -> bool:
+        """İndeks kaydı dosyanın şu anki haliyle (boyut, değişiklik zamanı) eşleşiyor mu"""
+        if not entry:
+            return False
+        stat = os.stat(path)
+        return (entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["sample_rate"] == self.sample_rate and entry["channels"] == self.channels
+                and entry["target_dbfs"] == self.target_dbfs
+                and os.path.exists(os.path.join(self.cache_dir, entry["pcm"])))
+
+    def _decode(self, path: str) -> Dict:
+        """Parçayı çözüp normalize eder ve .npy olarak yazar"""
+        stat = os.stat(path)
+        samples = decode_audio(path, self.sample_rate, self.channels)
+        loudness = loudness_dbfs(samples)
+        gain = float(10 ** ((self.target_dbfs - loudness) / 20.0)) if np.isfinite(loudness) else 1.0
+
+        normalized = np.empty_like(samples)
+        block = self.sample_rate * 10
+        for start in range(0, len(samples), block):
+            chunk = samples[start:start + block].astype(np.float32) * gain
+            np.clip(chunk, -32768, 32767, out=chunk)
+            normalized[start:start + block] = chunk
+
+        name = hashlib.sha256(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:24]
+        pcm_path = os.path.join(self.cache_dir, f"{name}.npy")
+        temp_path = f"{pcm_path}.{os.getpid()}.tmp"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            np.save(f, normalized)
+        os.replace(temp_path, pcm_path)
+
+        print(f"🎵 Müzik kütüphanesine eklendi: {os.path.basename(path)} "
+              f"({len(samples) / float(self.sample_rate):.1f}s, {loudness:.1f} dBFS)")
+        return {
+            "pcm": os.path.basename(pcm_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "target_dbfs": self.target_dbfs,
+            "duration": len(samples) / float(self.sample_rate),
+            "loudness_dbfs": loudness,
+            "gain": gain,
+        }
+
+    def _entry(self, path: str) -> Dict:
+        """Parçanın indeks kaydını döndürür, yoksa veya eskiyse çözer"""
+        key = os.path.abspath(path)
+        entry = self._index.get(key)
+        if not self._is_fresh(path, entry):
+            if entry:
+                self._remove_pcm(entry)
+            entry = self._index[key] = self._decode(path)
+            self._save_index()
+        return entry
+
+    def _remove_pcm(self, entry: Dict):
+        try:
+            os.remove(os.path.join(self.cache_dir, entry["pcm"]))
+        except OSError:
+            pass
+
+    def refresh(self) -> List[str]:
+        """
+        Müzik klasörünü tarar; yeni veya değişen parçaları çözer, silinenleri indeksten çıkarır
+
+        Returns:
+            Kütüphanedeki parçalar (sıralı)
+        """
+        tracks = sorted(glob.glob(os.path.join(self.music_dir, "*.mp3")))
+        for path in tracks:
+            self._entry(path)
+
+        music_root = os.path.abspath(self.music_dir)
+        removed = [key for key in self._index
+                   if os.path.dirname(key) == music_root and not os.path.exists(key)]
+        for key in removed:
+            self._remove_pcm(self._index.pop(key))
+        if removed:
+            self._save_index()
+        return tracks
+
+    def choose(self, seed: str = None) -> Optional[str]:
+        """Tohuma göre deterministik parça seçer (aynı hikaye hep aynı müziği alır; yoksa None)"""
+        tracks = self.refresh()
+        if not tracks:
+            return None
+        return random.Random(seed).choice(tracks)
+
+    def info(self, path: str) -> Dict:
+        """Parçanın süresi ve ses seviyesi bilgisi"""
+        return dict(self._entry(path))
+
+    def samples(self, path: str) -> np.ndarray:
+        """
+        Parçanın normalize edilmiş PCM'ini bellek eşlemeli (örnek, kanal) int16 dizi olarak döndürür
+
+        Not: Dizi salt okunurdur; sadece karıştırmada okunan sayfalar belleğe gelir.
+        """
+        entry = self._entry(path)
+        return np.load(os.path.join(self.cache_dir, entry["pcm"]), mmap_mode="r")
@@ -3,13 +3,91 @@ OpenAI TTS-1 HD API ile Text-to-Speech
 Yüksek kaliteli, doğal sesli anlatım için OpenAI API kullanır
 """
 import os
+import re
+import time
+import wave
 import hashlib
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Callable, Optional
 from openai import OpenAI
 from pydub import AudioSegment
+from src.media_probe import get_duration, remember
+from src.rate_limiter import RateLimiter
+from src.tts_cache import cache_from_config
+from src.audio_mixer import PCMWavWriter
+
+# OpenAI TTS 'pcm' yanıtı: başlıksız 24 kHz, 16-bit, mono
+OPENAI_PCM_SAMPLE_RATE = 24000
+# Akıştan okunan parça boyutu (sahne başına bellek bununla sınırlı, ses uzunluğundan bağımsız)
+STREAM_CHUNK_SIZE = 64 * 1024
+# API'nin kabul ettiği en uzun metin (karakter)
+OPENAI_TTS_MAX_CHARS = 4096
+
+# Cümle: bitiş noktalaması (. ! ? …) ve ardından gelen kapanış tırnak/parantezleri dahil
+_SENTENCE_PATTERN = re.compile(r'[^.!?…]+(?:[.!?…]+["\'”’»)]*|$)|[.!?…]+')
+# Uzun cümle bölünürken tercih edilen ara noktalama
+_CLAUSE_PATTERN = re.compile(r'[^,;:]+(?:[,;:]+|$)|[,;:]+')
+
+
+def _pack(pieces: List[str], max_chars: int) -> List[str]:
+    """Parçaları sırayı bozmadan sınırı aşmayacak şekilde birleştirir"""
+    chunks = []
+    current = ""
+    for piece in pieces:
+        candidate = f"{current} {piece}" if current else piece
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            if current:
+                chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Sınırı aşan tek cümleyi önce virgül/noktalı virgülden, sonra kelimelerden böler"""
+    pieces = []
+    for clause in (part.strip() for part in _CLAUSE_PATTERN.findall(sentence)):
+        if not clause:
+            continue
+        if len(clause) <= max_chars:
+            pieces.append(clause)
+            continue
+        for word in clause.split():
+            # Tek kelime bile sınırı aşıyorsa (ör. uzun URL) sert kesilir
+            pieces.extend(word[i:i + max_chars] for i in range(0, len(word), max_chars))
+    return _pack(pieces, max_chars)
+
+
+def split_text(text: str, max_chars: int = OPENAI_TTS_MAX_CHARS) -> List[str]:
+    """
+    Metni cümle sınırlarından, her biri max_chars'ı aşmayan parçalara böler
+
+    Cümleler sırayla en doldurucu şekilde birleştirilir; tek başına sınırı aşan cümle
+    ara noktalamadan ve gerekirse kelimelerden bölünür. Sınıra sığan metin tek parçadır.
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces = []
+    for sentence in (part.strip() for part in _SENTENCE_PATTERN.findall(text)):
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+        else:
+            pieces.extend(_split_long(sentence, max_chars))
+    return _pack(pieces, max_chars)
+
 
 class OpenAITTSGenerator:
-    def __init__(self, api_key: str, voice="alloy", language="tr", speed=1.0):
+    def __init__(self, api_key: str, voice="alloy", language="tr", speed=1.0,
+                 max_workers: int = None, requests_per_minute: int = None, max_retries: int = None,
+                 max_chars: int = None, sentence_gap: float = None):
         """
         OpenAI TTS Generator
         
@@ -18,13 +96,43 @@ class OpenAITTSGenerator:
             voice: Ses seçeneği (alloy, echo, fable, onyx, nova, shimmer)
             language: Dil kodu (tr, en, vb.)
             speed: Konuşma hızı (0.25 - 4.0 arası, 1.0 normal)
+            max_workers: Aynı anda seslendirilen sahne sayısı (verilmezse Config.OPENAI_TTS_WORKERS)
+            requests_per_minute: Dakikadaki en fazla istek (verilmezse Config.OPENAI_TTS_RPM)
+            max_retries: Başarısız sahne için tekrar deneme sayısı (verilmezse Config.OPENAI_TTS_MAX_RETRIES)
+            max_chars: İstek başına en uzun metin; uzun sahneler cümlelerden bölünür
+                       (verilmezse Config.OPENAI_TTS_MAX_CHARS)
+            sentence_gap: Bölünmüş sahnede parçalar arasına eklenen sessizlik (saniye;
+                          verilmezse Config.OPENAI_TTS_SENTENCE_GAP)
         """
         self.client = OpenAI(api_key=api_key)
         self.voice = voice
         self.language = language
         self.speed = speed
+        self.model = "tts-1-hd"
         self.audio_dir = "audio"
         
+        # Her ayar ayrı okunur: eski bir config'de eksik olan anahtar sadece kendi varsayılanına düşer
+        try:
+            from config.config import Config
+        except ImportError:
+            Config = None
+        default_workers = getattr(Config, 'OPENAI_TTS_WORKERS', 4)
+        default_rpm = getattr(Config, 'OPENAI_TTS_RPM', 50)
+        default_retries = getattr(Config, 'OPENAI_TTS_MAX_RETRIES', 3)
+        default_max_chars = getattr(Config, 'OPENAI_TTS_MAX_CHARS', OPENAI_TTS_MAX_CHARS)
+        default_gap = getattr(Config, 'OPENAI_TTS_SENTENCE_GAP', 0.2)
+        self.max_workers = max(1, max_workers or default_workers)
+        self.max_retries = default_retries if max_retries is None else max_retries
+        self.max_chars = min(max_chars or default_max_chars, OPENAI_TTS_MAX_CHARS)
+        self.sentence_gap = default_gap if sentence_gap is None else sentence_gap
+        self.rate_limiter = RateLimiter(requests_per_minute or default_rpm)
+        # Sahneler ve bölünmüş sahnelerin parçaları aynı istek yuvalarını paylaşır;
+        # aynı anda açık API isteği hiçbir zaman max_workers'ı aşmaz
+        self._request_slots = threading.BoundedSemaphore(self.max_workers)
+        
+        # İçerik adresli TTS önbelleği (TTSGenerator ile ortak)
+        self.cache = cache_from_config()
+        
         # Klasör oluştur
         os.makedirs(self.audio_dir, exist_ok=True)
         
@@ -44,68 +152,169 @@ class OpenAITTSGenerator:
         text = scene['text']
         output_path = os.path.join(self.audio_dir, output_filename)
         
-        try:
-            # OpenAI TTS-1 HD ile ses üret
-            response = self.client.audio.speech.create(
-                model="tts-1-hd",  # Yüksek kalite model
+        if self.cache is None:
+            return self._synthesize(text, output_path)
+        model = self.model
+        if len(split_text(text, self.max_chars)) > 1:
+            # Bölünmüş sahnenin sesi parça sınırına ve boşluğa da bağlı
+            model = f"{self.model}|{self.max_chars}|{self.sentence_gap}"
+        key = self.cache.make_key(
+            "openai", text,
+            model=model,
+            voice=self.voice,
+            speed=self.speed,
+            language=self.language
+        )
+        return self.cache.get_or_create(key, output_path, lambda path: self._synthesize(text, path))
+    
+    def _stream_pcm(self, text: str, write: Callable[[bytes], None]):
+        """
+        Tek API isteği (paylaşılan istek yuvası ve RPM sınırıyla); ham PCM akışını
+        parça parça write'a verir
+        """
+        with self._request_slots:
+            self.rate_limiter.acquire()
+            with self.client.audio.speech.with_streaming_response.create(
+                model=self.model,  # Yüksek kalite model
                 voice=self.voice,
                 input=text,
-                speed=self.speed
-            )
-            
-            # MP3 olarak kaydet
-            mp3_path = output_path.replace('.wav', '.mp3')
-            response.stream_to_file(mp3_path)
-            
-            # MP3'ü WAV'a dönüştür (video işleme için)
-            audio = AudioSegment.from_mp3(mp3_path)
-            audio.export(output_path, format="wav")
+                speed=self.speed,
+                response_format="pcm"
+            ) as response:
+                for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                    write(chunk)
+    
+    def _synthesize_parts(self, parts: List[str], part_paths: List[str]):
+        """
+        Bölünmüş sahnenin parçalarını paralel seslendirir; her parça kendi geçici WAV'ına
+        akar. Eşzamanlılık istek yuvalarıyla sınırlıdır.
+        """
+        def synthesize_part(i):
+            # PCMWavWriter yarım kalan örneği yazmaz; parça örnek sınırında biter
+            with PCMWavWriter(part_paths[i], OPENAI_PCM_SAMPLE_RATE) as writer:
+                self._stream_pcm(parts[i], writer.write)
+        
+        with ThreadPoolExecutor(max_workers=min(len(parts), self.max_workers)) as executor:
+            list(executor.map(synthesize_part, range(len(parts))))
+    
+    def _synthesize(self, text: str, output_path: str) -> str:
+        """
+        API'den sentez yapar (önbellekte olan sahneler buraya gelmez)
+        
+        Sınıra sığan metin tek istekle doğrudan WAV'a akar. Uzun metin cümlelerden
+        bölünür, parçalar paralel olarak geçici WAV'lara akar ve aralarına tam
+        sentence_gap kadar sessiz örnek konarak örnek hassasiyetinde tek WAV'a
+        birleştirilir (bellekte her an en fazla bir akış parçası tutulur).
+        """
+        output_filename = os.path.basename(output_path)
+        parts = split_text(text, self.max_chars)
+        part_paths = [f"{output_path}.part{i:02d}.wav" for i in range(len(parts))] if len(parts) > 1 else []
+        try:
+            if len(parts) == 1:
+                # OpenAI TTS-1 HD ile ses üret; ham PCM akışı parça parça WAV'a yazılır
+                # (yanıtın tamamı beklenmez, MP3 ara dosyası ve çözme yok)
+                with PCMWavWriter(output_path, OPENAI_PCM_SAMPLE_RATE) as writer:
+                    self._stream_pcm(text, writer.write)
+            else:
+                print(f"   ✂️  {output_filename}: {len(text)} karakter, {len(parts)} parçada paralel seslendiriliyor")
+                self._synthesize_parts(parts, part_paths)
+                silence = b"\0\0" * int(round(self.sentence_gap * OPENAI_PCM_SAMPLE_RATE))
+                chunk_frames = STREAM_CHUNK_SIZE // 2
+                with PCMWavWriter(output_path, OPENAI_PCM_SAMPLE_RATE) as writer:
+                    for i, part_path in enumerate(part_paths):
+                        if i > 0:
+                            writer.write(silence)
+                        with wave.open(part_path, 'rb') as part:
+                            for _ in range(0, part.getnframes(), chunk_frames):
+                                writer.write(part.readframes(chunk_frames))
             
-            # MP3'ü sil
-            os.unlink(mp3_path)
+            # Süre yazılan örneklerden kesin olarak bilinir; zaman çizelgesi dosyayı yeniden okumaz
+            remember(output_path, writer.info())
             
-            print(f"✓ OpenAI TTS ses dosyası oluşturuldu: {output_filename}")
+            print(f"✓ OpenAI TTS ses dosyası oluşturuldu: {output_filename} ({writer.duration:.2f}s)")
             return output_path
             
         except Exception as e:
             print(f"✗ OpenAI TTS hatası: {e}")
+            # Yarım kalan akış sahne sesi olarak kalmasın (tekrar denemede baştan yazılır)
+            if os.path.exists(output_path):
+                os.remove(output_path)
             raise
+        finally:
+            for part_path in part_paths:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
     
-    def generate_story_audio(self, scenes: List[Dict[str, str]], story_title: str) -> List[str]:
+    def generate_story_audio(self, scenes: List[Dict[str, str]], story_title: str,
+                             on_scene_ready: Optional[Callable[[int, str], None]] = None) -> List[str]:
         """
         Tüm hikaye için ses dosyalarını oluşturur
         
         Args:
             scenes: Sahne listesi
             story_title: Hikaye başlığı
+            on_scene_ready: Her sahnenin sesi hazır olunca (0 tabanlı sıra, yol) ile çağrılır
         
         Returns:
             Oluşturulan ses dosyalarının yol listesi
         """
-        audio_files = []
+        audio_files = [None] * len(scenes)
         
         print(f"🎤 OpenAI TTS-1 HD ile {story_title} seslendiriliyor...")
-        print(f"   Ses: {self.voice} | Hız: {self.speed}")
+        print(f"   Ses: {self.voice} | Hız: {self.speed} | Paralel: {self.max_workers}")
         
         # Kısa bir hikaye ID'si oluştur (dosya adı çok uzun olmasın)
         story_hash = hashlib.md5(story_title.encode()).hexdigest()[:8]
         
-        for i, scene in enumerate(scenes, 1):
-            # Kısa dosya adı kullan
-            filename = f"story_{story_hash}_scene_{i:02d}.wav"
+        # Sahneler sınırlı sayıda işçiyle paralel seslendirilir; dosya adları sıraya göre
+        # belirlendiği için çıktı sırası tamamlanma sırasından bağımsızdır
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for i, scene in enumerate(scenes, 1):
+                # Kısa dosya adı kullan
+                filename = f"story_{story_hash}_scene_{i:02d}.wav"
+                futures[executor.submit(self._generate_with_retry, scene, filename, i, len(scenes))] = i
             
-            print(f"   [{i}/{len(scenes)}] Sahne {i} seslendiriliyor...")
-            audio_path = self.generate_scene_audio(scene, filename)
-            audio_files.append(audio_path)
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    audio_files[i - 1] = future.result()
+                    if on_scene_ready:
+                        on_scene_ready(i - 1, audio_files[i - 1])
+            except Exception:
+                # Kalıcı hata: henüz başlamamış sahneler iptal edilir
+                for future in futures:
+                    future.cancel()
+                raise
         
         print(f"✓ {len(audio_files)} OpenAI TTS ses dosyası oluşturuldu")
+        if self.cache:
+            self.cache.report()
         return audio_files
     
+    def _generate_with_retry(self, scene: Dict[str, str], output_filename: str,
+                             scene_number: int, scene_count: int) -> str:
+        """
+        Tek sahneyi seslendirir; hata olursa sadece bu sahne artan beklemeyle
+        (1, 2, 4... saniye) yeniden denenir
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                print(f"   [{scene_number}/{scene_count}] Sahne {scene_number} seslendiriliyor...")
+                return self.generate_scene_audio(scene, output_filename)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = 2 ** attempt
+                print(f"   🔄 Sahne {scene_number} tekrar denenecek ({attempt + 1}/{self.max_retries}, "
+                      f"{delay}s sonra): {e}")
+                time.sleep(delay)
+    
     def get_audio_duration(self, audio_path: str) -> float:
         """Ses dosyasının süresini döndürür (saniye)"""
         try:
-            audio = AudioSegment.from_wav(audio_path)
-            return len(audio) / 1000.0  # millisecond to second
+            # WAV başlığından okunur, dosya çözülmez
+            return get_duration(audio_path)
         except Exception as e:
             print(f"✗ Ses dosyası süresi alınamadı: {e}")
             return 5.0  # Varsayılan süre
@@ -0,0 +1,169 @@
+"""
+Aşamalı önizleme modülü
+Üretim sürerken sesi ve görseli hazır olan sahneleri sırayla düşük çözünürlüklü,
+hızlı kodlanmış fMP4 HLS segmentlerine çevirip büyüyen bir oynatma listesine ekler.
+Editörler tüm TTS, görseller ve 1080p render bitmeden ilk sahneleri izleyebilir.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.ffmpeg_renderer import run_ffmpeg
+from src.media_probe import get_duration
+
+# Segmentler en fazla SEGMENT_SECONDS + bir GOP uzunluğunda olur; hedef süre sabit kalmalı
+SEGMENT_SECONDS = 6
+GOP_SECONDS = 2
+TARGET_DURATION = 10
+
+
+class ProgressivePreview:
+    def __init__(self, output_dir: str, name: str, scene_count: int,
+                 width: int = 640, height: int = 360, fps: int = 24, crf: int = 30):
+        """
+        Aşamalı HLS önizlemesi
+
+        Args:
+            output_dir: Önizleme klasörü (oynatma listesi + segmentler)
+            name: Oynatma listesi adı (<name>.m3u8)
+            scene_count: Toplam sahne sayısı (son sahne eklenince liste kapatılır)
+            width: Önizleme genişliği
+            height: Önizleme yüksekliği
+            fps: Frame hızı
+            crf: x264 kalitesi (önizleme için düşük tutulur)
+        """
+        self.output_dir = output_dir
+        self.scene_count = scene_count
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.crf = crf
+        self.playlist_path = os.path.join(output_dir, f"{name}.m3u8")
+
+        self._audio: Dict[int, str] = {}
+        self._images: Dict[int, str] = {}
+        self._next_scene = 0
+        self._elapsed_seconds = 0.0
+        self._elapsed_frames = 0
+        self._entries = []
+        self._lock = threading.Lock()
+        # Segmentler sırayla tek işçide kodlanır; üreticiler (TTS/görsel) beklemez
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = []
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._write_playlist(finished=False)
+
+    def add_audio(self, index: int, audio_path: str):
+        """Sahnenin sesi hazır (index: 0 tabanlı sahne sırası)"""
+        with self._lock:
+            self._audio[index] = audio_path
+            self._schedule_ready()
+
+    def add_image(self, index: int, image_path: str):
+        """Sahnenin görseli hazır (index: 0 tabanlı sahne sırası)"""
+        with self._lock:
+            self._images[index] = image_path
+            self._schedule_ready()
+
+    def _schedule_ready(self):
+        """Sıradaki sahneler hazırsa kodlama kuyruğuna ekler (sıra bozulmaz)"""
+        while self._next_scene in self._audio and self._next_scene in self._images:
+            index = self._next_scene
+            self._next_scene += 1
+            self._pending.append(self._executor.submit(
+                self._encode_scene, index, self._images[index], self._audio[index]
+            ))
+
+    def _encode_scene(self, index: int, image_path: str, audio_path: str):
+        try:
+            # Sahne sınırları kümülatif olarak frame'e oturtulur (ana render ile aynı mantık)
+            start_frame = self._elapsed_frames
+            self._elapsed_seconds += get_duration(audio_path)
+            end_frame = max(int(round(self._elapsed_seconds * self.fps)), start_frame + 1)
+            frames = end_frame - start_frame
+            self._elapsed_frames = end_frame
+
+            prefix = f"scene_{index + 1:03d}"
+            scene_playlist = os.path.join(self.output_dir, f"{prefix}.m3u8")
+            scale = (f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,"
+                     f"pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2,setsar=1,format=yuv420p")
+            run_ffmpeg([
+                "-loop", "1", "-framerate", str(self.fps), "-i", image_path,
+                "-i", audio_path,
+                "-filter_complex", f"[0:v]{scale}[v];[1:a]apad[a]",
+                "-map", "[v]", "-map", "[a]",
+                "-c:v", "libx264", "-preset", "ultrafast", "-tune", "stillimage",
+                "-crf", str(self.crf), "-g", str(self.fps * GOP_SECONDS),
+                "-c:a", "aac", "-b:a", "96k", "-ac", "2", "-ar", "44100",
+                "-frames:v", str(frames), "-t", f"{frames / float(self.fps):.6f}",
+                "-f", "hls", "-hls_segment_type", "fmp4", "-hls_time", str(SEGMENT_SECONDS),
+                "-hls_playlist_type", "vod",
+                "-hls_fmp4_init_filename", f"{prefix}_init.mp4",
+                "-hls_segment_filename", os.path.join(self.output_dir, f"{prefix}_%03d.m4s"),
+                scene_playlist,
+            ])
+
+            # Sahnenin kendi oynatma listesinden segmentleri ve sürelerini al
+            segments = []
+            with open(scene_playlist, "r", encoding="utf-8") as f:
+                duration = None
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("#EXTINF:"):
+                        duration = float(line[len("#EXTINF:"):].split(",")[0])
+                    elif line and not line.startswith("#") and duration is not None:
+                        segments.append((line, duration))
+                        duration = None
+            os.remove(scene_playlist)
+
+            with self._lock:
+                for k, (segment_name, duration) in enumerate(segments):
+                    # Her sahne ayrı kodlanır (zaman damgaları 0'dan başlar): ilk segmentinden
+                    # önce kesinti ve sahnenin kendi init segmenti bildirilir
+                    self._entries.append((segment_name, duration, f"{prefix}_init.mp4" if k == 0 else None))
+                self._write_playlist(finished=index + 1 >= self.scene_count)
+            print(f"👀 Önizlemeye eklendi: sahne {index + 1}/{self.scene_count} "
+                  f"({frames / float(self.fps):.1f}s) → {self.playlist_path}")
+        except Exception as e:
+            print(f"⚠ Önizleme segmenti oluşturulamadı (sahne {index + 1}): {e}")
+
+    def _write_playlist(self, finished: bool):
+        """Oynatma listesini atomik olarak yeniden yazar (EVENT: sadece sona ekleme yapılır)"""
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:7",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+            f"#EXT-X-TARGETDURATION:{TARGET_DURATION}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        for i, (segment_name, duration, init_segment) in enumerate(self._entries):
+            if init_segment:
+                if i > 0:
+                    lines.append("#EXT-X-DISCONTINUITY")
+                lines.append(f'#EXT-X-MAP:URI="{init_segment}"')
+            lines.append(f"#EXTINF:{duration:.6f},")
+            lines.append(segment_name)
+        if finished:
+            lines.append("#EXT-X-ENDLIST")
+
+        temp_path = f"{self.playlist_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.playlist_path)
+
+    def close(self, wait: bool = True) -> Optional[str]:
+        """
+        Kuyruktaki segmentlerin bitmesini bekler ve oynatma listesini kapatır
+
+        Returns:
+            Oynatma listesi yolu
+        """
+        for future in list(self._pending):
+            if wait:
+                future.result()
+        self._executor.shutdown(wait=wait)
+        with self._lock:
+            self._write_playlist(finished=True)
+        return self.playlist_path
@@ -0,0 +1,37 @@
+"""
+İstek hızı sınırlayıcı
+Paralel API çağrılarını dakikadaki istek sayısı (RPM) limitinin altında tutar
+"""
+import time
+import threading
+from collections import deque
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: int, period: float = 60.0):
+        """
+        Kayan pencereli istek sınırlayıcı (thread-safe)
+
+        Args:
+            requests_per_minute: Pencere başına izin verilen istek (0/None = sınırsız)
+            period: Pencere uzunluğu (saniye)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Pencerede yer açılana kadar bekler ve isteği kaydeder"""
+        if not self.requests_per_minute:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.requests_per_minute:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(max(wait, 0.01))
@@ -0,0 +1,93 @@
+"""
+Sahne kaynağı penceresi
+Sahne görsellerini (ZoomEngine) sırayla açar ve aynı anda en fazla N tanesini
+bellekte tutar; yazılması biten sahne hemen serbest bırakılır, sıradakiler arka
+planda önceden hazırlanır. Bellek ve dosya tanıtıcısı sahne sayısından bağımsızdır.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Tuple
+
+from src.zoom_engine import ZoomEngine
+
+
+class SceneSourceWindow:
+    def __init__(self, scenes: List[Dict], size: Tuple[int, int] = (1920, 1080),
+                 max_open: int = 2):
+        """
+        Sahne kaynağı penceresi
+
+        Args:
+            scenes: image_path, duration, start_scale, end_scale içeren sahneler
+            size: Frame boyutu (genişlik, yükseklik)
+            max_open: Aynı anda açık tutulacak en fazla sahne sayısı
+                      (1'den büyükse sıradaki sahneler arka planda hazırlanır)
+        """
+        self.scenes = scenes
+        self.size = size
+        self.max_open = max(max_open, 1)
+        self._open = OrderedDict()  # sahne indeksi -> Future[ZoomEngine]
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if self.max_open > 1 else None
+
+    def _load(self, index: int) -> ZoomEngine:
+        scene = self.scenes[index]
+        return ZoomEngine.from_path(
+            scene["image_path"],
+            size=self.size,
+            start_scale=scene.get("start_scale", 1.0),
+            end_scale=scene.get("end_scale", 1.0),
+            duration=scene["duration"]
+        )
+
+    def _schedule(self, index: int):
+        """Sahneyi (pencerede yer varsa) arka planda açmaya başlar"""
+        if index in self._open or index >= len(self.scenes) or len(self._open) >= self.max_open:
+            return
+        if self._executor is not None:
+            self._open[index] = self._executor.submit(self._load, index)
+        else:
+            future = Future()
+            future.set_result(self._load(index))
+            self._open[index] = future
+
+    def get(self, index: int) -> ZoomEngine:
+        """
+        Sahnenin zoom motorunu döndürür
+
+        Önceki sahneler yazılmış sayılır ve serbest bırakılır; geriye dönük bir
+        istek gelirse sahne yeniden açılır (sonuç yine doğrudur, sadece daha yavaştır).
+        """
+        with self._lock:
+            for opened in list(self._open):
+                # Pencere: [index, index + max_open); dışında kalanlar bırakılır
+                if opened < index or opened >= index + self.max_open:
+                    self._release(opened)
+            self._schedule(index)
+            future = self._open[index]
+            for upcoming in range(index + 1, index + self.max_open):
+                self._schedule(upcoming)
+        return future.result()
+
+    def _release(self, index: int):
+        future = self._open.pop(index, None)
+        if future is not None and not future.cancel():
+            # Hazırlanmakta olan sahnenin bitmesini bekleyip referansı bırak
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    @property
+    def open_count(self) -> int:
+        """Şu an açık (veya hazırlanmakta) olan sahne sayısı"""
+        return len(self._open)
+
+    def close(self):
+        """Tüm açık sahneleri serbest bırakır"""
+        with self._lock:
+            for index in list(self._open):
+                self._release(index)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
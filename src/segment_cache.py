@@ -0,0 +1,82 @@
+"""
+Sahne segment önbelleği
+Kodlanmış sahne segmentlerini girdilerin içerik hash'i altında diskte saklar;
+tekrar çalıştırmada sadece girdisi değişen sahneler yeniden kodlanır
+"""
+import os
+import shutil
+import hashlib
+from typing import List, Optional
+
+
+def file_digest(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Dosya içeriğinin SHA-256 özetini döndürür"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SegmentCache:
+    def __init__(self, cache_dir: str = os.path.join("cache", "segments")):
+        """
+        Segment önbelleği
+
+        Args:
+            cache_dir: Segmentlerin saklanacağı klasör (cleanup_folders bu klasöre dokunmaz;
+                       ilk segment kaydedilirken oluşturulur)
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, image_path: str, parameters: List[str]) -> str:
+        """
+        Segment anahtarını oluşturur
+
+        Sahne sesi anahtara girmez: segment sessizdir ve sesin etkisi (süre) frame
+        sayısı olarak parametrelerde yer alır. Anlatım değişse de süresi aynı kalan
+        sahneler yeniden kodlanmaz.
+
+        Args:
+            image_path: Sahne görseli (içeriği hash'lenir)
+            parameters: Zoom filtresi, frame sayısı ve encoder ayarları gibi metinsel parametreler
+        """
+        digest = hashlib.sha256()
+        digest.update(file_digest(image_path).encode())
+        for parameter in parameters:
+            digest.update(b"\0" + str(parameter).encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Anahtarın önbellekteki dosya yolunu döndürür"""
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def get(self, key: str) -> Optional[str]:
+        """Önbellekte varsa segment yolunu döndürür"""
+        path = self.path_for(key)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    def put(self, key: str, segment_path: str) -> str:
+        """
+        Kodlanmış segmenti önbelleğe taşır
+
+        Yarım kalmış yazımlar önbelleğe girmesin diye önce geçici isimle kopyalanır,
+        sonra atomik olarak yeniden adlandırılır.
+        """
+        path = self.path_for(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        shutil.copyfile(segment_path, temp_path)
+        os.replace(temp_path, path)
+        return path
+
+    def clear(self):
+        """Önbellekteki tüm segmentleri siler"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        print("✓ Segment önbelleği temizlendi")
@@ -0,0 +1,174 @@
+"""
+Zaman çizelgesi (edit decision list) modülü
+Hikayenin render için gereken her şeyini tek bir küçük nesnede toplar: frame'e
+oturtulmuş sahne sınırları, görsel yolları, zoom parametreleri, geçiş, kartlar ve
+tek bir ana anlatım WAV'ı. Çıktının yanına JSON olarak kaydedilir; kaydedilen
+dosyadan başka hiçbir pipeline durumu olmadan yeniden render edilebilir.
+"""
+import os
+import json
+from typing import List, Dict, Optional
+
+TIMELINE_VERSION = 1
+
+# Hikaye sahnesinden korunan alanlar: taslaktan final render'da sesler ve görseller
+# bu bilgilerle yeniden üretilir
+SOURCE_SCENE_KEYS = ("text", "image_prompt", "characters")
+# Zaman çizelgesi sahnelerinde varsa korunan opsiyonel alanlar
+OPTIONAL_SCENE_KEYS = ("crop_x",) + SOURCE_SCENE_KEYS
+
+
+class Timeline:
+    def __init__(self, title: str, fps: int, width: int, height: int,
+                 scenes: List[Dict], narration_path: Optional[str] = None,
+                 music_path: Optional[str] = None, music_volume: float = 0.05,
+                 transition: Optional[str] = None, transition_duration: float = 0.5,
+                 title_cards: Optional[Dict] = None, crf: Optional[int] = None,
+                 draft: bool = False):
+        """
+        Zaman çizelgesi
+
+        Args:
+            title: Hikaye başlığı
+            fps: Frame hızı (sahne sınırları bu hıza oturtulur)
+            width: Video genişliği
+            height: Video yüksekliği
+            scenes: Her biri image_path, audio_path, start_frame, end_frame, start, end,
+                    zoom, start_scale, end_scale (opsiyonel crop_x ve SOURCE_SCENE_KEYS) içeren sahneler
+            narration_path: Sahne sınırlarına yerleştirilmiş ana anlatım WAV'ı
+            music_path: Fon müziği (opsiyonel)
+            music_volume: Fon müziği kazancı
+            transition: Sahne geçişi (None = düz kesme)
+            transition_duration: Geçiş süresi (saniye)
+            title_cards: Kart ayarları {"style", "title_duration", "credits_duration"} (None = kart yok)
+            crf: Hikayeye özel aranmış CRF (None = encoder profilindeki)
+            draft: Taslak ayarlarla kuruldu (final için VideoCreator.promote_timeline)
+        """
+        self.title = title
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.scenes = scenes
+        self.narration_path = narration_path
+        self.music_path = music_path
+        self.music_volume = music_volume
+        self.transition = transition
+        self.transition_duration = transition_duration
+        self.title_cards = title_cards
+        self.crf = crf
+        self.draft = draft
+
+    @classmethod
+    def from_frame_counts(cls, title: str, fps: int, width: int, height: int,
+                          scenes: List[Dict], counts: List[int], **kwargs) -> "Timeline":
+        """
+        Sahne listesi ve frame sayılarından (FFmpegRenderer.frame_counts) zaman çizelgesi kurar
+
+        Başlangıç/bitiş anları kümülatif frame sınırlarından hesaplanır; böylece
+        tüm backend'ler ve ana anlatım aynı sınırları kullanır.
+        """
+        timeline_scenes = []
+        start_frame = 0
+        for scene, frames in zip(scenes, counts):
+            end_frame = start_frame + frames
+            entry = {
+                "image_path": os.path.abspath(scene["image_path"]),
+                "audio_path": os.path.abspath(scene["audio_path"]) if scene.get("audio_path") else None,
+                "start_frame": start_frame,
+                "end_frame": end_frame,
+                "start": start_frame / float(fps),
+                "end": end_frame / float(fps),
+                "zoom": scene.get("zoom", "none"),
+                "start_scale": scene.get("start_scale", 1.0),
+                "end_scale": scene.get("end_scale", 1.0),
+            }
+            for key in OPTIONAL_SCENE_KEYS:
+                if key in scene:
+                    entry[key] = scene[key]
+            timeline_scenes.append(entry)
+            start_frame = end_frame
+        return cls(title, fps, width, height, timeline_scenes, **kwargs)
+
+    @property
+    def frame_counts(self) -> List[int]:
+        """Sahne başına frame sayıları"""
+        return [scene["end_frame"] - scene["start_frame"] for scene in self.scenes]
+
+    @property
+    def total_frames(self) -> int:
+        return self.scenes[-1]["end_frame"] if self.scenes else 0
+
+    @property
+    def duration(self) -> float:
+        """Hikaye süresi (kartlar hariç, frame sınırına oturtulmuş)"""
+        return self.total_frames / float(self.fps)
+
+    def scene_specs(self) -> List[Dict]:
+        """
+        Renderer'ların beklediği sahne listesini döndürür
+
+        Süreler frame sayılarından türetilir; frame_counts bu süreleri aynı
+        sınırlara geri yuvarlar, yani render zaman çizelgesiyle birebir eşleşir.
+        """
+        specs = []
+        for scene in self.scenes:
+            spec = {
+                "image_path": scene["image_path"],
+                "audio_path": scene.get("audio_path"),
+                "duration": (scene["end_frame"] - scene["start_frame"]) / float(self.fps),
+                "start_scale": scene["start_scale"],
+                "end_scale": scene["end_scale"],
+            }
+            if "crop_x" in scene:
+                spec["crop_x"] = scene["crop_x"]
+            specs.append(spec)
+        return specs
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": TIMELINE_VERSION,
+            "title": self.title,
+            "fps": self.fps,
+            "width": self.width,
+            "height": self.height,
+            "narration_path": self.narration_path,
+            "music_path": self.music_path,
+            "music_volume": self.music_volume,
+            "transition": self.transition,
+            "transition_duration": self.transition_duration,
+            "title_cards": self.title_cards,
+            "crf": self.crf,
+            "draft": self.draft,
+            "scenes": self.scenes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Timeline":
+        if data.get("version", TIMELINE_VERSION) > TIMELINE_VERSION:
+            raise ValueError(f"Desteklenmeyen zaman çizelgesi sürümü: {data['version']}")
+        return cls(
+            data["title"], data["fps"], data["width"], data["height"], data["scenes"],
+            narration_path=data.get("narration_path"),
+            music_path=data.get("music_path"),
+            music_volume=data.get("music_volume", 0.05),
+            transition=data.get("transition"),
+            transition_duration=data.get("transition_duration", 0.5),
+            title_cards=data.get("title_cards"),
+            crf=data.get("crf"),
+            draft=data.get("draft", False),
+        )
+
+    def save(self, path: str) -> str:
+        """Zaman çizelgesini JSON olarak kaydeder (yarım dosya kalmasın diye atomik)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "Timeline":
+        """Kaydedilmiş zaman çizelgesini yükler"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,147 @@
+"""
+Başlık ve bitiş kartı modülü
+Kartları Pillow ile çizer (font ve metin katmanları önbellekte), her
+(başlık, stil, encoder ayarı) için bir kez sabit frame hızlı segment olarak kodlar;
+segmentler hikayeye stream copy ile eklenir
+"""
+import os
+import json
+import hashlib
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.segment_cache import SegmentCache
+
+# Stil tanımları 1920x1080 için; farklı çözünürlükte font boyutları orantılı ölçeklenir
+TITLE_CARD_STYLES = {
+    "default": {
+        "title": {
+            "background": (0, 0, 0),
+            "lines": [
+                {"text": "{title}", "weight": "bold", "size": 80, "color": (255, 255, 255), "y": 0.5},
+                {"text": "Yapay Zeka ile Hikaye Anlatımı", "weight": "regular", "size": 40,
+                 "color": (211, 211, 211), "y": 0.7},
+            ],
+        },
+        "credits": {
+            "background": (25, 25, 50),
+            "lines": [
+                {"text": "Dinlediğiniz İçin Teşekkürler!", "weight": "bold", "size": 60,
+                 "color": (255, 255, 255), "y": 0.5},
+                {"text": "Bu video AI teknolojileri ile oluşturulmuştur\nGörseller: AI Generated\n"
+                         "Ses: TTS\nVideo: Otomatik", "weight": "regular", "size": 30,
+                 "color": (173, 216, 230), "y": 0.75},
+            ],
+        },
+    },
+}
+
+FONT_CANDIDATES = {
+    "bold": ["arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"],
+    "regular": ["arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"],
+}
+
+
+@lru_cache(maxsize=None)
+def load_font(weight: str, size: int) -> ImageFont.ImageFont:
+    """Fontu bir kez yükler (sistemde Arial/DejaVu yoksa Pillow'un gömülü fontu)"""
+    for name in FONT_CANDIDATES.get(weight, FONT_CANDIDATES["regular"]):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=64)
+def render_text(text: str, weight: str, size: int, color: Tuple[int, int, int]) -> Image.Image:
+    """
+    Metni şeffaf bir katmana çizer (aynı metin tekrar çizilmez)
+
+    Not: Dönen katman önbellekte paylaşılır, üzerinde değişiklik yapılmamalıdır.
+    """
+    font = load_font(weight, size)
+    spacing = size // 4
+    probe = ImageDraw.Draw(Image.new("L", (1, 1)))
+    left, top, right, bottom = (int(v) for v in probe.multiline_textbbox(
+        (0, 0), text, font=font, spacing=spacing, align="center"))
+    layer = Image.new("RGBA", (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+    ImageDraw.Draw(layer).multiline_text((-left, -top), text, font=font, fill=tuple(color) + (255,),
+                                         spacing=spacing, align="center")
+    return layer
+
+
+def draw_card(card: Dict, size: Tuple[int, int], title: str = "") -> Image.Image:
+    """Kart tanımından RGB görsel oluşturur"""
+    width, height = size
+    image = Image.new("RGB", size, tuple(card["background"]))
+    for line in card["lines"]:
+        # Dikey çıktılarda metin genişliğe sığsın diye küçük olan oran kullanılır
+        font_size = max(int(round(line["size"] * min(width / 1920.0, height / 1080.0))), 8)
+        layer = render_text(line["text"].replace("{title}", title), line["weight"],
+                            font_size, tuple(line["color"]))
+        x = (width - layer.width) // 2
+        y = int(line["y"] * height) - layer.height // 2
+        image.paste(layer, (x, y), layer)
+    return image
+
+
+class TitleCardBuilder:
+    def __init__(self, renderer: FFmpegRenderer, cache: SegmentCache, style: str = "default"):
+        """
+        Kart segmenti üretici
+
+        Args:
+            renderer: Hikayeyi kodlayan renderer (segmentler stream copy ile eklenebilsin
+                      diye aynı encoder ayarları kullanılır)
+            cache: Kodlanmış kartların saklandığı önbellek
+            style: TITLE_CARD_STYLES içindeki stil adı
+        """
+        if style not in TITLE_CARD_STYLES:
+            raise ValueError(f"Bilinmeyen kart stili: {style}")
+        self.renderer = renderer
+        self.cache = cache
+        self.style = style
+
+    def segment(self, kind: str, title: str = "", duration: float = 3.0) -> Tuple[str, int]:
+        """
+        Kart segmentini döndürür, önbellekte yoksa bir kez kodlar
+
+        Bitiş kartı her videonun son segmentidir; son örneğin süresine bağlı kalmamak
+        için kartlar değişken frame hızlı değil, her frame'i kodlanmış (CFR) segmenttir.
+
+        Args:
+            kind: "title" veya "credits"
+            title: Hikaye başlığı (bitiş kartı başlıktan bağımsızdır, tüm videolarda paylaşılır)
+            duration: Kart süresi (saniye)
+
+        Returns:
+            (segment yolu, frame sayısı)
+        """
+        card = TITLE_CARD_STYLES[self.style][kind]
+        frames = self.renderer.frame_counts([duration])[0]
+        scene = {"image_path": None, "start_scale": 1.0, "end_scale": 1.0}
+        if not any("{title}" in line["text"] for line in card["lines"]):
+            title = ""
+
+        digest = hashlib.sha256()
+        for part in [kind, title, json.dumps(card, sort_keys=True),
+                     f"{self.renderer.width}x{self.renderer.height}"] + \
+                self.renderer.segment_parameters(scene, frames, variable_frame_rate=False):
+            digest.update(str(part).encode("utf-8") + b"\0")
+        key = digest.hexdigest()
+
+        cached_path = self.cache.get(key)
+        if cached_path:
+            return cached_path, frames
+
+        image_path = os.path.join(self.renderer.temp_dir, f"card_{kind}.png")
+        draw_card(card, (self.renderer.width, self.renderer.height), title).save(image_path)
+        segment_path = os.path.join(self.renderer.temp_dir, f"card_{kind}.mp4")
+        self.renderer.render_scene_segment(dict(scene, image_path=image_path), frames, segment_path,
+                                           variable_frame_rate=False)
+        print(f"🎞️  {kind} kartı kodlandı ve önbelleğe alındı")
+        return self.cache.put(key, segment_path), frames
@@ -0,0 +1,205 @@
+"""
+İçerik adresli TTS önbelleği
+Sentezlenen sahne seslerini (motor, model, ses, hız, dil, normalize metin) hash'i altında
+diskte saklar. cleanup_folders audio/ klasörünü silse de metni değişmeyen sahneler yeniden
+sentezlenmez. Önbellek boyutla sınırlıdır (en uzun süredir kullanılmayan sesler silinir) ve
+aynı anahtar için eşzamanlı istekler (thread veya ayrı süreç) tek sentezde birleşir.
+"""
+import os
+import time
+import shutil
+import hashlib
+import threading
+import unicodedata
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# Kilidi bu kadar saniyedir güncellenmeyen (çökmüş süreçten kalmış) sentez bayat sayılır
+LOCK_TIMEOUT = 300
+
+
+def normalize_text(text: str) -> str:
+    """Anahtar için metni normalize eder (Unicode NFC, boşluklar tek boşluk, kenarlar kırpılır)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TTSCache:
+    def __init__(self, cache_dir: str = os.path.join("cache", "tts"), max_bytes: int = 500 * 1024 * 1024):
+        """
+        TTS önbelleği
+
+        Args:
+            cache_dir: Seslerin saklanacağı klasör (cleanup_folders dokunmaz)
+            max_bytes: Önbelleğin en fazla boyutu (aşılınca en eski kullanılanlar silinir)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, engine: str, text: str, model: str = "", voice: str = "",
+                 speed="", language: str = "") -> str:
+        """Sentezi belirleyen tüm girdilerin SHA-256 anahtarı"""
+        digest = hashlib.sha256()
+        for part in (engine, model, voice, speed, language, normalize_text(text)):
+            digest.update(str(part if part is not None else "").encode("utf-8") + b"\0")
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Anahtarın önbellekteki dosya yolunu döndürür"""
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    def _fetch(self, key: str, output_path: str) -> Optional[str]:
+        """Önbellekte varsa sesi output_path'e kopyalar ve kullanım zamanını günceller"""
+        path = self.path_for(key)
+        try:
+            if os.path.getsize(path) == 0:
+                return None
+            os.utime(path, None)
+            if os.path.abspath(path) != os.path.abspath(output_path):
+                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+                shutil.copyfile(path, output_path)
+        except OSError:
+            return None
+        with self._lock:
+            self.hits += 1
+        return output_path
+
+    def put(self, key: str, audio_path: str) -> str:
+        """Sesi önbelleğe kopyalar (yarım dosya kalmasın diye atomik) ve boyut sınırını uygular"""
+        path = self.path_for(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(audio_path, temp_path)
+        os.replace(temp_path, path)
+        self._evict()
+        return path
+
+    @contextmanager
+    def _single_flight(self, key: str):
+        """
+        Anahtar başına tek sentez: aynı süreçteki thread'ler kilitle, ayrı süreçler
+        (paralel çalıştırmalar) kilit dosyasıyla sıraya girer
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            lock_path = f"{self.path_for(key)}.lock"
+            while True:
+                try:
+                    os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    break
+                except FileExistsError:
+                    try:
+                        if time.time() - os.path.getmtime(lock_path) > LOCK_TIMEOUT:
+                            os.remove(lock_path)
+                            continue
+                    except OSError:
+                        continue
+                    time.sleep(0.2)
+            try:
+                yield
+            finally:
+                try:
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+
+    def get_or_create(self, key: str, output_path: str, synthesize: Callable[[str], str],
+                      should_store: Callable[[str], bool] = None) -> str:
+        """
+        Önbellekte varsa sesi output_path'e getirir, yoksa sentezleyip önbelleğe ekler
+
+        Args:
+            key: make_key ile oluşturulan anahtar
+            output_path: Sahne sesinin yazılacağı yol
+            synthesize: output_path'e sentez yapıp yolu döndüren fonksiyon
+            should_store: Sentez sonucu önbelleğe alınsın mı (ör. yedek motora düşüldüyse hayır)
+
+        Returns:
+            Ses dosyası yolu
+        """
+        cached = self._fetch(key, output_path)
+        if cached:
+            return cached
+
+        with self._single_flight(key):
+            # Beklerken başka bir thread/süreç aynı sesi üretmiş olabilir
+            cached = self._fetch(key, output_path)
+            if cached:
+                return cached
+
+            with self._lock:
+                self.misses += 1
+            result = synthesize(output_path)
+            if should_store is None or should_store(result):
+                self.put(key, result)
+            return result
+
+    def _evict(self):
+        """Boyut sınırı aşıldıysa en uzun süredir kullanılmayan sesleri siler (LRU)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".wav"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> Dict:
+        """İsabet/ıska sayıları ve önbelleğin şu anki boyutu"""
+        files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                 if name.endswith(".wav")]
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / float(requests) if requests else 0.0,
+                "entries": len(files),
+                "bytes": sum(os.stat(path).st_size for path in files if os.path.exists(path)),
+            }
+
+    def clear(self):
+        """Önbellekteki tüm sesleri siler"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        print("✓ TTS önbelleği temizlendi")
+
+    def report(self):
+        """İstatistikleri yazdırır"""
+        stats = self.stats()
+        print(f"💾 TTS önbelleği: {stats['hits']} hazır, {stats['misses']} yeni sentez "
+              f"(isabet %{int(stats['hit_rate'] * 100)}, {stats['entries']} ses, "
+              f"{stats['bytes'] / (1024 * 1024):.1f} MB, {stats['evictions']} silindi)")
+
+
+def cache_from_config() -> Optional[TTSCache]:
+    """Config'e göre paylaşılan TTS önbelleğini döndürür (kapalıysa None)"""
+    try:
+        from config.config import Config
+    except ImportError:
+        Config = None
+    # Her ayar ayrı okunur: eksik anahtar diğerlerini varsayılana düşürmez
+    enabled = getattr(Config, 'TTS_CACHE', True)
+    cache_dir = getattr(Config, 'TTS_CACHE_DIR', os.path.join("cache", "tts"))
+    max_mb = getattr(Config, 'TTS_CACHE_MAX_MB', 500)
+    return TTSCache(cache_dir, int(max_mb * 1024 * 1024)) if enabled else None
@@ -6,8 +6,11 @@ import os
 import pyttsx3
 from gtts import gTTS
 from pydub import AudioSegment
-import tempfile
-from typing import List, Dict
+from src.media_probe import get_duration
+from src.tts_cache import cache_from_config
+from src.audio_mixer import decode_to_wav
+import io
+from typing import List, Dict, Callable, Optional
 
 class TTSGenerator:
     def __init__(self, engine="gtts", language="tr", speed=150):
@@ -16,6 +19,11 @@ class TTSGenerator:
         self.speed = speed
         self.audio_dir = "audio"
         self.tts_engine = None
+        # Son sentezi gerçekten yapan motor (gTTS hata verip pyttsx3'e düşerse önbelleğe alınmaz)
+        self.last_engine = None
+        
+        # İçerik adresli TTS önbelleği (OpenAITTSGenerator ile ortak)
+        self.cache = cache_from_config()
         
         # Klasör oluştur
         os.makedirs(self.audio_dir, exist_ok=True)
@@ -36,6 +44,31 @@ class TTSGenerator:
         text = scene['text']
         output_path = os.path.join(self.audio_dir, output_filename)
         
+        if self.cache is None:
+            return self._synthesize(text, output_path)
+        key = self.cache.make_key(
+            self.engine, text,
+            voice=self._voice_id(),
+            speed=self.speed,
+            language=self.language
+        )
+        return self.cache.get_or_create(
+            key, output_path,
+            lambda path: self._synthesize(text, path),
+            should_store=lambda path: self.last_engine == self.engine
+        )
+    
+    def _voice_id(self) -> str:
+        """pyttsx3'te sistem sesinin kimliği (önbellek anahtarı için; gTTS'te dil belirler)"""
+        if self.engine == "pyttsx3" and self.tts_engine is not None:
+            try:
+                return str(self.tts_engine.getProperty('voice'))
+            except Exception:
+                return ""
+        return ""
+    
+    def _synthesize(self, text: str, output_path: str) -> str:
+        """Seçili motorla sentez yapar"""
         if self.engine == "gtts":
             return self._generate_with_gtts(text, output_path)
         elif self.engine == "pyttsx3":
@@ -48,18 +81,13 @@ class TTSGenerator:
         try:
             tts = gTTS(text=text, lang=self.language, slow=False)
             
-            # Temporary file kullan
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_path = temp_file.name
-                tts.save(temp_path)
-            
-            # MP3'ü WAV'a dönüştür (video işleme için)
-            audio = AudioSegment.from_mp3(temp_path)
-            audio.export(output_path, format="wav")
-            
-            # Temp dosyayı sil
-            os.unlink(temp_path)
+            # MP3 bellekte toplanır ve tek ffmpeg çağrısıyla doğrudan WAV'a çözülür
+            # (geçici MP3 dosyası yok, pydub ile yeniden kodlama yok)
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            decode_to_wav(buffer.getvalue(), output_path)
             
+            self.last_engine = "gtts"
             print(f"✓ Ses dosyası oluşturuldu: {output_path}")
             return output_path
             
@@ -83,6 +111,7 @@ class TTSGenerator:
             self.tts_engine.save_to_file(text, output_path)
             self.tts_engine.runAndWait()
             
+            self.last_engine = "pyttsx3"
             print(f"✓ Ses dosyası oluşturuldu (offline): {output_path}")
             return output_path
             
@@ -90,8 +119,14 @@ class TTSGenerator:
             print(f"✗ pyttsx3 hatası: {e}")
             raise
     
-    def generate_story_audio(self, scenes: List[Dict[str, str]], story_title: str) -> List[str]:
-        """Tüm hikaye için ses dosyalarını oluşturur"""
+    def generate_story_audio(self, scenes: List[Dict[str, str]], story_title: str,
+                             on_scene_ready: Optional[Callable[[int, str], None]] = None) -> List[str]:
+        """
+        Tüm hikaye için ses dosyalarını oluşturur
+        
+        on_scene_ready: Her sahnenin sesi hazır olunca (0 tabanlı sıra, yol) ile çağrılır
+        (ör. aşamalı önizleme)
+        """
         audio_files = []
         
         print(f"🎤 {story_title} için ses dosyaları oluşturuluyor...")
@@ -105,15 +140,19 @@ class TTSGenerator:
             filename = f"story_{story_hash}_scene_{i:02d}.wav"
             audio_path = self.generate_scene_audio(scene, filename)
             audio_files.append(audio_path)
+            if on_scene_ready:
+                on_scene_ready(i - 1, audio_path)
         
         print(f"✓ {len(audio_files)} ses dosyası oluşturuldu")
+        if self.cache:
+            self.cache.report()
         return audio_files
     
     def get_audio_duration(self, audio_path: str) -> float:
         """Ses dosyasının süresini döndürür"""
         try:
-            audio = AudioSegment.from_wav(audio_path)
-            return len(audio) / 1000.0  # millisecond to second
+            # WAV başlığından okunur, dosya çözülmez
+            return get_duration(audio_path)
         except Exception as e:
             print(f"✗ Ses dosyası süresi alınamadı: {e}")
             return 5.0  # Varsayılan süre
@@ -3,27 +3,108 @@ Video oluşturma modülü
 Ses ve görselleri birleştirerek video oluşturur
 """
 import os
+import copy
+import math
+import bisect
 import tempfile
 from typing import List, Dict, Tuple
 
 # MoviePy 2.x import syntax
 from moviepy import (
-    VideoFileClip, ImageClip, AudioFileClip,
-    TextClip, ColorClip, CompositeVideoClip,
-    concatenate_videoclips, concatenate_audioclips,
-    CompositeAudioClip
+    VideoClip, ImageClip, AudioFileClip,
+    concatenate_videoclips
 )
 
+from src.zoom_engine import ZoomEngine
+from src.ffmpeg_renderer import run_ffmpeg
+from src.media_probe import probe, get_duration
+from src.segment_cache import SegmentCache
+from src.audio_mixer import AudioMixer
+from src.frame_pipe import FramePipeWriter
+from src.encoder_profiles import get_encoder_profile, renderer_from_profile, search_title_crf
+from src.title_cards import TitleCardBuilder
+from src.scene_sources import SceneSourceWindow
+from src.timeline import Timeline, SOURCE_SCENE_KEYS
+from src.music_library import MusicLibrary
+
 class VideoCreator:
-    def __init__(self, output_dir: str = "videos"):
+    def __init__(self, output_dir: str = "videos", render_backend: str = None, draft: bool = False):
+        """
+        Args:
+            output_dir: Çıktı klasörü
+            render_backend: Render backend'i (verilmezse Config.VIDEO_RENDER_BACKEND)
+            draft: Taslak mod (düşük çözünürlük, ultrafast, hareketsiz; çıktılar <başlık>_draft.*)
+        """
         self.output_dir = output_dir
         self.temp_dir = tempfile.mkdtemp()
+        self.draft = draft
+        
+        # Her ayar ayrı okunur: eski bir config'de eksik olan anahtar sadece kendi varsayılanına düşer
+        try:
+            from config.config import Config
+        except ImportError:
+            Config = None
+        
+        # Render backend: "moviepy" (frame callback'leri), "ffmpeg" (tek filtergraph)
+        # "parallel" (sahne başına paralel segment + stream copy birleştirme)
+        # veya "pipe" (Python frame'leri yeniden kullanılan tamponlardan ham pipe ile ffmpeg'e)
+        default_backend = getattr(Config, 'VIDEO_RENDER_BACKEND', "moviepy")
+        self.render_workers = getattr(Config, 'VIDEO_RENDER_WORKERS', 0)  # 0 = CPU sayısı
+        use_segment_cache = getattr(Config, 'VIDEO_SEGMENT_CACHE', False)
+        segment_cache_dir = getattr(Config, 'SEGMENT_CACHE_DIR', os.path.join("cache", "segments"))
+        self.ken_burns = getattr(Config, 'VIDEO_KEN_BURNS', True)
+        encoder_profile = getattr(Config, 'VIDEO_ENCODER_PROFILE', "standard")
+        self.pipe_pix_fmt = getattr(Config, 'VIDEO_PIPE_PIX_FMT', "rgb24")
+        self.pipe_ring_size = getattr(Config, 'VIDEO_PIPE_RING_SIZE', 4)
+        self.title_cards = getattr(Config, 'VIDEO_TITLE_CARDS', True)
+        self.title_card_style = getattr(Config, 'TITLE_CARD_STYLE', "default")
+        self.title_card_duration = getattr(Config, 'TITLE_CARD_DURATION', 3)
+        self.credits_card_duration = getattr(Config, 'CREDITS_CARD_DURATION', 3)
+        card_cache_dir = getattr(Config, 'CARD_CACHE_DIR', os.path.join("cache", "cards"))
+        music_cache_dir = getattr(Config, 'MUSIC_CACHE_DIR', os.path.join("cache", "music"))
+        self.max_open_scenes = getattr(Config, 'VIDEO_MAX_OPEN_SCENES', 2)
+        self.renditions = getattr(Config, 'VIDEO_RENDITIONS', [])
+        self.transition = getattr(Config, 'VIDEO_TRANSITION', None)
+        self.transition_duration = getattr(Config, 'VIDEO_TRANSITION_DURATION', 0.5)
+        self.audio_rebuild_tolerance = getattr(Config, 'VIDEO_AUDIO_REBUILD_TOLERANCE', 0.25)
+        self.crf_search = getattr(Config, 'VIDEO_CRF_SEARCH', False)
+        self.target_ssim = getattr(Config, 'ENCODER_TARGET_SSIM', 0.97)
+        self.draft_size = (getattr(Config, 'DRAFT_WIDTH', 854), getattr(Config, 'DRAFT_HEIGHT', 480))
+        
+        if draft:
+            # Taslak: hızlı iterasyon için ucuz ayarlar. Zaman çizelgesi yine kaydedilir;
+            # final render promote_timeline ile aynı sahne yapısından yapılır.
+            encoder_profile = "draft"
+            self.ken_burns = False
+            self.crf_search = False
+            self.renditions = []
+            if default_backend == "moviepy":
+                default_backend = "ffmpeg"
+        self.render_backend = render_backend or default_backend
+        
+        # Segment önbelleği ("parallel" modunda değişmeyen sahneler yeniden kodlanmaz)
+        self.segment_cache = SegmentCache(segment_cache_dir) if use_segment_cache else None
+        
+        # Encoder profili: "draft", "standard", "archive" veya "auto" (makineye özel benchmark sonucu)
+        self.encoder_profile = get_encoder_profile(encoder_profile)
+        
+        # Başlık/bitiş kartları (başlık + stil + encoder ayarı başına bir kez kodlanır;
+        # kaydedilmiş zaman çizelgesi kart isteyebileceği için önbellek her zaman hazır,
+        # klasörü ilk kart kodlanınca oluşur)
+        self.card_cache = SegmentCache(card_cache_dir)
+        
+        # Fon müzikleri bir kez çözülüp normalize edilmiş PCM olarak saklanır (mmap ile karıştırılır;
+        # önbellek klasörü ilk parça çözülünce oluşur)
+        self.music_library = MusicLibrary("musics", music_cache_dir)
+        
+        # Son render'da üretilen ek sürümler {ad: yol}
+        self.rendition_outputs = {}
         
         # Klasörleri oluştur
         os.makedirs(output_dir, exist_ok=True)
     
     def create_scene_video(self, image_path: str, audio_path: str, 
-                          scene_duration: float = None):
+                          scene_duration: float = None, zoom_seed: str = None):
         """Bir sahne için video klip oluşturur"""
         try:
             # Ses dosyasını yükle
@@ -32,14 +113,8 @@ class VideoCreator:
             # SES DOSYASININ GERÇEK SÜRESİNİ KULLAN (AI'nin önerdiği süre değil!)
             visual_duration = audio_clip.duration
             
-            # Görseli yükle ve video klip haline getir (MoviePy 2.x syntax)
-            image_clip = ImageClip(image_path).with_duration(visual_duration)
-            
-            # Görseli 1920x1080'e boyutlandır
-            image_clip = image_clip.resized((1920, 1080))
-            
-            # Zoom efekti ekle (Ken Burns efekti)
-            image_clip = self._apply_zoom_effect(image_clip, visual_duration)
+            # Görseli bir kez ölçekle, zoom'lu frame'leri motor üretsin (Ken Burns efekti)
+            image_clip = self._apply_zoom_effect(image_path, visual_duration, zoom_seed)
             
             # Ses ve görüntüyü birleştir (MoviePy 2.x syntax)
             video_clip = image_clip.with_audio(audio_clip)
@@ -52,70 +127,409 @@ class VideoCreator:
             raise
             raise
     
-    def create_story_video(self, scenes: List[Dict[str, str]], 
-                          image_files: List[str], audio_files: List[str], 
-                          story_title: str) -> str:
-        """Tüm hikaye için video oluşturur"""
+    def create_story_video(self, scenes: List[Dict[str, str]],
+                          image_files: List[str], audio_files: List[str],
+                          story_title: str, renditions: List[Dict] = None) -> str:
+        """
+        Tüm hikaye için video oluşturur
+        
+        Önce zaman çizelgesi (sahne sınırları, zoom, geçiş, ana anlatım WAV'ı) kurulup
+        videonun yanına kaydedilir, sonra render bu zaman çizelgesinden yapılır.
+        
+        Args:
+            renditions: Ana videoya ek sürümler, ör. [{"name": "720p", "width": 1280, "height": 720},
+                        {"name": "shorts", "width": 1080, "height": 1920}] (verilmezse Config.VIDEO_RENDITIONS).
+                        Yolları render sonrası self.rendition_outputs içindedir.
+        
+        Returns:
+            Ana video yolu
+        """
         
         print(f"🎬 {story_title} için video oluşturuluyor...")
         
         if len(scenes) != len(image_files) or len(scenes) != len(audio_files):
             raise ValueError("Sahne, görsel ve ses dosyası sayıları eşleşmiyor!")
         
+        timeline = self.build_timeline(image_files, audio_files, story_title, scenes)
+        return self.render_timeline(timeline, renditions)
+    
+    def build_timeline(self, image_files: List[str], audio_files: List[str],
+                       story_title: str, scenes: List[Dict] = None) -> Timeline:
+        """
+        Ses sürelerinden zaman çizelgesini kurar, ana anlatım WAV'ını yazar ve
+        zaman çizelgesini videonun yanına kaydeder (<video>.timeline.json)
+        
+        Returns:
+            Timeline
+        """
+        scene_specs = self._build_scene_specs(image_files, audio_files, story_title, scenes)
+        return self._save_timeline(story_title, scene_specs, self._select_background_music(story_title))
+    
+    def promote_timeline(self, timeline, image_files: List[str] = None,
+                         audio_files: List[str] = None) -> Timeline:
+        """
+        Taslak zaman çizelgesinden bu VideoCreator'ın (final) ayarlarıyla zaman çizelgesi kurar
+        
+        Sahne sırası, metinler, zoom tohumları ve fon müziği korunur; çözünürlük, encoder,
+        geçiş ve kartlar final ayarlarından gelir. Yeni görseller/sesler verilirse (ör. gerçek
+        görseller ve TTS-1 HD) sahneler onlarla değiştirilir ve sınırlar yeni seslere oturtulur.
+        
+        Args:
+            timeline: Timeline nesnesi veya kaydedilmiş .timeline.json yolu
+            image_files: Final görselleri (verilmezse taslaktakiler)
+            audio_files: Final sesleri (verilmezse taslaktakiler)
+        
+        Returns:
+            Kaydedilmiş final Timeline
+        """
+        if isinstance(timeline, str):
+            timeline = Timeline.load(timeline)
+        
+        scene_specs = []
+        for i, scene in enumerate(timeline.scenes):
+            image_path = image_files[i] if image_files else scene['image_path']
+            audio_path = audio_files[i] if audio_files else scene['audio_path']
+            if audio_files:
+                duration = get_duration(audio_path)
+            else:
+                duration = (scene['end_frame'] - scene['start_frame']) / float(timeline.fps)
+            zoom_type, start_scale, end_scale = self._choose_zoom(f"{timeline.title}:{i+1}")
+            spec = {
+                'image_path': image_path,
+                'audio_path': audio_path,
+                'duration': duration,
+                'zoom': zoom_type,
+                'start_scale': start_scale,
+                'end_scale': end_scale,
+                'crop_x': scene['crop_x'] if 'crop_x' in scene and not image_files
+                          else self._estimate_crop_x(image_path),
+            }
+            for key in SOURCE_SCENE_KEYS:
+                if key in scene:
+                    spec[key] = scene[key]
+            scene_specs.append(spec)
+        
+        print(f"⬆️  Taslak zaman çizelgesi final ayarlarına taşınıyor: {timeline.title}")
+        return self._save_timeline(timeline.title, scene_specs, timeline.music_path)
+    
+    def _save_timeline(self, story_title: str, scene_specs: List[Dict], music_path: str = None) -> Timeline:
+        """Sahne listesini frame'e oturtur, ana anlatım WAV'ını yazar ve zaman çizelgesini kaydeder"""
+        renderer = renderer_from_profile(self.encoder_profile, temp_dir=self.temp_dir, **self._size_overrides())
+        counts = renderer.frame_counts([scene['duration'] for scene in scene_specs])
+        
+        title_cards = None
+        if self.title_cards:
+            title_cards = {
+                'style': self.title_card_style,
+                'title_duration': self.title_card_duration,
+                'credits_duration': self.credits_card_duration,
+            }
+        timeline = Timeline.from_frame_counts(
+            story_title, renderer.fps, renderer.width, renderer.height, scene_specs, counts,
+            music_path=music_path,
+            music_volume=0.05,
+            transition=self.transition,
+            transition_duration=self.transition_duration,
+            title_cards=title_cards,
+            draft=self.draft
+        )
+        if timeline.music_path:
+            timeline.music_path = os.path.abspath(timeline.music_path)
+        if self.crf_search:
+            timeline.crf = self._search_crf(renderer, timeline)
+        
+        # Anlatım tek dosya: her sahne sesi kendi frame sınırından başlar
+        narration_path = os.path.abspath(self._get_output_path(story_title, extension='.narration.wav'))
+        AudioMixer().write_narration(
+            [scene['audio_path'] for scene in scene_specs],
+            [(scene['start'], scene['end']) for scene in timeline.scenes],
+            narration_path
+        )
+        timeline.narration_path = narration_path
+        
+        timeline_path = timeline.save(self._get_output_path(story_title, extension='.timeline.json'))
+        print(f"🗂️  Zaman çizelgesi kaydedildi: {timeline_path} "
+              f"({len(timeline.scenes)} sahne, {timeline.total_frames} frame)")
+        return timeline
+    
+    def render_timeline(self, timeline, renditions: List[Dict] = None) -> str:
+        """
+        Zaman çizelgesinden video render eder
+        
+        Args:
+            timeline: Timeline nesnesi veya kaydedilmiş .timeline.json yolu
+                      (başka hiçbir pipeline durumu gerekmez)
+            renditions: Ek sürümler (verilmezse Config.VIDEO_RENDITIONS)
+        
+        Returns:
+            Ana video yolu
+        """
+        if isinstance(timeline, str):
+            timeline = Timeline.load(timeline)
+            print(f"🗂️  Zaman çizelgesi yüklendi: {timeline.title} ({len(timeline.scenes)} sahne)")
+        
+        if timeline.draft and not self.draft:
+            print("⚠ Taslak zaman çizelgesi taslak ayarlarıyla render ediliyor "
+                  "(final için önce promote_timeline kullanın)")
+        
+        renditions = self.renditions if renditions is None else renditions
+        self.rendition_outputs = {}
+        if timeline.transition and self.render_backend != "ffmpeg":
+            # Geçişler sahneleri üst üste bindirir; tek filtergraph içinde xfade ile yapılır
+            print(f"⚠ '{timeline.transition}' geçişi tek filtergraph'ta üretilir, 'ffmpeg' backend'i kullanılıyor")
+            return self._render_timeline_ffmpeg(timeline, renditions or None, backend="ffmpeg")
+        if renditions and self.render_backend not in ("ffmpeg", "parallel"):
+            print("⚠ Ek sürümler tek kompozisyon geçişiyle sadece ffmpeg tabanlı render'da "
+                  "üretilebilir, 'ffmpeg' backend'i kullanılıyor")
+            return self._render_timeline_ffmpeg(timeline, renditions, backend="ffmpeg")
+        
+        if self.render_backend in ("ffmpeg", "parallel"):
+            return self._render_timeline_ffmpeg(timeline, renditions or None)
+        if self.render_backend == "pipe":
+            return self._render_timeline_pipe(timeline)
+        return self._render_timeline_moviepy(timeline)
+    
+    def _timeline_renderer(self, timeline: Timeline):
+        """
+        Zaman çizelgesinin boyut ve frame hızında, encoder profili ayarlarıyla renderer
+        
+        Zaman çizelgesinde hikayeye özel aranmış CRF varsa profilinkinin yerine o kullanılır.
+        """
+        renderer = renderer_from_profile(
+            self.encoder_profile, temp_dir=self.temp_dir,
+            width=timeline.width, height=timeline.height, fps=timeline.fps
+        )
+        if timeline.crf is not None:
+            renderer.crf = timeline.crf
+        return renderer
+    
+    def _size_overrides(self) -> Dict:
+        """Taslak modda yeni zaman çizelgelerinin boyutu (final'de profil/renderer varsayılanı)"""
+        if self.draft:
+            return {'width': self.draft_size[0], 'height': self.draft_size[1]}
+        return {}
+    
+    def _search_crf(self, renderer, timeline: Timeline) -> int:
+        """
+        Hikayeye özel CRF araması yapar (hedef kaliteyi karşılayan en yüksek CRF)
+        
+        Durağan yer tutucu sahnelerden oluşan hikayeler yüksek CRF'de bile hedefi tutar,
+        yoğun illüstrasyonlar daha düşük CRF alır. Aramanın maliyeti raporlanır.
+        """
+        renderer = copy.copy(renderer)
+        scene_specs = timeline.scene_specs()
+        if all(renderer.is_still(scene) for scene in scene_specs):
+            renderer.tune = "stillimage"
+        search = search_title_crf(
+            renderer, scene_specs, os.path.join(self.temp_dir, 'crf_search'), self.target_ssim
+        )
+        for result in search['results']:
+            print(f"   crf {result['crf']:>2}: SSIM {result['ssim']:.4f}, "
+                  f"{result['bytes'] / 1024:.0f} KB")
+        print(f"🔎 CRF araması: crf={search['crf']} seçildi (profil: {self.encoder_profile['crf']}, "
+              f"SSIM {search['ssim']:.4f} ≥ {self.target_ssim}); maliyet {search['cost_seconds']:.1f}s, "
+              f"{search['encoded_frames']} frame kodlandı")
+        return search['crf']
+    
+    def rebuild_audio(self, timeline, audio_files: List[str], name: str = None,
+                      video_path: str = None, music_path: str = None,
+                      tolerance: float = None) -> str:
+        """
+        Sadece anlatım/müzik değiştiğinde (yeni ses, yeni dil) videoyu yeniden kodlamadan yeni sesle mux eder
+        
+        Yeni sahne sesleri mevcut zaman çizelgesine sığarsa kodlanmış video stream copy ile
+        korunur ve sadece ses kodlanır. Kısa ses tolerans kadar sessizlikle sığar; uzun ses
+        ise sahne sonunda kesileceği için en fazla her render'ın zaten yaptığı frame
+        yuvarlaması (bir frame) kadar uzun olabilir. Sığmayan sahnelerin frame sayısı yeni
+        sesten hesaplanır, diğer sahneler kayıtlı frame sayılarını korur; zaman çizelgesi
+        "parallel" render edilir ve segment önbelleğinde hazır olan değişmemiş sahneler
+        yeniden kodlanmaz.
+        
+        Args:
+            timeline: Videonun zaman çizelgesi (Timeline veya .timeline.json yolu)
+            audio_files: Yeni sahne sesleri (sırayla, sahne sayısı kadar)
+            name: Çıktı adı eki (ör. "en"); verilmezse ana videonun sesi değiştirilir
+            video_path: Kodlanmış video (verilmezse zaman çizelgesinin ana videosu)
+            music_path: Farklı fon müziği (verilmezse zaman çizelgesindeki)
+            tolerance: Sahne başına izin verilen kısalma (saniye; verilmezse Config)
+        
+        Returns:
+            Yeni video yolu
+        """
+        if isinstance(timeline, str):
+            timeline = Timeline.load(timeline)
+        if len(audio_files) != len(timeline.scenes):
+            raise ValueError("Ses dosyası sayısı zaman çizelgesindeki sahne sayısıyla eşleşmiyor!")
+        tolerance = self.audio_rebuild_tolerance if tolerance is None else tolerance
+        video_path = video_path or self._get_output_path(timeline.title)
+        output_path = self._get_output_path(timeline.title, name)
+        renderer = self._timeline_renderer(timeline)
+        
+        durations = [get_duration(path) for path in audio_files]
+        frame_duration = 1.0 / timeline.fps
+        misfits = [
+            i for i, (frames, duration) in enumerate(zip(timeline.frame_counts, durations))
+            if duration - frames * frame_duration > frame_duration + 1e-6
+            or frames * frame_duration - duration > tolerance
+        ]
+        
+        # Sadece sığmayan sahneler yeniden oturtulur (anlatım kesilmesin diye yukarı yuvarlanır);
+        # diğerlerinin frame sayısı değişmez, böylece segment önbellek anahtarları da değişmez
+        counts = list(timeline.frame_counts)
+        for i in misfits:
+            counts[i] = max(int(math.ceil(durations[i] * timeline.fps - 1e-6)), 1)
+        
+        scenes = [dict(scene, audio_path=path) for scene, path in zip(timeline.scenes, audio_files)]
+        variant = Timeline.from_frame_counts(
+            timeline.title, timeline.fps, timeline.width, timeline.height, scenes, counts,
+            music_path=os.path.abspath(music_path) if music_path else timeline.music_path,
+            music_volume=timeline.music_volume,
+            transition=timeline.transition,
+            transition_duration=timeline.transition_duration,
+            title_cards=timeline.title_cards,
+            crf=timeline.crf,
+            draft=timeline.draft
+        )
+        narration_path = os.path.abspath(self._get_output_path(timeline.title, name, '.narration.wav'))
+        AudioMixer().write_narration(
+            audio_files, [(scene['start'], scene['end']) for scene in variant.scenes], narration_path
+        )
+        variant.narration_path = narration_path
+        variant.save(self._get_output_path(timeline.title, name, '.timeline.json'))
+        
+        if misfits:
+            scene_numbers = ", ".join(str(i + 1) for i in misfits)
+            print(f"🔁 Sahne {scene_numbers} yeni anlatıma sığmıyor "
+                  f"(kısalma toleransı {tolerance:.2f}s), video yeniden render ediliyor")
+            if variant.transition:
+                print("⚠ Geçişler tek filtergraph'ta üretildiği için tüm sahneler yeniden kodlanır")
+                return self._render_timeline_ffmpeg(variant, backend="ffmpeg", output_path=output_path)
+            if self.segment_cache is None:
+                print("⚠ Segment önbelleği kapalı, tüm sahneler yeniden kodlanır")
+            return self._render_timeline_ffmpeg(variant, backend="parallel", output_path=output_path)
+        
+        # Kartlar eklenmişse video hikayeden uzundur; anlatım başlık kartı kadar kaydırılır
+        video_duration = probe(video_path)['duration']
+        offset = 0.0
+        total_duration = variant.duration
+        if variant.title_cards and video_duration > variant.duration + 0.5 / variant.fps:
+            cards = variant.title_cards
+            intro_frames, outro_frames = renderer.frame_counts(
+                [cards['title_duration'], cards['credits_duration']]
+            )
+            offset = intro_frames / float(variant.fps)
+            total_duration = (intro_frames + variant.total_frames + outro_frames) / float(variant.fps)
+        
+        print(f"🔊 Video yeniden kodlanmadan ses değiştiriliyor: {os.path.basename(output_path)}")
+        audio_bed = self._build_audio_bed(variant, total_duration, offset=offset)
+        if os.path.abspath(output_path) == os.path.abspath(video_path):
+            temp_path = os.path.join(self.temp_dir, 'audio_rebuild.mp4')
+            renderer.replace_audio(video_path, audio_bed, temp_path, total_duration)
+            os.replace(temp_path, output_path)
+        else:
+            renderer.replace_audio(video_path, audio_bed, output_path, total_duration)
+        print(f"✅ Ses güncellendi: {output_path}")
+        return output_path
+    
+    def create_audio_variants(self, timeline, variants: Dict[str, List[str]],
+                              video_path: str = None, music_path: str = None) -> Dict[str, str]:
+        """
+        Aynı videonun farklı anlatımlı sürümlerini (ör. diller) üretir
+        
+        Görüntü bir kez kodlanmıştır; her sürüm sığdığı sürece sadece ses kodlaması kadar sürer.
+        
+        Args:
+            timeline: Videonun zaman çizelgesi (Timeline veya .timeline.json yolu)
+            variants: {ad: sahne sesleri}, ör. {"en": [...], "de": [...]}
+        
+        Returns:
+            {ad: video yolu}
+        """
+        if isinstance(timeline, str):
+            timeline = Timeline.load(timeline)
+        outputs = {}
+        for name, audio_files in variants.items():
+            print(f"🌍 Anlatım sürümü: {name}")
+            outputs[name] = self.rebuild_audio(timeline, audio_files, name=name,
+                                               video_path=video_path, music_path=music_path)
+        return outputs
+    
+    def _render_timeline_moviepy(self, timeline: Timeline) -> str:
+        """Zaman çizelgesini MoviePy ile render eder (ses tek ana anlatım yatağından gelir)"""
         video_clips = []
+        scene_window = None
+        final_video = None
         
         try:
-            # Her sahne için video klip oluştur
-            for i, (scene, image_file, audio_file) in enumerate(zip(scenes, image_files, audio_files)):
-                print(f"📹 Sahne {i+1}/{len(scenes)} işleniyor...")
-                
-                # Süreyi verme! Ses dosyasının gerçek süresi kullanılacak
-                clip = self.create_scene_video(
-                    image_path=image_file,
-                    audio_path=audio_file,
-                    scene_duration=None  # Ses dosyasının gerçek süresini kullan
-                )
-                video_clips.append(clip)
-            
-            # Tüm klipleri birleştir
-            print("🔗 Video klipleri birleştiriliyor...")
-            final_video = concatenate_videoclips(video_clips, method="compose")
+            renderer = self._timeline_renderer(timeline)
             
-            # Başlık ve bitiş ekranları kaldırıldı (hata veriyordu)
-            # final_video = self._add_title_and_credits(final_video, story_title)
+            if self.max_open_scenes:
+                # Akış modu: tek bir klip, sahneler sırayla açılıp yazıldıkça bırakılır
+                final_video, scene_window = self._create_streaming_clip(renderer, timeline)
+            else:
+                # Her sahne için sessiz video klip oluştur (ses ana yataktan eklenir)
+                scene_specs = timeline.scene_specs()
+                for i, scene in enumerate(scene_specs):
+                    print(f"📹 Sahne {i+1}/{len(scene_specs)} işleniyor...")
+                    clip = self._apply_zoom_effect(
+                        scene['image_path'], scene['duration'],
+                        scales=(scene['start_scale'], scene['end_scale'])
+                    )
+                    video_clips.append(clip)
+                
+                # Tüm klipleri birleştir
+                print("🔗 Video klipleri birleştiriliyor...")
+                final_video = concatenate_videoclips(video_clips, method="compose")
             
-            # Fon müziği ekle
-            final_video = self._add_background_music(final_video, volume=0.05)
+            # Başlık/bitiş kartları hazır segment olarak sonradan stream copy ile eklenir
+            intro, outro = self._title_card_segments(renderer, timeline)
             
             # Video dosyasını kaydet - Hikaye ismi ile
-            # Dosya adı için güvenli karakterler (Windows uyumlu)
-            safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in story_title)
-            safe_title = safe_title.strip().replace(' ', '_')[:50]  # Maksimum 50 karakter
-            output_filename = f"{safe_title}.mp4"
-            output_path = os.path.join(self.output_dir, output_filename)
+            output_path = self._get_output_path(timeline.title)
+            output_filename = os.path.basename(output_path)
+            
+            if intro or outro:
+                # Kartlar eklenecekse hikaye sessiz yazılır, ses birleştirmede mux edilir
+                video_path = os.path.join(self.temp_dir, 'story_video.mp4')
+            else:
+                # Fon müziği ekle
+                final_video = self._add_background_music(final_video, timeline)
+                video_path = output_path
             
             print(f"💾 Video kaydediliyor: {output_filename}")
             
-            # Video export ayarları (optimize edilmiş)
+            # Video export ayarları (encoder profilinden)
+            profile = self.encoder_profile
+            ffmpeg_params = ['-crf', str(renderer.crf)]
+            if renderer.tune:
+                ffmpeg_params += ['-tune', renderer.tune]
             final_video.write_videofile(
-                output_path,
-                fps=24,
+                video_path,
+                fps=timeline.fps,
                 codec='libx264',
                 audio_codec='aac',
                 temp_audiofile=os.path.join(self.temp_dir, 'temp-audio.m4a'),
                 remove_temp=True,
-                preset='medium',  # Hız vs kalite dengesi
-                ffmpeg_params=['-crf', '23']  # Kalite ayarı (18-28 arası)
+                preset=profile['preset'],
+                threads=profile.get('threads') or None,
+                audio=not (intro or outro),
+                ffmpeg_params=ffmpeg_params
             )
             
             # Klipleri temizle
             for clip in video_clips:
                 clip.close()
+            self._release_audio_bed(final_video)
             final_video.close()
+            if scene_window is not None:
+                scene_window.close()
+            
+            if intro or outro:
+                self._attach_title_cards(renderer, video_path, output_path, timeline, intro, outro)
             
             print(f"✅ Video başarıyla oluşturuldu: {output_path}")
             return output_path
-            
+        
         except Exception as e:
             print(f"✗ Video oluşturma hatası: {e}")
             # Klipleri temizle
@@ -124,231 +538,501 @@ class VideoCreator:
                     clip.close()
                 except:
                     pass
+            if final_video is not None:
+                self._release_audio_bed(final_video)
+            if scene_window is not None:
+                scene_window.close()
             raise
     
-    def _apply_zoom_effect(self, clip, duration):
-        """Görsele zoom efekti uygular (Ken Burns efekti)"""
+    def _create_streaming_clip(self, renderer, timeline: Timeline):
+        """
+        Tüm hikaye için tek bir akış klibi oluşturur
+        
+        Sahne başına ImageClip/AudioFileClip açılmaz: sahne sınırları zaman çizelgesinden
+        gelir, ses hazır ses yatağından gelir ve görseller SceneSourceWindow ile en fazla
+        max_open_scenes tanesi açık kalacak şekilde sırayla yüklenir.
+        
+        Returns:
+            (klip, sahne penceresi) - pencere yazım bitince kapatılmalıdır
+        """
+        scene_specs = timeline.scene_specs()
+        starts = [scene['start_frame'] for scene in timeline.scenes]
+        
+        scene_window = SceneSourceWindow(
+            scene_specs, (renderer.width, renderer.height), self.max_open_scenes
+        )
+        
+        def frame_function(t):
+            # Frame indeksinden sahneyi bul (sınırlar ffmpeg backend'leriyle aynı)
+            frame_index = int(t * renderer.fps + 1e-6)
+            i = max(bisect.bisect_right(starts, frame_index) - 1, 0)
+            return scene_window.get(i).get_frame(t - starts[i] / float(renderer.fps))
+        
+        clip = VideoClip(frame_function=frame_function, duration=timeline.duration)
+        print(f"🌊 Akış modu: {len(scene_specs)} sahne, aynı anda en fazla "
+              f"{self.max_open_scenes} sahne açık")
+        return clip, scene_window
+    
+    def _build_scene_specs(self, image_files: List[str], audio_files: List[str],
+                           story_title: str, scenes: List[Dict] = None) -> List[Dict]:
+        """
+        Zaman çizelgesi için sahne listesini (görsel, ses, süre, zoom, kırpma odağı) oluşturur
+        
+        Sahnedeki 'crop_x' (0-1) dikey sürümlerin kırpma odağı olarak kullanılır;
+        yoksa odak görselden tahmin edilir (kaydedilen zaman çizelgesinden sonradan
+        ek sürüm de üretilebilsin diye her zaman).
+        """
+        scene_specs = []
+        for i, (image_file, audio_file) in enumerate(zip(image_files, audio_files)):
+            # SES DOSYASININ GERÇEK SÜRESİNİ KULLAN
+            duration = get_duration(audio_file)
+            zoom_type, start_scale, end_scale = self._choose_zoom(f"{story_title}:{i+1}")
+            scene = scenes[i] if scenes is not None and isinstance(scenes[i], dict) else {}
+            scene_specs.append({
+                'image_path': image_file,
+                'audio_path': audio_file,
+                'duration': duration,
+                'zoom': zoom_type,
+                'start_scale': start_scale,
+                'end_scale': end_scale,
+                'crop_x': scene.get('crop_x', self._estimate_crop_x(image_file)),
+            })
+            for key in SOURCE_SCENE_KEYS:
+                if key in scene:
+                    scene_specs[-1][key] = scene[key]
+            print(f"📹 Sahne {i+1}/{len(image_files)}: ses={duration:.1f}s, zoom={zoom_type}")
+        return scene_specs
+    
+    def _render_timeline_pipe(self, timeline: Timeline) -> str:
+        """
+        Frame'leri Python'da üretip ham pipe ile ffmpeg'e gönderir
+        
+        ZoomEngine her frame'i doğrudan halkadaki yeniden kullanılan tampona yazar;
+        MoviePy'nin frame başına dizi ayırma ve kopyalama adımı yoktur.
+        """
         try:
-            import random
+            scene_specs = timeline.scene_specs()
             
-            # Rastgele zoom yönü seç (zoom-in veya zoom-out)
-            zoom_type = random.choice(['in', 'out'])
+            output_path = self._get_output_path(timeline.title)
+            print(f"💾 Video kaydediliyor: {os.path.basename(output_path)}")
             
-            if zoom_type == 'in':
-                # Zoom-in: Normal boyuttan başla, yakınlaş
-                start_scale = 1.0
-                end_scale = 1.3
+            renderer = self._timeline_renderer(timeline)
+            counts = timeline.frame_counts
+            total_duration = timeline.duration
+            intro, outro = self._title_card_segments(renderer, timeline)
+            if intro or outro:
+                # Hikaye sessiz yazılır; kartlar ve ses birleştirmede eklenir
+                video_path = os.path.join(self.temp_dir, 'story_video.mp4')
+                audio_bed = None
             else:
-                # Zoom-out: Yakından başla, uzaklaş
-                start_scale = 1.3
-                end_scale = 1.0
-            
-            def zoom_effect(get_frame, t):
-                """Her frame için zoom uygula"""
-                # Zamanla ölçeği değiştir (linear interpolation)
-                progress = t / duration
-                current_scale = start_scale + (end_scale - start_scale) * progress
-                
-                frame = get_frame(t)
-                h, w = frame.shape[:2]
-                
-                # Yeni boyutları hesapla
-                new_h, new_w = int(h * current_scale), int(w * current_scale)
-                
-                # Görüntüyü yeniden boyutlandır
-                from PIL import Image
-                img = Image.fromarray(frame)
-                img_resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                
-                # Merkeze göre kırp
-                left = (new_w - w) // 2
-                top = (new_h - h) // 2
-                img_cropped = img_resized.crop((left, top, left + w, top + h))
-                
-                import numpy as np
-                return np.array(img_cropped)
+                video_path = output_path
+                audio_bed = self._build_audio_bed(timeline, total_duration)
             
-            # Efekti uygula
-            clip = clip.transform(zoom_effect)
-            print(f"  ✓ Zoom efekti uygulandı: {zoom_type}")
-            return clip
+            print(f"⚙️  Frame'ler ffmpeg pipe'ına yazılıyor ({sum(counts)} frame)...")
+            scene_window = SceneSourceWindow(
+                scene_specs, (renderer.width, renderer.height), max(self.max_open_scenes, 1)
+            )
+            try:
+                with FramePipeWriter(
+                    video_path, renderer.width, renderer.height, renderer.fps,
+                    renderer.video_encoder_args(),
+                    audio_path=audio_bed,
+                    audio_args=renderer.audio_encoder_args(),
+                    duration=total_duration,
+                    pix_fmt=self.pipe_pix_fmt,
+                    ring_size=self.pipe_ring_size
+                ) as writer:
+                    for i, (scene, frames) in enumerate(zip(scene_specs, counts)):
+                        # Zoom motoru sahne başına bir kez oluşturulur (sıradaki arka planda
+                        # hazırlanır, bitenler bırakılır); frame'ler tampona yazılır
+                        engine = scene_window.get(i)
+                        if renderer.is_still(scene):
+                            # Durağan sahne: frame bir kez üretilir, sonra sadece kopyalanır
+                            still_frame = engine.get_frame(0.0)
+                            for _ in range(frames):
+                                writer.write_frame(still_frame)
+                        else:
+                            for k in range(frames):
+                                t = k / float(renderer.fps)
+                                writer.render_frame(lambda buffer, engine=engine, t=t: engine.get_frame(t, out=buffer))
+                        del engine
+            finally:
+                scene_window.close()
             
+            if intro or outro:
+                self._attach_title_cards(renderer, video_path, output_path, timeline, intro, outro)
+            
+            print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+            return output_path
+        
         except Exception as e:
-            print(f"  ⚠ Zoom efekti uygulanamadı: {e}")
-            return clip
+            print(f"✗ Video oluşturma hatası: {e}")
+            raise
     
-    def _add_title_and_credits(self, main_video, story_title: str):
-        """Video'ya başlık ve bitiş ekranları ekler"""
+    def _render_timeline_ffmpeg(self, timeline: Timeline, renditions: List[Dict] = None,
+                                backend: str = None, output_path: str = None) -> str:
+        """
+        Zaman çizelgesini MoviePy yerine ffmpeg ile render eder
+        
+        "ffmpeg" backend'i tek bir filtergraph komutu, "parallel" backend'i ise
+        sahne başına paralel segment + stream copy birleştirme kullanır.
+        Ek sürümler (renditions) aynı kompozisyon geçişinden split/scale/crop ile üretilir.
+        Geçişler (xfade) sahne sınırlarına ortalanır; ses yatağı kaydırılmaz, anlatım hizalı kalır.
+        """
+        backend = backend or self.render_backend
         try:
-            # Başlık ekranı oluştur
-            title_clip = self._create_title_screen(story_title, duration=3)
+            scene_specs = timeline.scene_specs()
+            
+            output_path = output_path or self._get_output_path(timeline.title)
+            print(f"💾 Video kaydediliyor: {os.path.basename(output_path)}")
             
-            # Bitiş ekranı oluştur
-            credits_clip = self._create_credits_screen(duration=3)
+            # Ken Burns kapalıysa tüm sahneler durağan: x264'ü durağan görüntüye ayarla
+            # (tune PPS'i değiştirir; concat için tüm segmentlerde aynı olmalı)
+            renderer = self._timeline_renderer(timeline)
+            if all(renderer.is_still(scene) for scene in scene_specs):
+                renderer.tune = "stillimage"
+            renderer.transition = timeline.transition
+            renderer.transition_duration = timeline.transition_duration
+            intro, outro = self._title_card_segments(renderer, timeline)
             
-            # Tüm klipleri birleştir
-            full_video = concatenate_videoclips([title_clip, main_video, credits_clip])
+            # Ek sürümler: kendi çıktı yolu ve kendi boyutunda kartları
+            rendition_specs = []
+            for rendition in renditions or []:
+                rendition_renderer = copy.copy(renderer)
+                rendition_renderer.width = rendition['width']
+                rendition_renderer.height = rendition['height']
+                rendition_intro, rendition_outro = self._title_card_segments(rendition_renderer, timeline)
+                rendition_specs.append(dict(
+                    rendition,
+                    output_path=self._get_output_path(timeline.title, rendition['name']),
+                    renderer=rendition_renderer,
+                    intro=rendition_intro,
+                    outro=rendition_outro
+                ))
+                print(f"💾 Ek sürüm: {rendition['name']} ({rendition['width']}x{rendition['height']})")
             
-            return full_video
+            # Ses yatağı tüm sürümlerde ortak (anlatım başlık kartı kadar kaydırılır)
+            intro_duration = sum(frames for _, frames in intro) / float(renderer.fps)
+            outro_duration = sum(frames for _, frames in outro) / float(renderer.fps)
+            audio_bed = self._build_audio_bed(
+                timeline, intro_duration + timeline.duration + outro_duration, offset=intro_duration
+            )
             
+            if backend == "parallel":
+                # Kartlar sahne segmentleriyle aynı concat listesine girer (tek birleştirme)
+                renderer.render_parallel(
+                    scene_specs,
+                    output_path,
+                    audio_path=audio_bed,
+                    workers=self.render_workers,
+                    segment_cache=self.segment_cache,
+                    intro=intro,
+                    outro=outro,
+                    renditions=rendition_specs
+                )
+            elif intro or outro or any(r['intro'] or r['outro'] for r in rendition_specs):
+                # Hikaye sessiz yazılır; her sürüm kendi kartlarıyla birleştirilir
+                video_path = os.path.join(self.temp_dir, 'story_video.mp4')
+                story_renditions = [
+                    dict(r, output_path=os.path.join(self.temp_dir, f"story_video_{r['name']}.mp4"))
+                    for r in rendition_specs
+                ]
+                renderer.render(scene_specs, video_path, renditions=story_renditions)
+                self._attach_title_cards(renderer, video_path, output_path,
+                                         timeline, intro, outro, audio_bed)
+                for rendition, story_rendition in zip(rendition_specs, story_renditions):
+                    self._attach_title_cards(rendition['renderer'], story_rendition['output_path'],
+                                             rendition['output_path'], timeline,
+                                             rendition['intro'], rendition['outro'], audio_bed)
+            else:
+                renderer.render(scene_specs, output_path, audio_path=audio_bed,
+                                renditions=rendition_specs)
+            
+            self.rendition_outputs = {r['name']: r['output_path'] for r in rendition_specs}
+            print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+            for name, path in self.rendition_outputs.items():
+                print(f"✅ {name} sürümü: {path}")
+            return output_path
+        
         except Exception as e:
-            print(f"⚠ Başlık/bitiş ekranı eklenemedi: {e}")
-            return main_video
+            print(f"✗ Video oluşturma hatası: {e}")
+            raise
     
-    def _create_title_screen(self, title: str, duration: float = 3):
-        """Başlık ekranı oluşturur"""
+    def _estimate_crop_x(self, image_path: str, aspect: float = 9 / 16) -> float:
+        """
+        Dikey kırpma penceresi için yatay odak noktasını (0-1) tahmin eder
+        
+        Küçültülmüş görselde kenar (gradyan) enerjisi en yüksek olan pencere seçilir;
+        ana figür genelde en detaylı bölgededir.
+        """
         try:
-            # Siyah arka plan (MoviePy 2.x syntax)
-            title_clip = ColorClip(size=(1920, 1080), color=(0, 0, 0)).with_duration(duration)
-            
-            # Başlık metni (MoviePy 2.x syntax)
-            title_text = TextClip(
-                text=title,
-                font_size=80,
-                color='white',
-                font='Arial-Bold'
-            ).with_position('center').with_duration(duration)
-            
-            # Alt yazı
-            subtitle_text = TextClip(
-                text="Yapay Zeka ile Hikaye Anlatımı",
-                font_size=40,
-                color='lightgray',
-                font='Arial'
-            ).with_position(('center', 0.7), relative=True).with_duration(duration)
-            
-            # Tüm elementleri birleştir
-            title_screen = CompositeVideoClip([title_clip, title_text, subtitle_text])
-            
-            return title_screen
+            import numpy as np
+            from PIL import Image
             
-        except Exception as e:
-            print(f"⚠ Başlık ekranı oluşturulamadı: {e}")
-            # Basit siyah ekran döndür
-            return ColorClip(size=(1920, 1080), color=(0, 0, 0)).with_duration(duration)
+            with Image.open(image_path) as img:
+                small = img.convert('L').resize((192, 108))
+            pixels = np.asarray(small, dtype=np.float32)
+            energy = np.abs(np.diff(pixels, axis=1)).sum(axis=0)
+            window = max(int(round(108 * aspect)), 1)
+            if window >= len(energy):
+                return 0.5
+            sums = np.convolve(energy, np.ones(window), mode='valid')
+            return float(np.argmax(sums)) / (len(sums) - 1) if len(sums) > 1 else 0.5
+        except Exception:
+            return 0.5
+    
+    def _get_output_path(self, story_title: str, suffix: str = None, extension: str = ".mp4") -> str:
+        """
+        Hikaye isminden güvenli video dosya yolunu oluşturur
+        
+        Args:
+            suffix: Ek sürüm adı
+            extension: Dosya uzantısı (ör. ".timeline.json" videonun yanındaki zaman çizelgesi)
+        """
+        # Dosya adı için güvenli karakterler (Windows uyumlu)
+        safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in story_title)
+        safe_title = safe_title.strip().replace(' ', '_')[:50]  # Maksimum 50 karakter
+        if self.draft:
+            safe_title = f"{safe_title}_draft"
+        if suffix:
+            safe_title = f"{safe_title}_{suffix}"
+        return os.path.join(self.output_dir, f"{safe_title}{extension}")
+    
+    def _choose_zoom(self, seed: str = None) -> Tuple[str, float, float]:
+        """
+        Zoom yönünü ve başlangıç/bitiş ölçeklerini seçer
+        
+        Args:
+            seed: Sahneye özgü tohum (ör. "hikaye:sahne_no"); aynı sahne her
+                  çalıştırmada aynı yönü alır, böylece segment önbelleği çalışır
+        """
+        import random
+        
+        # Ken Burns kapalıysa hareketsiz sahne (durağan görüntü yolu kullanılır)
+        if not self.ken_burns:
+            return 'none', 1.0, 1.0
+        
+        # Sahne tohumuna göre deterministik zoom yönü seç (zoom-in veya zoom-out)
+        zoom_type = random.Random(seed).choice(['in', 'out'])
+        
+        if zoom_type == 'in':
+            # Zoom-in: Normal boyuttan başla, yakınlaş
+            return zoom_type, 1.0, 1.3
+        # Zoom-out: Yakından başla, uzaklaş
+        return zoom_type, 1.3, 1.0
     
-    def _create_credits_screen(self, duration: float = 3):
-        """Bitiş ekranı oluşturur"""
+    def _apply_zoom_effect(self, image_path: str, duration: float, zoom_seed: str = None,
+                           scales: Tuple[float, float] = None):
+        """
+        Görsele zoom efekti uygular (Ken Burns efekti)
+        
+        Args:
+            scales: (başlangıç, bitiş) ölçeği; verilirse (ör. zaman çizelgesinden) tohumla seçilmez
+        """
+        if scales is not None:
+            start_scale, end_scale = scales
+            zoom_type = 'none' if start_scale == end_scale else ('in' if end_scale > start_scale else 'out')
+        else:
+            zoom_type, start_scale, end_scale = self._choose_zoom(zoom_seed)
+        
+        if start_scale == end_scale == 1.0:
+            # Hareketsiz sahne: tek frame, frame başına dönüşüm yok
+            return ImageClip(image_path).with_duration(duration).resized((1920, 1080))
+        
         try:
-            # Koyu mavi arka plan (MoviePy 2.x syntax)
-            credits_clip = ColorClip(size=(1920, 1080), color=(25, 25, 50)).with_duration(duration)
-            
-            # Teşekkür metni
-            thanks_text = TextClip(
-                text="Dinlediğiniz İçin Teşekkürler!",
-                font_size=60,
-                color='white',
-                font='Arial-Bold'
-            ).with_position('center').with_duration(duration)
-            
-            # Alt bilgi
-            info_text = TextClip(
-                text="Bu video AI teknolojileri ile oluşturulmuştur\n🎨 Görseller: AI Generated\n🎤 Ses: TTS\n🎬 Video: Otomatik",
-                font_size=30,
-                color='lightblue',
-                font='Arial'
-            ).with_position(('center', 0.75), relative=True).with_duration(duration)
-            
-            # Tüm elementleri birleştir
-            credits_screen = CompositeVideoClip([credits_clip, thanks_text, info_text])
-            
-            return credits_screen
+            # Görsel tek sefer çözülür ve 1.3x boyuta ölçeklenir;
+            # her frame sadece kırpma + tek resample (yeniden kullanılan tampon)
+            engine = ZoomEngine.from_path(
+                image_path,
+                size=(1920, 1080),
+                start_scale=start_scale,
+                end_scale=end_scale,
+                duration=duration
+            )
+            clip = VideoClip(frame_function=engine.get_frame, duration=duration)
+            print(f"  ✓ Zoom efekti uygulandı: {zoom_type}")
+            return clip
             
         except Exception as e:
-            print(f"⚠ Bitiş ekranı oluşturulamadı: {e}")
-            # Basit renkli ekran döndür
-            return ColorClip(size=(1920, 1080), color=(25, 25, 50)).with_duration(duration)
+            print(f"  ⚠ Zoom efekti uygulanamadı: {e}")
+            return ImageClip(image_path).with_duration(duration).resized((1920, 1080))
     
-    def _add_background_music(self, video_clip, volume: float = 0.05):
-        """Video'ya fon müziği ekler (rastgele seçim)"""
+    def _title_card_segments(self, renderer, timeline: Timeline) -> Tuple[List, List]:
+        """
+        Başlık ve bitiş kartı segmentlerini döndürür ([(yol, frame sayısı)], [(yol, frame sayısı)])
+        
+        Kart ayarları zaman çizelgesinden okunur. Kartlar hikayeyi kodlayan renderer'ın
+        ayarlarıyla kodlanır; böylece stream copy ile eklenebilirler. Kapalıysa veya
+        üretilemezse boş listeler döner.
+        """
+        cards = timeline.title_cards
+        if not cards:
+            return [], []
         try:
-            import random
-            import glob
-            
-            # musics/ klasöründeki tüm .mp3 dosyalarını bul
-            music_files = glob.glob(os.path.join("musics", "*.mp3"))
-            
-            if not music_files:
-                print(f"⚠ musics/ klasöründe hiç müzik dosyası bulunamadı!")
-                return video_clip
-            
-            # Rastgele bir müzik seç
-            background_music_path = random.choice(music_files)
-            music_name = os.path.basename(background_music_path)
-            
-            print(f"🎵 Fon müziği ekleniyor: {music_name} (ses seviyesi: %{int(volume*100)})")
-            
-            # Fon müziğini yükle
-            bg_music = AudioFileClip(background_music_path)
-            
-            # Müziği video süresi kadar döngüye al (loop)
-            if bg_music.duration < video_clip.duration:
-                # Müzik kısaysa, döngüye al
-                loops_needed = int(video_clip.duration / bg_music.duration) + 1
-                bg_music = concatenate_audioclips([bg_music] * loops_needed)
-            
-            # Müziği video süresi kadar kes
-            bg_music = bg_music.subclipped(0, video_clip.duration)
-            
-            # Ses seviyesini ayarla (%5)
-            bg_music = bg_music.with_volume_scaled(volume)
-            
-            # Orijinal ses ile fon müziğini birleştir
-            if video_clip.audio:
-                final_audio = CompositeAudioClip([video_clip.audio, bg_music])
-                video_clip = video_clip.with_audio(final_audio)
-            else:
-                video_clip = video_clip.with_audio(bg_music)
-            
-            print("✓ Fon müziği başarıyla eklendi")
-            return video_clip
-            
+            builder = TitleCardBuilder(renderer, self.card_cache, cards['style'])
+            intro = [builder.segment("title", timeline.title, cards['title_duration'])]
+            outro = [builder.segment("credits", duration=cards['credits_duration'])]
+            return intro, outro
+        except Exception as e:
+            print(f"⚠ Başlık/bitiş kartı oluşturulamadı: {e}")
+            return [], []
+    
+    def _attach_title_cards(self, renderer, video_path: str, output_path: str,
+                            timeline: Timeline, intro: List, outro: List,
+                            audio_bed: str = None) -> str:
+        """
+        Sessiz hikaye videosunu kartlarla stream copy birleştirir ve ses yatağını ekler
+        
+        audio_bed verilmezse (anlatım başlık kartı kadar kaydırılarak) burada oluşturulur.
+        """
+        # Frame sayısı MP4 başlığından okunamazsa hikaye zaman çizelgesindeki kadardır
+        story_frames = probe(video_path).get('frame_count') or timeline.total_frames
+        segments = intro + [(video_path, story_frames)] + outro
+        counts = [frames for _, frames in segments]
+        total_duration = sum(counts) / float(renderer.fps)
+        intro_duration = sum(frames for _, frames in intro) / float(renderer.fps)
+        
+        if audio_bed is None:
+            audio_bed = self._build_audio_bed(timeline, total_duration, offset=intro_duration)
+        print("🔗 Başlık/bitiş kartları ekleniyor (stream copy)...")
+        renderer.concat_segments(
+            [path for path, _ in segments],
+            output_path,
+            total_duration,
+            audio_bed,
+            frame_counts=counts
+        )
+        return output_path
+    
+    def _add_background_music(self, video_clip, timeline: Timeline):
+        """Video'ya anlatım + fon müziğinden oluşan hazır ses yatağını ekler"""
+        try:
+            bed_path = self._build_audio_bed(timeline, video_clip.duration)
+            return video_clip.with_audio(AudioFileClip(bed_path))
+        
         except Exception as e:
             print(f"⚠ Fon müziği eklenemedi: {e}")
             return video_clip
     
+    def _release_audio_bed(self, video_clip):
+        """
+        _add_background_music'in eklediği ses yatağı klibini kapatır ve geçici WAV'ı siler
+        
+        Akış klibinin close'u sesine dokunmaz; yatak okuyucusu burada ayrıca kapatılır.
+        """
+        audio_clip = getattr(video_clip, 'audio', None)
+        if audio_clip is None:
+            return
+        audio_clip.close()
+        video_clip.audio = None
+        bed_path = getattr(audio_clip, 'filename', None)
+        if bed_path and os.path.dirname(os.path.abspath(bed_path)) == os.path.abspath(self.temp_dir):
+            try:
+                os.remove(bed_path)
+            except OSError:
+                pass
+    
+    def _build_audio_bed(self, timeline: Timeline, duration: float, offset: float = 0.0) -> str:
+        """
+        Ana anlatım ve fon müziğini NumPy ile tek seferde karıştırıp WAV'a yazar
+        
+        Encoder bu dosyayı doğrudan mux eder; video yazılırken parça parça karıştırma yapılmaz.
+        Anlatım zaman çizelgesindeki tek ana WAV'dan okunur (sahne başına okuyucu açılmaz).
+        offset: Anlatımın başlayacağı an (başlık kartı süresi); müzik tüm videoyu kaplar.
+        """
+        background_music_path = timeline.music_path
+        if background_music_path and not os.path.exists(background_music_path):
+            print(f"⚠ Fon müziği bulunamadı: {background_music_path}")
+            background_music_path = None
+        if background_music_path:
+            print(f"🎵 Fon müziği ekleniyor: {os.path.basename(background_music_path)} "
+                  f"(ses seviyesi: %{int(timeline.music_volume*100)})")
+        
+        music_samples = None
+        if background_music_path:
+            try:
+                music_samples = self.music_library.samples(background_music_path)
+            except Exception as e:
+                print(f"⚠ Müzik kütüphanesi kullanılamadı, parça doğrudan çözülüyor: {e}")
+        
+        bed_path = os.path.join(self.temp_dir, 'audio_bed.wav')
+        AudioMixer().mix(
+            [timeline.narration_path] if timeline.narration_path else [],
+            bed_path,
+            music_path=background_music_path,
+            volume=timeline.music_volume,
+            duration=duration,
+            offset=offset,
+            music_samples=music_samples
+        )
+        
+        print("✓ Ses yatağı hazırlandı (anlatım + fon müziği)")
+        return bed_path
+    
+    def _select_background_music(self, seed: str = None) -> str:
+        """
+        musics/ klasöründen fon müziği seçer (yoksa None)
+        
+        Kütüphane indeksi önce güncellenir: yeni veya değişen parçalar bir kez çözülür.
+        
+        Args:
+            seed: Seçim tohumu (ör. hikaye başlığı); aynı hikaye hep aynı müziği alır
+        """
+        music_path = self.music_library.choose(seed)
+        if music_path is None:
+            print(f"⚠ musics/ klasöründe hiç müzik dosyası bulunamadı!")
+        return music_path
+    
     def get_video_info(self, video_path: str) -> Dict[str, any]:
         """Video dosyası hakkında bilgi döndürür"""
         try:
-            video = VideoFileClip(video_path)
+            # Sadece konteyner başlığı okunur (ffmpeg okuyucu başlatılmaz)
+            probed = probe(video_path)
             info = {
-                'duration': video.duration,
-                'fps': video.fps,
-                'size': video.size,
+                'duration': probed['duration'],
+                'fps': probed.get('fps'),
+                'size': probed.get('size'),
                 'filename': os.path.basename(video_path),
                 'filesize': os.path.getsize(video_path),
                 'format': os.path.splitext(video_path)[1]
             }
-            video.close()
             return info
         except Exception as e:
             print(f"✗ Video bilgisi alınamadı: {e}")
             return {}
     
     def create_preview_video(self, video_path: str, start_time: float = 0, 
-                           duration: float = 30) -> str:
-        """Video'dan önizleme klipi oluşturur"""
+                           duration: float = 30, accurate: bool = False) -> str:
+        """
+        Video'dan önizleme klipi oluşturur
+        
+        Varsayılan olarak yeniden kodlama yapılmaz: en yakın keyframe'den stream copy
+        ile kesilir, süre video uzunluğundan bağımsızdır. start_time=0 her zaman bir
+        keyframe olduğundan varsayılan önizleme zaten frame hassasiyetindedir.
+        
+        Args:
+            accurate: True ise frame hassasiyetinde kesmek için yeniden kodlar
+        """
         try:
-            video = VideoFileClip(video_path)
-            
-            # Önizleme klipini kes (MoviePy 2.x syntax)
-            preview = video.subclipped(start_time, min(start_time + duration, video.duration))
-            
             # Önizleme dosyasını kaydet
             preview_filename = f"preview_{os.path.basename(video_path)}"
             preview_path = os.path.join(self.output_dir, preview_filename)
             
-            preview.write_videofile(
-                preview_path,
-                fps=24,
-                codec='libx264',
-                preset='fast'
-            )
+            # -ss girişten önce: ffmpeg başlangıca (keyframe) doğrudan atlar, baştan çözmez
+            args = ["-ss", f"{start_time:.3f}", "-i", video_path, "-t", f"{duration:.3f}"]
+            
+            if accurate:
+                args += [
+                    "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+                    "-pix_fmt", "yuv420p", "-c:a", "aac"
+                ]
+            else:
+                args += ["-map", "0", "-c", "copy", "-avoid_negative_ts", "make_zero"]
             
-            video.close()
-            preview.close()
+            run_ffmpeg(args + ["-movflags", "+faststart", preview_path])
             
-            print(f"✓ Önizleme oluşturuldu: {preview_path}")
+            mode = "yeniden kodlandı" if accurate else "stream copy"
+            print(f"✓ Önizleme oluşturuldu ({mode}): {preview_path}")
             return preview_path
             
         except Exception as e:
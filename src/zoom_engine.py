@@ -0,0 +1,107 @@
+"""
+Ken Burns zoom çekirdeği
+Sahne görselini bir kez çözüp maksimum zoom boyutuna ölçekler,
+her frame'i ucuz bir kırpma + tek resample ile yeniden kullanılan bir tampona üretir
+"""
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+
+# OpenCV varsa affine warp kullan (dst tamponuna doğrudan yazar), yoksa PIL'e düş
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+
+class ZoomEngine:
+    def __init__(self, image: Image.Image, size: Tuple[int, int] = (1920, 1080),
+                 start_scale: float = 1.0, end_scale: float = 1.3,
+                 duration: float = 1.0):
+        """
+        Zoom motoru
+
+        Args:
+            image: Sahne görseli (PIL Image)
+            size: Çıktı frame boyutu (genişlik, yükseklik)
+            start_scale: Başlangıç ölçeği (1.0 = zoom yok)
+            end_scale: Bitiş ölçeği
+            duration: Sahne süresi (saniye)
+        """
+        self.width, self.height = size
+        self.start_scale = start_scale
+        self.end_scale = end_scale
+        self.duration = max(duration, 1e-6)
+        self.max_scale = max(start_scale, end_scale, 1.0)
+
+        # Görseli TEK SEFER maksimum zoom boyutuna ölçekle (LANCZOS sadece burada)
+        scaled_w = int(round(self.width * self.max_scale))
+        scaled_h = int(round(self.height * self.max_scale))
+        scaled = image.convert("RGB").resize((scaled_w, scaled_h), Image.Resampling.LANCZOS)
+        self._source_image = scaled
+        self._source = np.ascontiguousarray(np.asarray(scaled, dtype=np.uint8))
+
+        # Her frame bu tampona yazılır (yeni dizi ayrılmaz)
+        self._buffer = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+    @classmethod
+    def from_path(cls, image_path: str, **kwargs) -> "ZoomEngine":
+        """Görsel dosyasından zoom motoru oluşturur"""
+        with Image.open(image_path) as img:
+            img.load()
+            return cls(img, **kwargs)
+
+    def scale_at(self, t: float) -> float:
+        """t anındaki zoom ölçeğini döndürür (lineer interpolasyon)"""
+        progress = min(max(t / self.duration, 0.0), 1.0)
+        return self.start_scale + (self.end_scale - self.start_scale) * progress
+
+    def _crop_box(self, scale: float) -> Tuple[float, float, float, float]:
+        """Ölçeklenmiş kaynak görselde görünen (merkezli) alanı döndürür"""
+        src_h, src_w = self._source.shape[:2]
+        # Ölçek 1.0 iken tüm kaynak görünür, max_scale iken çıktı boyutu kadar alan
+        box_w = src_w / scale
+        box_h = src_h / scale
+        left = (src_w - box_w) / 2.0
+        top = (src_h - box_h) / 2.0
+        return left, top, box_w, box_h
+
+    def get_frame(self, t: float, out: np.ndarray = None) -> np.ndarray:
+        """
+        t anındaki frame'i üretir
+
+        Args:
+            t: Zaman (saniye)
+            out: Frame'in yazılacağı (yükseklik, genişlik, 3) uint8 tampon
+                 (verilmezse motorun kendi tamponu)
+
+        Not: Dönen dizi yeniden kullanılan tampondur, bir sonraki çağrıda üzerine yazılır.
+        """
+        buffer = self._buffer if out is None else out
+        left, top, box_w, box_h = self._crop_box(self.scale_at(t))
+        ratio_x = box_w / self.width
+        ratio_y = box_h / self.height
+
+        if CV2_AVAILABLE:
+            # Hedef piksel merkezini kaynak piksel merkezine eşleyen ters affine matris
+            matrix = np.array([
+                [ratio_x, 0.0, left + 0.5 * ratio_x - 0.5],
+                [0.0, ratio_y, top + 0.5 * ratio_y - 0.5],
+            ], dtype=np.float64)
+            cv2.warpAffine(
+                self._source, matrix, (self.width, self.height),
+                dst=buffer,
+                flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                borderMode=cv2.BORDER_REPLICATE
+            )
+        else:
+            # PIL: kırpma + resample tek çağrıda (alt-piksel hassas box)
+            frame = self._source_image.resize(
+                (self.width, self.height), Image.Resampling.BILINEAR,
+                box=(left, top, left + box_w, top + box_h)
+            )
+            np.copyto(buffer, np.asarray(frame))
+
+        return buffer
@@ -0,0 +1,80 @@
+"""
+Ortak test yardımcıları: küçük WAV/görsel üreticileri ve test klasöründe çalışan VideoCreator
+"""
+import os
+import sys
+import wave
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config import Config  # noqa: E402
+
+
+def write_tone(path, seconds, sample_rate=24000, channels=1, frequency=220.0):
+    """Tam olarak round(seconds * sample_rate) örnek uzunluğunda 16-bit ton WAV'ı yazar"""
+    frames = int(round(seconds * sample_rate))
+    t = np.arange(frames) / float(sample_rate)
+    samples = (np.sin(2 * np.pi * frequency * t) * 8000).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.repeat(samples[:, None], channels, axis=1).tobytes())
+    return str(path)
+
+
+def write_image(path, color, size=(320, 180)):
+    """Düz renkli görsel yazar"""
+    Image.new('RGB', size, color).save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def story_files(tmp_path):
+    """Verilen sürelerde sahne görselleri ve sesleri üretir: (görseller, sesler)"""
+    def make(durations):
+        images, audios = [], []
+        for i, seconds in enumerate(durations):
+            images.append(write_image(tmp_path / f"scene_{i}.png", (40 * i % 256, 120, 200 - 30 * i % 200)))
+            audios.append(write_tone(tmp_path / f"scene_{i}.wav", seconds, frequency=220.0 + 40 * i))
+        return images, audios
+    return make
+
+
+@pytest.fixture
+def make_creator(tmp_path, monkeypatch):
+    """
+    Test klasöründe çalışan VideoCreator üretir
+
+    Önbellekler ve çıktılar tmp_path altındadır; verilen ayarlar Config'in üzerine yazılır
+    (küçük çözünürlük ve "draft" encoder profili ile render'lar hızlıdır).
+    """
+    monkeypatch.chdir(tmp_path)
+    settings = {
+        'VIDEO_RENDER_BACKEND': 'parallel',
+        'VIDEO_ENCODER_PROFILE': 'draft',
+        'VIDEO_TITLE_CARDS': False,
+        'VIDEO_KEN_BURNS': False,
+        'VIDEO_SEGMENT_CACHE': False,
+        'VIDEO_CRF_SEARCH': False,
+        'VIDEO_RENDITIONS': [],
+        'VIDEO_TRANSITION': None,
+        'TITLE_CARD_DURATION': 1,
+        'CREDITS_CARD_DURATION': 1,
+        'SEGMENT_CACHE_DIR': str(tmp_path / 'cache' / 'segments'),
+        'CARD_CACHE_DIR': str(tmp_path / 'cache' / 'cards'),
+        'MUSIC_CACHE_DIR': str(tmp_path / 'cache' / 'music'),
+        'DRAFT_WIDTH': 320,
+        'DRAFT_HEIGHT': 180,
+    }
+
+    def make(draft=True, **overrides):
+        from src.video_creator import VideoCreator
+        for key, value in dict(settings, **overrides).items():
+            monkeypatch.setattr(Config, key, value, raising=False)
+        return VideoCreator(str(tmp_path / 'videos'), draft=draft)
+    return make
@@ -0,0 +1,99 @@
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from src.audio_mixer import AudioMixer, PCMWavWriter, decode_audio
+from src.media_probe import probe
+
+from conftest import write_tone
+
+
+def read_wav(path):
+    with wave.open(path, 'rb') as wav:
+        data = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+        return data.reshape(-1, wav.getnchannels()), wav.getframerate()
+
+
+def test_decode_audio_resamples_to_stereo(tmp_path):
+    path = write_tone(tmp_path / 'a.wav', 1.0, sample_rate=24000)
+    samples = decode_audio(path)
+    assert samples.shape[1] == 2
+    assert abs(len(samples) - 44100) <= 2
+
+
+def test_write_narration_places_scenes_on_boundaries(tmp_path):
+    mixer = AudioMixer(sample_rate=8000, channels=1)
+    first = write_tone(tmp_path / 'a.wav', 0.5, sample_rate=8000)
+    # İkinci ses sahnesinden uzun: sahne bitişinde kesilmeli
+    second = write_tone(tmp_path / 'b.wav', 1.0, sample_rate=8000)
+    output = mixer.write_narration([first, second], [(0.0, 0.75), (0.75, 1.5)], str(tmp_path / 'n.wav'))
+
+    samples, rate = read_wav(output)
+    assert rate == 8000
+    assert len(samples) == 12000
+    expected_first, _ = read_wav(first)
+    expected_second, _ = read_wav(second)
+    assert np.array_equal(samples[:4000], expected_first)
+    assert not samples[4000:6000].any()
+    assert np.array_equal(samples[6000:], expected_second[:6000])
+
+
+def test_mix_offsets_narration_and_loops_music(tmp_path):
+    mixer = AudioMixer(sample_rate=8000, channels=1)
+    narration = write_tone(tmp_path / 'n.wav', 0.5, sample_rate=8000)
+    music = np.full((3000, 1), 1000, dtype=np.int16)
+    output = mixer.mix([narration], str(tmp_path / 'bed.wav'), volume=0.5,
+                       duration=2.0, offset=0.25, music_samples=music)
+
+    samples, _ = read_wav(output)
+    expected_narration, _ = read_wav(narration)
+    assert len(samples) == 16000
+    # Müzik tüm süreyi kaplar (döngü), anlatım başlık kartı kadar kaydırılmış başlar
+    assert (samples[:2000] == 500).all()
+    assert (samples[6000:] == 500).all()
+    assert np.array_equal(samples[2000:6000], np.clip(expected_narration.astype(int) + 500, -32768, 32767))
+
+
+def test_pcm_writer_keeps_samples_split_across_chunks(tmp_path):
+    samples = (np.arange(5001) % 2000 - 1000).astype('<i2')
+    data = samples.tobytes()
+    path = str(tmp_path / 'stream.wav')
+    with PCMWavWriter(path, 24000) as writer:
+        # Tek sayıda baytlık parçalar örnekleri ortadan böler
+        for i in range(0, len(data), 333):
+            writer.write(data[i:i + 333])
+        info = writer.info()
+
+    written, sample_rate = read_wav(path)
+    assert sample_rate == 24000
+    assert np.array_equal(written[:, 0], samples)
+    assert info['frames'] == 5001
+    assert abs(info['duration'] - 5001 / 24000.0) < 1e-9
+    assert probe(path)['frames'] == info['frames']
+
+
+@pytest.mark.parametrize('max_open_scenes', [2, 0])
+def test_moviepy_render_releases_audio_bed(make_creator, story_files, monkeypatch, max_open_scenes):
+    from src import video_creator
+
+    opened = []
+    real_audio_file_clip = video_creator.AudioFileClip
+
+    def audio_file_clip(path, *args, **kwargs):
+        clip = real_audio_file_clip(path, *args, **kwargs)
+        opened.append(clip)
+        return clip
+
+    monkeypatch.setattr(video_creator, 'AudioFileClip', audio_file_clip)
+    images, audios = story_files([1.0, 0.75])
+    creator = make_creator(VIDEO_RENDER_BACKEND='moviepy')
+    creator.render_backend = 'moviepy'
+    creator.max_open_scenes = max_open_scenes
+    creator.create_story_video([{}] * 2, images, audios, 'Müzikli')
+
+    beds = [clip for clip in opened if clip.filename.endswith('audio_bed.wav')]
+    assert len(beds) == 1
+    assert beds[0].reader is None
+    assert not os.path.exists(beds[0].filename)
@@ -0,0 +1,58 @@
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from src.media_probe import probe
+from src.timeline import Timeline
+
+from conftest import write_tone
+
+AAC_FRAME = 1024 / 44100.0
+
+
+@pytest.fixture
+def rendered(make_creator, story_files):
+    """Ken Burns'lü, segment önbellekli 4 sahnelik render ve zaman çizelgesi"""
+    images, audios = story_files([1.93, 2.41, 1.52, 1.77])
+    creator = make_creator(VIDEO_SEGMENT_CACHE=True)
+    creator.ken_burns = True
+    path = creator.create_story_video([{}] * 4, images, audios, 'Yeniden')
+    return creator, Timeline.load(path.replace('.mp4', '.timeline.json')), audios
+
+
+def rebuild(creator, timeline, audios, name):
+    log = io.StringIO()
+    with redirect_stdout(log):
+        path = creator.rebuild_audio(timeline, audios, name=name)
+    return path, log.getvalue()
+
+
+@pytest.mark.parametrize('extra', [1.02, 0.2])
+def test_longer_scene_reencodes_only_that_scene(rendered, tmp_path, extra):
+    creator, timeline, audios = rendered
+    audios = list(audios)
+    audios[1] = write_tone(tmp_path / 'longer.wav', 2.41 + extra)
+    path, log = rebuild(creator, timeline, audios, 'uzun')
+
+    assert '3 hazır, 1 sahne yeniden kodlanacak' in log
+    variant = Timeline.load(path.replace('.mp4', '.timeline.json'))
+    counts = variant.frame_counts
+    assert counts[0] == timeline.frame_counts[0]
+    assert counts[2:] == timeline.frame_counts[2:]
+    # Yeni anlatım kesilmez
+    assert counts[1] / 24.0 >= 2.41 + extra
+    info = probe(path)
+    assert info['video_duration'] == pytest.approx(variant.duration, abs=1e-6)
+    assert abs(info['audio_duration'] - info['video_duration']) <= AAC_FRAME + 1e-3
+
+
+def test_shorter_scene_within_tolerance_is_remuxed(rendered, tmp_path):
+    creator, timeline, audios = rendered
+    audios = list(audios)
+    audios[1] = write_tone(tmp_path / 'shorter.wav', 2.21)
+    path, log = rebuild(creator, timeline, audios, 'kisa')
+
+    assert 'yeniden kodlanmadan' in log
+    assert Timeline.load(path.replace('.mp4', '.timeline.json')).frame_counts == timeline.frame_counts
+    assert probe(path)['video_duration'] == pytest.approx(timeline.duration, abs=1e-6)
@@ -0,0 +1,42 @@
+import numpy as np
+from PIL import Image, ImageFilter
+
+from src.encoder_profiles import CRF_SEARCH_CRFS, search_title_crf
+from src.ffmpeg_renderer import FFmpegRenderer
+
+from conftest import write_image
+
+
+def write_detailed_image(path, size):
+    """İnce dokulu (sıkıştırması zor) görsel yazar"""
+    rng = np.random.default_rng(1)
+    noise = (rng.random((size[1], size[0], 3)) * 255).astype('uint8')
+    Image.fromarray(noise).filter(ImageFilter.GaussianBlur(1.5)).save(str(path))
+    return str(path)
+
+
+def scenes_for(image_path):
+    return [{'image_path': image_path, 'duration': 1.0} for _ in range(2)]
+
+
+def test_detailed_source_gets_crf_below_maximum(tmp_path):
+    # 1080p durağan sahne: küçültülmüş ölçümde en yüksek CRF de hedefi geçerdi
+    renderer = FFmpegRenderer(1920, 1080, 24, preset='veryfast', tune='stillimage',
+                              temp_dir=str(tmp_path))
+    image = write_detailed_image(tmp_path / 'detailed.png', (1920, 1080))
+    search = search_title_crf(renderer, scenes_for(image), str(tmp_path / 'search'),
+                              target_ssim=0.97, sample_count=1, sample_seconds=0.25)
+
+    assert search['crf'] < max(CRF_SEARCH_CRFS)
+    assert search['ssim'] >= 0.97
+    # Bir üstteki CRF denendiyse hedefin altında kalmıştır
+    higher = [r for r in search['results'] if r['crf'] > search['crf']]
+    assert higher and all(r['ssim'] < 0.97 for r in higher)
+
+
+def test_flat_source_gets_maximum_crf(tmp_path):
+    renderer = FFmpegRenderer(320, 180, 24, preset='medium', temp_dir=str(tmp_path))
+    image = write_image(tmp_path / 'flat.png', (30, 90, 160))
+    search = search_title_crf(renderer, scenes_for(image), str(tmp_path / 'search'),
+                              target_ssim=0.97, sample_count=1, sample_seconds=0.25)
+    assert search['crf'] == max(CRF_SEARCH_CRFS)
@@ -0,0 +1,47 @@
+import pytest
+
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.media_probe import probe
+from src.timeline import Timeline
+
+from conftest import write_image
+
+# AAC ses izi 1024 örneklik paketlerle biter
+AAC_FRAME = 1024 / 44100.0
+
+
+def assert_video_matches_audio(path, expected_seconds):
+    info = probe(path)
+    assert info['video_duration'] == pytest.approx(expected_seconds, abs=1e-6)
+    assert abs(info['audio_duration'] - info['video_duration']) <= AAC_FRAME + 1e-3
+
+
+def test_frame_counts_keep_cumulative_boundaries():
+    renderer = FFmpegRenderer(fps=24)
+    durations = [1.93, 2.41, 0.01, 1.52, 3.333]
+    counts = renderer.frame_counts(durations)
+
+    assert min(counts) >= 1
+    elapsed = 0.0
+    boundary = 0
+    for duration, frames in zip(durations, counts):
+        elapsed += duration
+        boundary += frames
+        assert abs(boundary - elapsed * 24) <= 1
+
+
+def test_still_segment_covers_its_frames(tmp_path):
+    renderer = FFmpegRenderer(160, 90, 24, preset='ultrafast', temp_dir=str(tmp_path))
+    image = write_image(tmp_path / 'a.png', (200, 10, 10), (160, 90))
+    for frames in (1, 2, 47):
+        path = renderer.render_scene_segment({'image_path': image}, frames, str(tmp_path / f'{frames}.mp4'))
+        assert probe(path)['video_duration'] == pytest.approx(frames / 24.0, abs=1e-6)
+
+
+@pytest.mark.parametrize('backend', ['parallel', 'ffmpeg'])
+def test_still_story_video_track_matches_audio(make_creator, story_files, backend):
+    images, audios = story_files([1.93, 2.41, 1.52])
+    creator = make_creator(VIDEO_RENDER_BACKEND=backend)
+    path = creator.create_story_video([{}] * 3, images, audios, 'Durağan')
+    timeline = Timeline.load(path.replace('.mp4', '.timeline.json'))
+    assert_video_matches_audio(path, timeline.duration)
@@ -0,0 +1,106 @@
+import subprocess
+import threading
+
+import numpy as np
+import pytest
+
+from src import frame_pipe
+from src.ffmpeg_renderer import FFmpegRenderer, get_ffmpeg_exe
+from src.frame_pipe import FramePipeWriter
+from src.media_probe import probe
+
+WIDTH, HEIGHT, FPS = 160, 96, 24
+
+
+def video_args():
+    return FFmpegRenderer(WIDTH, HEIGHT, FPS, preset='ultrafast').video_encoder_args()
+
+
+def first_frame(path):
+    """Çıktının ilk frame'ini RGB dizi olarak çözer"""
+    result = subprocess.run(
+        [get_ffmpeg_exe(), '-v', 'error', '-i', path, '-frames:v', '1',
+         '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'],
+        stdout=subprocess.PIPE, check=True
+    )
+    return np.frombuffer(result.stdout, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+
+
+def run_with_timeout(target, seconds=30):
+    """target'ı ayrı thread'de çalıştırır; takılırsa testi düşürür, hatayı geri verir"""
+    errors = []
+
+    def run():
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "frame pipe takıldı"
+    return errors
+
+
+@pytest.mark.parametrize('pix_fmt', [
+    'rgb24',
+    pytest.param('yuv420p', marks=pytest.mark.skipif(not frame_pipe.CV2_AVAILABLE, reason='OpenCV yok')),
+])
+def test_pipe_writes_every_frame(tmp_path, pix_fmt):
+    path = str(tmp_path / f'{pix_fmt}.mp4')
+    color = np.array([200, 40, 90], dtype=np.uint8)
+    # Halkadan çok daha fazla frame: tamponlar tekrar tekrar kullanılır
+    with FramePipeWriter(path, WIDTH, HEIGHT, FPS, video_args(), pix_fmt=pix_fmt, ring_size=3) as writer:
+        for k in range(50):
+            if k % 2:
+                writer.render_frame(lambda buffer: buffer.__setitem__(Ellipsis, color))
+            else:
+                writer.write_frame(np.broadcast_to(color, (HEIGHT, WIDTH, 3)))
+        assert writer.pix_fmt == pix_fmt
+
+    info = probe(path)
+    assert writer.frames_written == 50
+    assert info['frame_count'] == 50
+    assert info['video_duration'] == pytest.approx(50 / float(FPS), abs=1e-6)
+    assert np.abs(first_frame(path).reshape(-1, 3).mean(axis=0) - color).max() < 6
+
+
+def test_ffmpeg_exiting_early_raises_instead_of_hanging(tmp_path):
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    def write():
+        with FramePipeWriter(str(tmp_path / 'bad.mp4'), WIDTH, HEIGHT, FPS,
+                             ['-c:v', 'olmayan_kodlayici'], ring_size=2) as writer:
+            for _ in range(2000):
+                writer.write_frame(frame)
+
+    errors = run_with_timeout(write)
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+
+
+def test_ffmpeg_stopping_after_few_frames_is_reported(tmp_path):
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    def write():
+        with FramePipeWriter(str(tmp_path / 'short.mp4'), WIDTH, HEIGHT, FPS,
+                             video_args() + ['-frames:v', '3'], ring_size=2) as writer:
+            for _ in range(2000):
+                writer.write_frame(frame)
+
+    errors = run_with_timeout(write)
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+
+
+def test_error_while_rendering_stops_ffmpeg(tmp_path):
+    def fail(buffer):
+        raise ValueError("frame üretilemedi")
+
+    def write():
+        with FramePipeWriter(str(tmp_path / 'broken.mp4'), WIDTH, HEIGHT, FPS, video_args()) as writer:
+            writer.write_frame(np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8))
+            writer.render_frame(fail)
+        assert False, "hata yutuldu"
+
+    errors = run_with_timeout(write)
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
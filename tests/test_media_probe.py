@@ -0,0 +1,76 @@
+from src import media_probe
+from src.encoder_profiles import get_encoder_profile
+from src.ffmpeg_renderer import FFmpegRenderer, run_ffmpeg
+from src.media_probe import probe, probe_mp4, probe_wav, remember
+
+from conftest import write_image, write_tone
+
+
+def test_probe_wav_reads_exact_length(tmp_path):
+    path = write_tone(tmp_path / 'a.wav', 1.2345, sample_rate=24000)
+    info = probe_wav(path)
+    assert info['frames'] == 29628
+    assert info['duration'] == 29628 / 24000.0
+    assert (info['sample_rate'], info['channels']) == (24000, 1)
+
+
+def test_probe_wav_tolerates_streamed_size_field(tmp_path):
+    path = write_tone(tmp_path / 'a.wav', 0.5, sample_rate=8000)
+    with open(path, 'r+b') as f:
+        # Akışla yazılmış dosyalardaki gibi data boyutu 0xFFFFFFFF
+        data = f.read()
+        f.seek(data.index(b'data') + 4)
+        f.write(b'\xff\xff\xff\xff')
+    assert probe_wav(path)['frames'] == 4000
+
+
+def test_probe_mp4_constant_frame_rate(tmp_path):
+    path = str(tmp_path / 'cfr.mp4')
+    run_ffmpeg(['-f', 'lavfi', '-i', 'color=red:s=160x90:r=24:d=2', '-c:v', 'libx264',
+                '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', path])
+    info = probe_mp4(path)
+    assert info['frame_count'] == 48
+    assert info['fps'] == 24.0
+    assert info['size'] == [160, 90]
+    assert abs(info['video_duration'] - 2.0) < 1e-6
+
+
+def test_probe_mp4_variable_frame_rate_still_segment(tmp_path):
+    renderer = FFmpegRenderer(160, 90, 24, preset='ultrafast', temp_dir=str(tmp_path))
+    image = write_image(tmp_path / 'still.png', (0, 0, 255), (160, 90))
+    path = renderer.render_scene_segment({'image_path': image}, 60, str(tmp_path / 'still.mp4'))
+    info = probe_mp4(path)
+    assert info['fps'] == 24.0
+    assert abs(info['video_duration'] - 60 / 24.0) < 1e-6
+
+
+def test_probe_concatenated_still_and_card_output(make_creator, story_files):
+    # standard profilinde birleşim noktalarında 1 birimlik DTS aralıkları oluşur
+    images, audios = story_files([1.93, 2.41, 1.52])
+    creator = make_creator(VIDEO_TITLE_CARDS=True)
+    creator.encoder_profile = get_encoder_profile('standard')
+    path = creator.create_story_video([{}] * 3, images, audios, 'Birleşik')
+    info = probe_mp4(path)
+    assert info['fps'] == 24.0
+    assert probe(path)['fps'] == 24.0
+
+
+def test_fallback_without_ffprobe(tmp_path, monkeypatch):
+    monkeypatch.setattr(media_probe.shutil, 'which', lambda name: None)
+    path = str(tmp_path / 'clip.mkv')
+    run_ffmpeg(['-f', 'lavfi', '-i', 'color=red:s=160x90:r=24:d=1.5',
+                '-f', 'lavfi', '-i', 'sine=d=1.5', '-shortest',
+                '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', path])
+    info = probe(path)
+    assert abs(info['duration'] - 1.5) < 0.05
+    assert info['fps'] == 24.0
+    assert info['size'] == [160, 90]
+    assert info['has_audio']
+    assert 'frame_count' not in info
+
+
+def test_remember_skips_reading(tmp_path):
+    path = tmp_path / 'a.wav'
+    path.write_bytes(b'not a wav')
+    remember(str(path), {'duration': 3.25})
+    assert probe(str(path))['duration'] == 3.25
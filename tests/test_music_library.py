@@ -0,0 +1,106 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src import music_library
+from src.audio_mixer import CHANNELS
+from src.ffmpeg_renderer import run_ffmpeg
+from src.music_library import TARGET_LOUDNESS_DBFS, MusicLibrary, loudness_dbfs
+
+from conftest import write_tone
+
+
+def write_track(path, seconds, volume=1.0, frequency=220.0):
+    """Ton WAV'ını verilen ses seviyesinde MP3'e çevirir"""
+    wav_path = write_tone(f"{path}.wav", seconds, frequency=frequency)
+    run_ffmpeg(['-i', wav_path, '-af', f'volume={volume}', str(path)])
+    os.remove(wav_path)
+    return str(path)
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Kütüphanenin çözdüğü parçaları kaydeder"""
+    calls = []
+    decode_audio = music_library.decode_audio
+
+    def counting_decode(path, *args, **kwargs):
+        calls.append(os.path.basename(path))
+        return decode_audio(path, *args, **kwargs)
+
+    monkeypatch.setattr(music_library, 'decode_audio', counting_decode)
+    return calls
+
+
+def test_tracks_normalized_to_target_loudness(tmp_path):
+    musics = tmp_path / 'musics'
+    musics.mkdir()
+    loud = write_track(musics / 'loud.mp3', 2.0)
+    quiet = write_track(musics / 'quiet.mp3', 2.0, volume=0.1)
+    library = MusicLibrary(str(musics), str(tmp_path / 'cache'))
+
+    loud_info, quiet_info = library.info(loud), library.info(quiet)
+    # volume=0.1 kaynağı 20 dB kısar; normalize sonrası ikisi de hedef seviyede
+    assert loud_info['loudness_dbfs'] - quiet_info['loudness_dbfs'] == pytest.approx(20.0, abs=0.3)
+    for path, info in ((loud, loud_info), (quiet, quiet_info)):
+        assert info['gain'] == pytest.approx(10 ** ((TARGET_LOUDNESS_DBFS - info['loudness_dbfs']) / 20.0))
+        assert info['duration'] == pytest.approx(2.0, abs=0.1)
+        assert loudness_dbfs(library.samples(path)) == pytest.approx(TARGET_LOUDNESS_DBFS, abs=0.2)
+
+
+def test_cache_layout_is_index_and_npy(tmp_path):
+    musics = tmp_path / 'musics'
+    musics.mkdir()
+    track = write_track(musics / 'a.mp3', 1.0)
+    cache_dir = tmp_path / 'cache'
+    library = MusicLibrary(str(musics), str(cache_dir))
+    assert not cache_dir.exists()
+
+    assert library.refresh() == [track]
+    with open(cache_dir / 'index.json', encoding='utf-8') as f:
+        index = json.load(f)
+    entry = index[os.path.abspath(track)]
+    assert sorted(os.listdir(cache_dir)) == sorted(['index.json', entry['pcm']])
+    assert entry['pcm'].endswith('.npy')
+
+    samples = library.samples(track)
+    assert isinstance(samples, np.memmap) and not samples.flags.writeable
+    assert samples.dtype == np.int16 and samples.shape[1] == CHANNELS
+    assert np.array_equal(samples, np.load(cache_dir / entry['pcm']))
+
+
+def test_refresh_only_decodes_new_or_changed_tracks(tmp_path, decode_calls):
+    musics = tmp_path / 'musics'
+    musics.mkdir()
+    first = write_track(musics / 'a.mp3', 1.0)
+    second = write_track(musics / 'b.mp3', 1.0)
+    cache_dir = str(tmp_path / 'cache')
+
+    MusicLibrary(str(musics), cache_dir).refresh()
+    assert sorted(decode_calls) == ['a.mp3', 'b.mp3']
+
+    # İndeks diskten okunur: değişmeyen parçalar yeni süreçte de çözülmez
+    library = MusicLibrary(str(musics), cache_dir)
+    library.refresh()
+    assert len(decode_calls) == 2
+
+    old_pcm = library.info(second)['pcm']
+    write_track(musics / 'b.mp3', 1.5, frequency=330.0)
+    os.utime(second, ns=(1, 1))
+    library.refresh()
+    assert decode_calls[2:] == ['b.mp3']
+    assert library.info(second)['duration'] == pytest.approx(1.5, abs=0.1)
+    assert not os.path.exists(os.path.join(cache_dir, old_pcm))
+
+    removed_pcm = library.info(first)['pcm']
+    os.remove(first)
+    assert library.refresh() == [second]
+    assert not os.path.exists(os.path.join(cache_dir, removed_pcm))
+    assert len(decode_calls) == 3
+
+
+def test_video_creator_creates_cache_dirs_only_when_used(make_creator, tmp_path):
+    make_creator(VIDEO_SEGMENT_CACHE=True)
+    assert not (tmp_path / 'cache').exists()
@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from src import openai_tts_generator
+from src.openai_tts_generator import OpenAITTSGenerator, split_text
+
+# Testler yeniden deneme beklemesini kapatır; sahte istek gecikmesi gerçek sleep'i kullanır
+real_sleep = time.sleep
+
+
+class FakeSpeech:
+    """OpenAI istemcisinin audio.speech.with_streaming_response.create taklidi"""
+
+    def __init__(self, failures=None, delay=0.02):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.with_streaming_response = self
+
+    @staticmethod
+    def samples_for(text):
+        return len(text) * 10 + 1
+
+    def create(self, input, **kwargs):
+        speech = self
+
+        class Response:
+            def __enter__(self):
+                with speech.lock:
+                    speech.calls.append(input)
+                    speech.in_flight += 1
+                    speech.max_in_flight = max(speech.max_in_flight, speech.in_flight)
+                    failures = speech.failures.get(input, 0)
+                    if failures:
+                        speech.failures[input] = failures - 1
+                if failures:
+                    speech._leave()
+                    raise RuntimeError("geçici hata")
+                return self
+
+            def __exit__(self, *exc):
+                speech._leave()
+
+            def iter_bytes(self, size):
+                real_sleep(speech.delay)
+                # Tek sayıda bayt: parçalar örnek ortasında bölünür, son yarım örnek atılır
+                data = b'\x01\x00' * speech.samples_for(input) + b'\x07'
+                for i in range(0, len(data), 7):
+                    yield data[i:i + 7]
+
+        return Response()
+
+    def _leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def make_generator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(openai_tts_generator, 'cache_from_config', lambda: None)
+    monkeypatch.setattr(openai_tts_generator.time, 'sleep', lambda seconds: None)
+
+    def make(speech, **kwargs):
+        generator = OpenAITTSGenerator(api_key='test', requests_per_minute=0, **kwargs)
+        generator.client.audio.speech = speech
+        return generator
+    return make
+
+
+def wav_frames(path):
+    with wave.open(path, 'rb') as wav:
+        return wav.getnframes()
+
+
+def test_scenes_keep_order_and_only_failed_scene_retries(make_generator):
+    speech = FakeSpeech(failures={'Sahne iki.': 2})
+    generator = make_generator(speech, max_workers=3, max_retries=3)
+    scenes = [{'text': text} for text in ['Sahne bir.', 'Sahne iki.', 'Sahne üç.']]
+    files = generator.generate_story_audio(scenes, 'Hikaye')
+
+    assert [path.rsplit('_', 1)[1] for path in files] == ['01.wav', '02.wav', '03.wav']
+    for scene, path in zip(scenes, files):
+        assert wav_frames(path) == FakeSpeech.samples_for(scene['text'])
+    assert speech.calls.count('Sahne iki.') == 3
+    assert speech.calls.count('Sahne bir.') == 1
+
+
+def test_in_flight_requests_bounded_by_workers(make_generator):
+    speech = FakeSpeech()
+    generator = make_generator(speech, max_workers=2)
+    generator.generate_story_audio([{'text': f'Sahne {i}.'} for i in range(8)], 'Hikaye')
+    assert speech.max_in_flight == 2
+
+
+def test_split_text_respects_limit_and_sentences():
+    text = "Birinci cümle burada. İkinci cümle de var! Üçüncü mü? Son cümle."
+    assert split_text(text, 200) == [text]
+
+    parts = split_text(text, 45)
+    assert all(len(part) <= 45 for part in parts)
+    assert " ".join(parts) == text
+    assert all(part[-1] in ".!?" for part in parts)
+
+
+def test_split_text_breaks_long_sentence_at_clauses_then_words():
+    sentence = "Uzun bir cümle, virgüllerle ayrılmış, epey uzun bölümler içeriyor; " + "a" * 30 + "."
+    parts = split_text(sentence, 20)
+    assert all(len(part) <= 20 for part in parts)
+    assert "".join(parts).replace(" ", "") == sentence.replace(" ", "")
+
+
+def test_split_scene_stitched_sample_exact(make_generator, tmp_path):
+    speech = FakeSpeech()
+    generator = make_generator(speech, max_workers=4, max_chars=50, sentence_gap=0.2)
+    text = " ".join(f"Bu {i}. cümle yeterince uzun bir cümledir." for i in range(6))
+    parts = split_text(text, 50)
+    assert len(parts) > 2
+
+    [path] = generator.generate_story_audio([{'text': text}], 'Hikaye')
+    gap = int(round(0.2 * 24000))
+    part_frames = [FakeSpeech.samples_for(part) for part in parts]
+    assert wav_frames(path) == sum(part_frames) + (len(parts) - 1) * gap
+
+    with wave.open(path, 'rb') as wav:
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+    # Parçalar arasında tam gap kadar sessizlik var
+    start = part_frames[0]
+    assert not samples[start:start + gap].any()
+    assert samples[start + gap] == 1
+    assert sorted(speech.calls) == sorted(parts)
+    assert not [name for name in os.listdir(os.path.dirname(path)) if '.part' in name]
+
+
+def test_scene_and_part_requests_share_worker_bound(make_generator):
+    speech = FakeSpeech()
+    generator = make_generator(speech, max_workers=3, max_chars=50)
+    long_text = " ".join(f"Bu {i}. cümle yeterince uzun bir cümledir." for i in range(4))
+    scenes = [{'text': f"{long_text} Sahne {i}."} for i in range(4)]
+    generator.generate_story_audio(scenes, 'Hikaye')
+    assert speech.max_in_flight == 3
+
+
+def test_failed_part_leaves_no_files(make_generator, tmp_path):
+    text = " ".join(f"Bu {i}. cümle yeterince uzun bir cümledir." for i in range(3))
+    parts = split_text(text, 50)
+    speech = FakeSpeech(failures={parts[1]: 10})
+    generator = make_generator(speech, max_workers=2, max_chars=50, max_retries=1)
+    with pytest.raises(Exception):
+        generator.generate_story_audio([{'text': text}], 'Hikaye')
+    leftovers = [name for root, _, names in os.walk(str(tmp_path)) for name in names
+                 if name.endswith('.wav')]
+    assert leftovers == []
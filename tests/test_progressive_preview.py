@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from src.progressive_preview import ProgressivePreview
+
+from conftest import write_image, write_tone
+
+
+def read_playlist(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def test_playlist_grows_in_scene_order(tmp_path):
+    durations = [1.5, 2.25, 1.0]
+    preview = ProgressivePreview(str(tmp_path / 'preview'), 'Hikaye', len(durations),
+                                 width=160, height=90)
+    assert read_playlist(preview.playlist_path)[-1] == '#EXT-X-MEDIA-SEQUENCE:0'
+
+    images = [write_image(tmp_path / f'{i}.png', (60 * i, 120, 200)) for i in range(3)]
+    audios = [write_tone(tmp_path / f'{i}.wav', seconds) for i, seconds in enumerate(durations)]
+    # Sahne 2 önce hazır olsa da sahne 1 gelmeden listeye eklenmez
+    preview.add_audio(1, audios[1])
+    preview.add_image(1, images[1])
+    for future in preview._pending:
+        future.result()
+    assert not [line for line in read_playlist(preview.playlist_path) if line.startswith('#EXTINF')]
+
+    for i in (0, 2):
+        preview.add_image(i, images[i])
+        preview.add_audio(i, audios[i])
+    playlist_path = preview.close()
+
+    lines = read_playlist(playlist_path)
+    assert lines[-1] == '#EXT-X-ENDLIST'
+    assert lines.count('#EXT-X-DISCONTINUITY') == 2
+    maps = [line for line in lines if line.startswith('#EXT-X-MAP')]
+    assert maps == [f'#EXT-X-MAP:URI="scene_{i:03d}_init.mp4"' for i in (1, 2, 3)]
+
+    segments = [line for line in lines if not line.startswith('#')]
+    assert [name.split('_')[1] for name in segments] == sorted(name.split('_')[1] for name in segments)
+    for name in segments + [uri.split('"')[1] for uri in maps]:
+        assert os.path.getsize(os.path.join(preview.output_dir, name)) > 0
+    # Sahne başına oynatma listeleri birleştirildikten sonra silinir
+    assert sorted(name for name in os.listdir(preview.output_dir) if name.endswith('.m3u8')) == ['Hikaye.m3u8']
+
+    total = sum(float(line[len('#EXTINF:'):].rstrip(',')) for line in lines if line.startswith('#EXTINF'))
+    assert total == pytest.approx(sum(durations), abs=0.1)
@@ -0,0 +1,44 @@
+import time
+import threading
+
+from src.rate_limiter import RateLimiter
+
+
+def test_window_limits_requests():
+    limiter = RateLimiter(3, period=0.3)
+    start = time.monotonic()
+    stamps = []
+    for _ in range(7):
+        limiter.acquire()
+        stamps.append(time.monotonic() - start)
+    # Her 0.3 s'lik pencerede en fazla 3 istek
+    for i in range(3, 7):
+        assert stamps[i] - stamps[i - 3] >= 0.3 - 0.01
+
+
+def test_limit_holds_across_threads():
+    limiter = RateLimiter(4, period=0.3)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter.acquire()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stamps.sort()
+    for i in range(4, len(stamps)):
+        assert stamps[i] - stamps[i - 4] >= 0.3 - 0.01
+
+
+def test_zero_means_unlimited():
+    limiter = RateLimiter(0)
+    start = time.monotonic()
+    for _ in range(1000):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
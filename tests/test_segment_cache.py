@@ -0,0 +1,44 @@
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.segment_cache import SegmentCache
+
+from conftest import write_image
+
+
+def test_key_depends_on_image_content_and_parameters(tmp_path):
+    cache = SegmentCache(str(tmp_path / 'cache'))
+    image = write_image(tmp_path / 'a.png', (10, 20, 30))
+    key = cache.make_key(image, ['zoom', 48])
+
+    assert cache.make_key(image, ['zoom', 48]) == key
+    assert cache.make_key(image, ['zoom', 49]) != key
+    write_image(tmp_path / 'a.png', (10, 20, 31))
+    assert cache.make_key(image, ['zoom', 48]) != key
+
+
+def test_put_and_get(tmp_path):
+    cache = SegmentCache(str(tmp_path / 'cache'))
+    segment = tmp_path / 'segment.mp4'
+    segment.write_bytes(b'data')
+
+    assert cache.get('k') is None
+    path = cache.put('k', str(segment))
+    assert cache.get('k') == path
+    assert open(path, 'rb').read() == b'data'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parallel_render_reuses_unchanged_scenes(tmp_path):
+    renderer = FFmpegRenderer(320, 180, 24, preset='ultrafast', temp_dir=str(tmp_path / 'work'))
+    cache = SegmentCache(str(tmp_path / 'cache'))
+    scenes = [
+        {'image_path': write_image(tmp_path / f'{i}.png', (60 * i, 90, 120)), 'duration': 0.5,
+         'start_scale': 1.0, 'end_scale': 1.0 + 0.1 * (i % 2)}
+        for i in range(3)
+    ]
+    renderer.render_parallel(scenes, str(tmp_path / 'first.mp4'), segment_cache=cache)
+    assert cache.hits == 0
+
+    write_image(tmp_path / '1.png', (1, 2, 3))
+    cache.hits = cache.misses = 0
+    renderer.render_parallel(scenes, str(tmp_path / 'second.mp4'), segment_cache=cache)
+    assert (cache.hits, cache.misses) == (2, 1)
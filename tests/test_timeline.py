@@ -0,0 +1,41 @@
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.timeline import Timeline
+
+
+def make_timeline(durations, fps=24):
+    counts = FFmpegRenderer(fps=fps).frame_counts(durations)
+    scenes = [
+        {'image_path': f'{i}.png', 'audio_path': f'{i}.wav', 'zoom': 'in',
+         'start_scale': 1.0, 'end_scale': 1.3, 'crop_x': 0.25, 'text': f'Sahne {i}'}
+        for i in range(len(durations))
+    ]
+    return Timeline.from_frame_counts('Başlık', fps, 320, 180, scenes, counts, draft=True), counts
+
+
+def test_boundaries_are_contiguous_and_frame_snapped():
+    timeline, counts = make_timeline([1.93, 2.41, 1.52])
+    assert timeline.frame_counts == counts
+    assert timeline.scenes[0]['start_frame'] == 0
+    for previous, scene in zip(timeline.scenes, timeline.scenes[1:]):
+        assert scene['start_frame'] == previous['end_frame']
+        assert scene['start'] == scene['start_frame'] / 24.0
+    assert timeline.total_frames == sum(counts)
+    assert timeline.duration == sum(counts) / 24.0
+
+
+def test_scene_specs_round_trip_to_the_same_frames():
+    timeline, counts = make_timeline([0.04, 1.0 / 3, 7.77, 0.5])
+    renderer = FFmpegRenderer(fps=24)
+    assert renderer.frame_counts([spec['duration'] for spec in timeline.scene_specs()]) == counts
+
+
+def test_save_and_load(tmp_path):
+    timeline, _ = make_timeline([1.0, 2.0])
+    timeline.narration_path = '/tmp/n.wav'
+    path = timeline.save(str(tmp_path / 'a.timeline.json'))
+
+    loaded = Timeline.load(path)
+    assert loaded.to_dict() == timeline.to_dict()
+    assert loaded.draft is True
+    assert loaded.scenes[1]['text'] == 'Sahne 1'
+    assert loaded.scenes[1]['crop_x'] == 0.25
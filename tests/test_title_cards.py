@@ -0,0 +1,37 @@
+import pytest
+
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.media_probe import probe
+from src.segment_cache import SegmentCache
+from src.timeline import Timeline
+from src.title_cards import TitleCardBuilder
+
+# AAC ses izi 1024 örneklik paketlerle biter
+AAC_FRAME = 1024 / 44100.0
+
+
+def test_card_segment_is_constant_frame_rate(tmp_path):
+    renderer = FFmpegRenderer(320, 180, 24, preset='ultrafast', temp_dir=str(tmp_path))
+    builder = TitleCardBuilder(renderer, SegmentCache(str(tmp_path / 'cards')))
+    path, frames = builder.segment('credits', duration=1.5)
+
+    info = probe(path)
+    assert frames == 36
+    assert info['frame_count'] == 36
+    assert info['video_duration'] == pytest.approx(1.5, abs=1e-6)
+    # İkinci istek önbellekten gelir
+    assert builder.segment('credits', duration=1.5) == (path, frames)
+
+
+@pytest.mark.parametrize('backend', ['parallel', 'ffmpeg', 'pipe', 'moviepy'])
+def test_cards_keep_video_track_as_long_as_audio(make_creator, story_files, backend):
+    images, audios = story_files([1.93, 1.52])
+    creator = make_creator(VIDEO_TITLE_CARDS=True)
+    creator.render_backend = backend
+    path = creator.create_story_video([{}] * 2, images, audios, 'Kartlı')
+
+    timeline = Timeline.load(path.replace('.mp4', '.timeline.json'))
+    info = probe(path)
+    # Başlık ve bitiş kartları 1'er saniye
+    assert info['video_duration'] == pytest.approx(timeline.duration + 2.0, abs=1e-6)
+    assert abs(info['audio_duration'] - info['video_duration']) <= AAC_FRAME + 1e-3
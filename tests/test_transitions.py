@@ -0,0 +1,39 @@
+import re
+
+import pytest
+
+from src.ffmpeg_renderer import FFmpegRenderer
+from src.media_probe import probe
+from src.timeline import Timeline
+
+
+def test_xfade_offsets_are_centred_on_scene_boundaries(tmp_path):
+    renderer = FFmpegRenderer(320, 180, 24, temp_dir=str(tmp_path),
+                              transition='crossfade', transition_duration=0.5)
+    scenes = [{'image_path': f'{i}.png', 'duration': d} for i, d in enumerate([2.0, 1.5, 3.0])]
+    counts = renderer.frame_counts([scene['duration'] for scene in scenes])
+    args = renderer.build_command(scenes, str(tmp_path / 'out.mp4'))
+
+    script = open(args[args.index('-filter_complex_script') + 1], encoding='utf-8').read()
+    offsets = [float(value) for value in re.findall(r'offset=([\d.]+)', script)]
+    # 12 frame'lik geçiş: sınırdan 6 frame önce başlar
+    assert renderer.transition_frames(counts) == 12
+    assert offsets == pytest.approx([(48 - 6) / 24.0, (48 + 36 - 6) / 24.0])
+    assert 'xfade=transition=fade' in script
+    assert args[args.index('-t') + 1] == f"{sum(counts) / 24.0:.6f}"
+
+
+def test_transition_frames_limited_by_shortest_scene():
+    renderer = FFmpegRenderer(fps=24, transition='dip', transition_duration=2.0)
+    assert renderer.transition_frames([100, 10, 100]) == 10
+    assert renderer.transition_frames([100]) == 0
+    assert FFmpegRenderer(fps=24).transition_frames([100, 100]) == 0
+
+
+def test_transition_render_keeps_total_duration(make_creator, story_files):
+    images, audios = story_files([1.5, 1.25, 1.0])
+    creator = make_creator(VIDEO_TRANSITION='crossfade', VIDEO_TRANSITION_DURATION=0.5)
+    path = creator.create_story_video([{}] * 3, images, audios, 'Geçişli')
+
+    timeline = Timeline.load(path.replace('.mp4', '.timeline.json'))
+    assert probe(path)['video_duration'] == pytest.approx(timeline.duration, abs=1e-6)
@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+
+from src.tts_cache import TTSCache
+
+
+def synthesizer(content=b'RIFF-ses', calls=None, delay=0.0):
+    """output_path'e sabit içerik yazan sahte sentez"""
+    def synthesize(output_path):
+        if calls is not None:
+            calls.append(output_path)
+        time.sleep(delay)
+        with open(output_path, 'wb') as handle:
+            handle.write(content)
+        return output_path
+    return synthesize
+
+
+def test_key_normalizes_text_but_not_settings(tmp_path):
+    cache = TTSCache(str(tmp_path / 'tts'))
+    key = cache.make_key('openai', 'Merhaba  dünya', model='tts-1', voice='alloy')
+    assert key == cache.make_key('openai', ' Merhaba dünya\n', model='tts-1', voice='alloy')
+    # Ayrık (NFD) yazılmış "ü" de aynı anahtarı verir
+    assert key == cache.make_key('openai', 'Merhaba dünya', model='tts-1', voice='alloy')
+    assert key != cache.make_key('openai', 'Merhaba dünya', model='tts-1', voice='nova')
+    assert key != cache.make_key('gtts', 'Merhaba dünya', model='tts-1', voice='alloy')
+
+
+def test_miss_then_hit(tmp_path):
+    cache = TTSCache(str(tmp_path / 'tts'))
+    key = cache.make_key('openai', 'Sahne bir.')
+    calls = []
+    first = cache.get_or_create(key, str(tmp_path / 'a.wav'), synthesizer(calls=calls))
+    second = cache.get_or_create(key, str(tmp_path / 'b.wav'), synthesizer(calls=calls))
+
+    assert len(calls) == 1
+    assert open(first, 'rb').read() == open(second, 'rb').read() == b'RIFF-ses'
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+
+def test_concurrent_requests_synthesize_once(tmp_path):
+    cache = TTSCache(str(tmp_path / 'tts'))
+    key = cache.make_key('openai', 'Aynı sahne')
+    calls = []
+    synthesize = synthesizer(calls=calls, delay=0.2)
+    threads = [threading.Thread(target=cache.get_or_create,
+                                args=(key, str(tmp_path / f'out_{i}.wav'), synthesize))
+               for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 5
+    for i in range(6):
+        assert open(tmp_path / f'out_{i}.wav', 'rb').read() == b'RIFF-ses'
+    assert not [name for name in os.listdir(cache.cache_dir) if not name.endswith('.wav')]
+
+
+def test_least_recently_used_entries_evicted(tmp_path):
+    cache = TTSCache(str(tmp_path / 'tts'), max_bytes=250)
+    keys = [cache.make_key('openai', f'Sahne {i}') for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.get_or_create(key, str(tmp_path / f'{i}.wav'), synthesizer(b'x' * 100))
+        os.utime(cache.path_for(key), (1000 + i, 1000 + i))
+    # İlk ses yeniden kullanılınca ikincisi en eski kullanılan olur
+    cache.get_or_create(keys[0], str(tmp_path / 'again.wav'), synthesizer(b'x' * 100))
+    cache.get_or_create(keys[2], str(tmp_path / '2.wav'), synthesizer(b'x' * 100))
+
+    assert os.path.exists(cache.path_for(keys[0]))
+    assert not os.path.exists(cache.path_for(keys[1]))
+    assert os.path.exists(cache.path_for(keys[2]))
+    assert cache.stats()['evictions'] == 1
+
+
+def test_rejected_result_is_not_stored(tmp_path):
+    cache = TTSCache(str(tmp_path / 'tts'))
+    key = cache.make_key('openai', 'Yedek motor')
+    calls = []
+    for name in ('a.wav', 'b.wav'):
+        cache.get_or_create(key, str(tmp_path / name), synthesizer(calls=calls),
+                            should_store=lambda result: False)
+    assert len(calls) == 2
+    assert not os.path.exists(cache.path_for(key))